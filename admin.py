@@ -0,0 +1,153 @@
+import streamlit as st
+from timing import get_metrics, prometheus_text, dump_metrics, reset_metrics
+from sessions import get_session_stats, evict_idle_sessions, IDLE_AFTER
+from autosave import pending_autosaves, flush_autosaves
+from counters import get_totals
+from telemetry import get_telemetry_stats, event_files, flush_events
+from shared_world import get_world_stats, flush_world, WORLD_DB
+from content import get_snapshot, reload_content
+from snapshot import content_hash
+import os
+
+def display_timings():
+    """Per-section rerun timings recorded by this server process"""
+    st.subheader(":material/timer: Rerun timings")
+    st.caption("Durations of instrumented sections across every session on this server, slowest total first.")
+
+    metrics = get_metrics()
+    if not metrics:
+        st.write("*No timings recorded yet, play a few turns first...*")
+    else:
+        st.dataframe(
+            [{key: value for key, value in row.items() if key != "buckets"} for row in metrics],
+            column_config={
+                column: st.column_config.NumberColumn(format="%.1f ms")
+                for column in ("total_ms", "mean_ms", "p50_ms", "p95_ms", "max_ms")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        st.bar_chart({row["section"]: row["p95_ms"] for row in metrics}, horizontal=True, y_label="p95 (ms)")
+
+    cols = st.columns(3)
+    with cols[0]:
+        if st.button("Write dump file", use_container_width=True):
+            st.toast(f"Timings written to {dump_metrics()}")
+    with cols[1]:
+        if st.button("Reset timings", use_container_width=True):
+            reset_metrics()
+            st.rerun()
+    with cols[2]:
+        st.download_button("Download Prometheus text", prometheus_text(), "timings.prom", use_container_width=True)
+
+    with st.expander("Prometheus text"):
+        st.code(prometheus_text(), language="text")
+
+def display_sessions():
+    """Memory held by each live session and the idle eviction policy"""
+    st.subheader(":material/memory: Sessions")
+    st.caption(
+        f"Sessions idle for more than {IDLE_AFTER // 60} minutes are autosaved and their game state is "
+        "moved to disk until the player comes back. Sizes are pickled bytes."
+    )
+
+    stats = get_session_stats()
+    if not stats:
+        st.write("*No sessions yet...*")
+    else:
+        total = sum(row["total_kb"] for row in stats)
+        st.write(f"{len(stats)} sessions holding {total:.1f} KB of game state")
+        st.dataframe(
+            stats,
+            column_config={
+                column: st.column_config.NumberColumn(format="%.1f KB")
+                for column in stats[0] if column.endswith("_kb")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+    st.write(f"{len(pending_autosaves())} autosaves waiting to be written")
+    cols = st.columns(2)
+    with cols[0]:
+        if st.button("Evict idle sessions now", use_container_width=True):
+            st.toast(f"Evicted {evict_idle_sessions()} idle sessions")
+    with cols[1]:
+        if st.button("Flush saves now", use_container_width=True):
+            st.toast(f"Wrote {flush_autosaves()} queued saves")
+            st.rerun()
+
+def display_totals():
+    """Kills and chest finds of every warrior, across server processes"""
+    st.subheader(":material/leaderboard: Kills and loot")
+    st.caption("Totals over every warrior, merged from each server process about once a minute.")
+
+    kills_col, loot_col = st.columns(2)
+    for col, kind, label in ((kills_col, "kills", "enemy"), (loot_col, "loot", "loot")):
+        with col:
+            totals = get_totals(kind)
+            if not totals:
+                st.write(f"*No {kind} counted yet...*")
+            else:
+                st.dataframe(
+                    [{label: name, "count": count} for name, count in totals],
+                    hide_index=True,
+                    use_container_width=True
+                )
+
+def display_telemetry():
+    """Queue and files of the gameplay event stream"""
+    st.subheader(":material/stream: Telemetry")
+    st.caption("Gameplay events written as NDJSON by a background thread, for analysis with pandas.")
+
+    stats = get_telemetry_stats()
+    files = event_files()
+    cols = st.columns(3)
+    cols[0].metric("Queued events", stats["pending"])
+    cols[1].metric("Dropped events", stats["dropped"])
+    cols[2].metric("Event files", len(files), f"{sum(map(os.path.getsize, files)) / 2 ** 20:.1f} MB", delta_color="off")
+    if st.button("Flush events now"):
+        flush_events()
+        st.rerun()
+
+def display_world():
+    """Version and queued writes of the world shared between sessions"""
+    st.subheader(":material/public: Shared world")
+    if WORLD_DB:
+        st.caption(f"Shared with every server process through {WORLD_DB}, synced every second.")
+    else:
+        st.caption("Shared by the sessions of this server process. Set WARRIORS_WORLD_DB to share it between processes.")
+
+    stats = get_world_stats()
+    cols = st.columns(4)
+    cols[0].metric("World version", stats["version"])
+    cols[1].metric("Queued posts", stats["pending_posts"])
+    cols[2].metric("Queued boss hits", stats["pending_changes"])
+    cols[3].metric("Dropped posts", stats["dropped_posts"])
+    if st.button("Flush world now"):
+        flush_world()
+        st.rerun()
+
+def display_content():
+    """The content this server plays with, and a reload after the content files changed"""
+    st.subheader(":material/inventory_2: Content")
+    loaded, on_disk = get_snapshot()["hash"], content_hash()
+    if loaded == on_disk:
+        st.caption(f"Playing content {loaded}, the same as the content files on disk.")
+    else:
+        st.caption(f"Playing content {loaded}, but the content files on disk are now {on_disk}. Reload to use them.")
+    if st.button("Reload content"):
+        try:
+            reload_content()
+        except ValueError as error:
+            st.error(str(error))
+        else:
+            st.toast(f"Content {get_snapshot()['hash']} loaded")
+            st.rerun()
+
+display_timings()
+display_sessions()
+display_totals()
+display_telemetry()
+display_world()
+display_content()
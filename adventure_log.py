@@ -0,0 +1,76 @@
+# adventure_log.py
+# The Adventure Log as one markdown element per page instead of one
+# st.write per entry. Pages are counted from the oldest entry, so a full
+# page never changes once written: its markdown is joined once and kept in
+# session state, and a rerun only joins the entries of the newest,
+# unfinished page. That page is shown together with the newest full page,
+# so the first page never holds just a few entries after a page boundary.
+import streamlit as st
+from utils.functions import paginate
+
+LOG_PAGE_SIZE = 50
+
+def format_entries(entries):
+    """Markdown for log entries, newest first, one paragraph each like st.write"""
+    return "\n\n".join(reversed(entries))
+
+class LogPages:
+    """Rendered full pages of one log list, extended as entries are appended"""
+    def __init__(self, log):
+        self.log = log
+        self.pages = []    # markdown of each full page, oldest first
+        self.entries = []  # the entries each page was rendered from
+
+    def sync(self):
+        """Render pages filled since the last call, dropping pages whose entries were removed"""
+        log = self.log
+        # Fights and expeditions fold their entries into a summary line, so
+        # the tail of the log can be rewritten. Removing entries changes the
+        # newest full pages first, so checking stops at the first intact one.
+        while self.pages:
+            start = (len(self.pages) - 1) * LOG_PAGE_SIZE
+            current = log[start:start + LOG_PAGE_SIZE]
+            if len(current) == LOG_PAGE_SIZE and all(a is b for a, b in zip(current, self.entries[-1])):
+                break
+            self.pages.pop()
+            self.entries.pop()
+        for start in range(len(self.pages) * LOG_PAGE_SIZE, len(log) - LOG_PAGE_SIZE + 1, LOG_PAGE_SIZE):
+            entries = tuple(log[start:start + LOG_PAGE_SIZE])
+            self.entries.append(entries)
+            self.pages.append(format_entries(entries))
+
+    def page_count(self):
+        return max(1, len(self.log) // LOG_PAGE_SIZE)
+
+    def page(self, number):
+        """Markdown of a page counted from the newest, 0 holding the latest entries
+
+        Page 0 holds the unfinished entries and the newest full page, between
+        LOG_PAGE_SIZE and twice that many entries once the log is that long.
+        """
+        self.sync()
+        if number:
+            return self.pages[len(self.pages) - 1 - number]
+        unfinished = self.log[len(self.pages) * LOG_PAGE_SIZE:]
+        if not self.pages:
+            return format_entries(unfinished)
+        if not unfinished:
+            return self.pages[-1]
+        return format_entries(unfinished) + "\n\n" + self.pages[-1]
+
+def log_pages(log):
+    """The LogPages of this session's log, started over when the log list is replaced"""
+    pages = st.session_state.get("adventure_log")
+    if pages is None or pages.log is not log:
+        pages = st.session_state.adventure_log = LogPages(log)
+    return pages
+
+def display_adventure_log():
+    log = st.session_state.combat_log
+    if not log:
+        return
+    st.subheader("Adventure Log")
+    pages = log_pages(log)
+    # One control row for the pages, newest first
+    number = paginate(range(pages.page_count()), "adventure_log_page", page_size=1)[0]
+    st.markdown(pages.page(number))
@@ -1,4 +1,11 @@
+import os
 import streamlit as st
+from content import get_snapshot
+from timing import timed
+from sessions import touch_session
+from autosave import queue_autosave
+from leaderboard import record_death
+from shared_world import post
 
 ### AUTHS ###
 
@@ -14,17 +21,28 @@ shop = st.Page("shop.py", title="Shop", icon=":material/money_bag:")
 blacksmith = st.Page("blacksmith.py", title="Blacksmith", icon=":material/hardware:")
 tavern = st.Page("tavern.py", title="Tavern", icon=":material/sports_bar:")
 quests = st.Page("quest_board.py", title="Quest board", icon=":material/comment_bank:")
+hall_of_fame = st.Page("hall_of_fame.py", title="Hall of fame", icon=":material/trophy:")
+town_square = st.Page("town_square.py", title="Town square", icon=":material/forum:")
 
 # battle arenas
 forest = st.Page("forest.py", title="Forlorn Forest", icon=":material/forest:")
 mountains = st.Page("mountains.py", title="Misty Mountains", icon=":material/landscape_2:")
+world_boss = st.Page("world_boss.py", title="World boss", icon=":material/crisis_alert:")
 
-pg = st.navigation(
-        {
-            "Village": [warrior, shop, blacksmith, tavern, quests],
-            "Adventure": [forest, mountains],
-        }
-    )
+# server tools
+admin = st.Page("admin.py", title="Admin", icon=":material/monitoring:")
+economy = st.Page("economy.py", title="Economy", icon=":material/payments:")
+
+pages = {
+    "Village": [warrior, shop, blacksmith, tavern, quests, hall_of_fame, town_square],
+    "Adventure": [forest, mountains, world_boss],
+}
+# Server tools reload content, flush saves and evict sessions, so they are
+# only registered (and reachable) when the server is started with WARRIORS_ADMIN=1
+if os.environ.get("WARRIORS_ADMIN") == "1":
+    pages["Admin"] = [admin, economy]
+
+pg = st.navigation(pages)
 
 # simple navigation #
 # pg = st.navigation(
@@ -33,11 +51,17 @@ pg = st.navigation(
 #         }
 #     )
 
+# Load (or build and validate) the content snapshot once per server process
+get_snapshot()
+
 # global page settings
 st.set_page_config(page_title="Warriors - adventure game", page_icon="⚔", layout="wide")
 
 st.title(":material/swords: Warriors - An adventure game")
 
+# Register this session and bring back its state if it was evicted while idle
+touch_session()
+
 # Check for dead warrior state
 if 'warrior' in st.session_state and st.session_state.warrior is not None:
     warrior = st.session_state.warrior
@@ -45,11 +69,20 @@ if 'warrior' in st.session_state and st.session_state.warrior is not None:
         st.subheader(":material/skull: You are dead")
         st.write(f"Here lies {warrior.name}, a brave warrior who fought valiantly.")
         st.write(f"{warrior.name} made it to level {warrior.level} before meeting their fate.")
+        st.write("Their deeds are carved into the Hall of fame.")
         st.write("You can create a new warrior to continue your adventure.")
         
-        # Clear the dead warrior
+        # Remember the dead warrior in the hall of fame, then clear it
+        record_death(warrior)
+        post(f"🪦 {warrior.name} fell at level {warrior.level}: {warrior.cause_of_death or 'cause unknown'}.")
         st.session_state.warrior = None
         
         st.stop()
 
-pg.run()
\ No newline at end of file
+# Time the whole page script on every rerun
+with timed(f"page:{pg.title}"):
+    try:
+        pg.run()
+    finally:
+        # Runs on st.rerun() too, the write itself happens in the background
+        queue_autosave(st.session_state.get("warrior"), st.session_state.get("quests"))
\ No newline at end of file
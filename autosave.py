@@ -0,0 +1,81 @@
+# autosave.py
+# Autosave for changed warriors. At the end of every rerun the session's
+# warrior is checked for changes. What changed is pickled on the script
+# thread, so the record is consistent, and handed to a background thread.
+# That thread writes it once the warrior has been quiet for DEBOUNCE
+# seconds, so a burst of clicks costs one write and the script thread never
+# waits on disk. Most writes are small journal records, see save_system.py.
+import atexit
+import threading
+import time
+from save_system import encode_changes, quests_changed, merge_records, write_save, append_journal
+
+DEBOUNCE = 2.0  # seconds without changes before a save is written
+
+_lock = threading.Condition()
+_pending = {}  # warrior name -> {"snapshot", "delta", "due"}
+_thread = None
+
+def queue_autosave(warrior, quests=None):
+    """Schedule a save if the warrior or its quest log changed since they were last saved"""
+    global _thread
+    if warrior is None or warrior.health <= 0:
+        return False
+    if not warrior.needs_save() and not quests_changed(warrior.name, quests):
+        return False
+    kind, change = encode_changes(warrior, quests)
+    warrior.mark_saved()
+    if kind == "unchanged":
+        return False
+    with _lock:
+        entry = _pending.setdefault(warrior.name, {"snapshot": None, "delta": None})
+        if kind == "snapshot":
+            # A snapshot already holds every queued change
+            entry["snapshot"], entry["delta"] = change, None
+        elif entry["delta"] is not None:
+            entry["delta"] = merge_records(entry["delta"], change)
+        else:
+            entry["delta"] = change
+        # Every change pushes the write back
+        entry["due"] = time.monotonic() + DEBOUNCE
+        if _thread is None:
+            _thread = threading.Thread(target=_flush_loop, name="autosave", daemon=True)
+            _thread.start()
+        _lock.notify()
+    return True
+
+def _flush_loop():
+    while True:
+        with _lock:
+            while not _pending:
+                _lock.wait()
+            now = time.monotonic()
+            due = [name for name, entry in _pending.items() if entry["due"] <= now]
+            if not due:
+                _lock.wait(min(entry["due"] for entry in _pending.values()) - now)
+                continue
+            writes = [(name, _pending.pop(name)) for name in due]
+        for name, entry in writes:
+            write_entry(name, entry)
+
+def write_entry(name, entry):
+    if entry["snapshot"] is not None:
+        write_save(name, *entry["snapshot"])
+    if entry["delta"] is not None:
+        append_journal(name, entry["delta"])
+
+def flush_autosaves():
+    """Write every queued save now, e.g. when the server shuts down, and return how many"""
+    with _lock:
+        writes = list(_pending.items())
+        _pending.clear()
+    for name, entry in writes:
+        write_entry(name, entry)
+    return len(writes)
+
+def pending_autosaves():
+    """Names of warriors with a save waiting to be written"""
+    with _lock:
+        return sorted(_pending)
+
+atexit.register(flush_autosaves)
@@ -0,0 +1,41 @@
+"""Calibration loop that scales the benchmark budgets to the machine
+
+The budgets in benchmarks/baselines.json are times measured on the machine
+that recorded them, next to calibration_us, this loop's time on that
+machine. Every run times the loop after each repeat of a case, for as long
+as that repeat took, so the loop and the case see the same machine state,
+and scales the budget by the ratio of the best loop times. A slower or busy machine is then not reported
+as a regression. The loop is plain Python over dicts, lists and strings,
+like the game logic.
+"""
+import time
+
+def workload():
+    items = [{"name": f"item {index}", "value": index * 7 % 101} for index in range(200)]
+    by_name = {item["name"]: item for item in items}
+    total = 0
+    for item in sorted(items, key=lambda item: item["value"]):
+        total += by_name[item["name"]]["value"]
+    return total
+
+def calibration_us(duration):
+    """Time of one workload() call in microseconds, averaged over calls for about duration seconds"""
+    number = 0
+    start = time.perf_counter()
+    while True:
+        workload()
+        number += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return elapsed / number * 1e6
+
+def machine_scale(baselines, measured):
+    """How much slower this machine was than the one that recorded baselines
+
+    measured is the best calibration_us() seen while timing a case. Returns
+    1.0 and records it when baselines has no calibration yet.
+    """
+    if not baselines.get("calibration_us"):
+        baselines["calibration_us"] = round(measured, 1)
+        return 1.0
+    return measured / baselines["calibration_us"]
@@ -0,0 +1,239 @@
+"""Per-call timings for the game-logic hot paths
+
+Each case is timed outside of a Streamlit server (session state works in
+bare mode) as the best of several runs, and compared with the hot_path_us
+baselines in benchmarks/baselines.json using the shared tolerance (or at
+least min_slack_us). Baselines are scaled by the calibration loop timed
+right before each case, see calibration.py, and --update stores times
+scaled back to the recording machine. The script exits non-zero if a case
+goes over its budget.
+
+    python benchmarks/hot_paths.py              # check against the baseline
+    python benchmarks/hot_paths.py --update     # record a new baseline
+    python benchmarks/hot_paths.py -k combat    # only cases matching "combat"
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES = os.path.join(ROOT, "benchmarks", "baselines.json")
+sys.path.insert(0, ROOT)
+
+import logging
+import streamlit as st
+from calibration import calibration_us, machine_scale
+from utils import Warrior, Enemy, Item, Buff, ItemType
+from encounters import generate_encounter, handle_chest, calculate_damage, process_combat_round
+from upgrades import attempt_upgrade
+from save_system import save_warrior, load_warrior
+from content import new_quest_log, get_enemy_tables
+from quest_config import QuestStatus, active_quests
+import telemetry
+
+LARGE_INVENTORY = 500
+
+# Bare mode warns about the missing script context on every st call
+logging.disable(logging.WARNING)
+
+def new_warrior(build_type="Barbarian"):
+    warrior = Warrior("Bench", build_type)
+    warrior.gold = 10 ** 9
+    return warrior
+
+def reset_session(warrior=None):
+    """Fresh session state for one run of a case"""
+    st.session_state.warrior = warrior or new_warrior()
+    st.session_state.combat_log = []
+    st.session_state.current_enemy = None
+    st.session_state.quests = new_quest_log()
+    for quest in st.session_state.quests.values():
+        quest.status = QuestStatus.ACTIVE
+
+def fill_inventory(warrior, size=LARGE_INVENTORY):
+    """Mixed stacked consumables and unique equipment"""
+    for i in range(size):
+        if i % 2:
+            warrior.inventory.add(Item("Health Potion", 30, "health", 50, "🧪"))
+        else:
+            warrior.inventory.add(Item(f"Blade {i}", 100 + i, "strength", i % 12, "⚔️", ItemType.WEAPON, "Quality: Good"))
+
+# Every case returns (setup, run). setup() is called once per timing run and
+# its return value is passed to run(), which is called `number` times.
+def case_enemy():
+    areas = ["forest_easy", "forest_medium", "forest_hard", "mountain_easy", "mountain_medium", "mountain_hard"]
+    return None, lambda state: Enemy(random.choice(areas))
+
+def case_generate_encounter():
+    return None, lambda state: generate_encounter()
+
+def case_handle_chest():
+    combos = [(difficulty, area) for area in ("forest", "mountain") for difficulty in ("easy", "medium", "hard")]
+    def run(state):
+        st.session_state.warrior.inventory = state
+        handle_chest(*random.choice(combos))
+    def setup():
+        reset_session()
+        return st.session_state.warrior.inventory
+    return setup, run
+
+def case_calculate_damage():
+    return None, lambda state: calculate_damage(random.randint(5, 40), random.randint(0, 30))
+
+def case_combat_loop():
+    """One full fight, round after round until someone drops"""
+    def setup():
+        reset_session()
+    def run(state):
+        warrior = st.session_state.warrior
+        warrior.health = warrior.max_health
+        warrior.status = "Alive"
+        st.session_state.combat_log = []
+        st.session_state.current_enemy = Enemy("forest_medium")
+        while st.session_state.current_enemy is not None:
+            process_combat_round(random.choice(["normal_attack", "heavy_attack", "defend"]))
+    return setup, run
+
+def case_party_round():
+    """One round of 1000 party fights at once, four warriors against three wolves each"""
+    import numpy as np
+    from party_combat import Battles
+    fights = 1000
+    party = {"health": 120, "strength": 18, "armour": 10, "luck": 8}
+    enemies = {"health": 25, "strength": 6, "armour": 7}
+    def setup():
+        return (
+            {stat: np.full((fights, 4), value) for stat, value in party.items()},
+            {stat: np.full((fights, 3), value) for stat, value in enemies.items()}
+        )
+    return setup, lambda state: Battles(*state, np.random.default_rng(0)).round()
+
+def case_update_stats():
+    def setup():
+        warrior = new_warrior()
+        for i in range(50):
+            warrior.active_buffs.append(Buff(f"Buff {i}", ["strength", "luck", "armour", "health"][i % 4], 1, 10, "✨"))
+        return warrior
+    return setup, lambda warrior: warrior.update_stats()
+
+def case_attempt_upgrade():
+    def setup():
+        warrior = new_warrior()
+        fill_inventory(warrior, 50)
+        return warrior, [item for item in warrior.inventory if item.item_type == ItemType.WEAPON]
+    def run(state):
+        warrior, items = state
+        item = random.choice(items)
+        if item in warrior.inventory:
+            attempt_upgrade(item, warrior)
+    return setup, run
+
+def case_quest_dispatch():
+    """Kill-event fan-out over a quest log where every quest is active"""
+    names = [enemy["name"] for enemies in get_enemy_tables().values() for enemy in enemies]
+    def setup():
+        reset_session()
+    def run(state):
+        enemy_name = random.choice(names)
+        for quest in active_quests(st.session_state.quests):
+            quest.update_progress("enemy_killed", {"enemy_name": enemy_name})
+    return setup, run
+
+def case_save_load():
+    """save_warrior and load_warrior round-trip with a large inventory"""
+    def setup():
+        warrior = new_warrior()
+        fill_inventory(warrior)
+        return warrior
+    def run(warrior):
+        save_warrior(warrior)
+        load_warrior(f"{warrior.name}.json")
+    return setup, run
+
+CASES = {
+    "Enemy()": (case_enemy, 2000),
+    "generate_encounter": (case_generate_encounter, 5000),
+    "handle_chest": (case_handle_chest, 1000),
+    "calculate_damage": (case_calculate_damage, 20000),
+    "process_combat_round loop": (case_combat_loop, 200),
+    "party round (1000 fights)": (case_party_round, 200),
+    "update_stats (50 buffs)": (case_update_stats, 5000),
+    "attempt_upgrade": (case_attempt_upgrade, 2000),
+    "quest dispatch": (case_quest_dispatch, 2000),
+    f"save/load ({LARGE_INVENTORY} items)": (case_save_load, 20)
+}
+
+def measure(case, number, repeats):
+    """Best-of-N time per call in microseconds, and the best calibration time between the runs"""
+    setup, run = case()
+    best = None
+    calibration = None
+    for _ in range(repeats):
+        random.seed(0)
+        state = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(number):
+            run(state)
+        duration = time.perf_counter() - start
+        elapsed = duration / number * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+        elapsed = calibration_us(duration)
+        calibration = elapsed if calibration is None else min(calibration, elapsed)
+    return best, calibration
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="write the measured times as the new baseline")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("-k", dest="match", default="", help="only run cases whose name contains this text")
+    args = parser.parse_args()
+
+    baselines = {"tolerance": 0.5, "min_slack_us": 2.0, "hot_path_us": {}}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as f:
+            baselines.update(json.load(f))
+    hot_path_baselines = baselines.setdefault("hot_path_us", {})
+
+    failures = []
+    # Saves are written relative to the working directory
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        # Events are still emitted, but written next to the saves
+        telemetry.TELEMETRY_DIR = os.path.join(workdir, "telemetry")
+        for name, (case, number) in CASES.items():
+            if args.match not in name:
+                continue
+            elapsed, calibration = measure(case, number, args.repeats)
+            scale = machine_scale(baselines, calibration)
+            baseline = hot_path_baselines.get(name)
+            budget = None
+            if baseline:
+                baseline *= scale
+                budget = max(baseline * (1 + baselines["tolerance"]), baseline + baselines["min_slack_us"])
+            status = "ok"
+            if budget and elapsed > budget:
+                status = "OVER BUDGET"
+                failures.append(f"{name}: {elapsed:.1f} us > {budget:.1f} us budget")
+            budget_text = f"{budget:.1f} us" if budget else "-"
+            print(f"{name:<28} {elapsed:10.1f} us  budget {budget_text:>11}  x{scale:.2f}  {status}")
+            if args.update:
+                hot_path_baselines[name] = round(elapsed / scale, 1)
+        telemetry.flush_events()
+        telemetry.enabled = False
+        os.chdir(ROOT)
+
+    if args.update:
+        with open(BASELINES, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {os.path.relpath(BASELINES, ROOT)}")
+    elif failures:
+        print("\n".join(failures))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Cold-start import budget for every page in app.py
+
+Each page's local imports are loaded in a fresh interpreter with
+``python -X importtime`` and the time spent in this repo's modules is
+compared with benchmarks/baselines.json, allowing the configured
+tolerance (or at least min_slack_ms). Baselines are scaled by the
+calibration loop timed right before each page, see calibration.py, and
+--update stores times scaled back to the recording machine. The script
+exits non-zero if a page goes over its budget, or if a page outside the
+Adventure section pulls in encounter content.
+
+    python benchmarks/import_time.py           # check against the baseline
+    python benchmarks/import_time.py --update  # record a new baseline
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+from calibration import calibration_us, machine_scale
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES = os.path.join(ROOT, "benchmarks", "baselines.json")
+
+# Modules that only Adventure pages may load
+REGION_PAGES = {"forest.py", "mountains.py", "world_boss.py"}
+REGION_ONLY_MODULES = {"encounters", "enemy_configs", "region"}
+
+def get_pages():
+    """Page scripts registered with st.Page in app.py"""
+    with open(os.path.join(ROOT, "app.py")) as f:
+        return re.findall(r'st\.Page\("([\w/]+\.py)"', f.read())
+
+def is_local(module):
+    top = module.split(".")[0]
+    return os.path.exists(os.path.join(ROOT, f"{top}.py")) or os.path.isdir(os.path.join(ROOT, top))
+
+def get_local_imports(page):
+    """Top-level modules from this repo that a page script imports"""
+    with open(os.path.join(ROOT, page)) as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        modules.extend(name for name in names if is_local(name) and name not in modules)
+    return modules
+
+def measure(modules, repeats):
+    """Best-of-N import time in ms for the given local modules, every local module loaded and the best calibration time"""
+    code = "import streamlit\n" + "".join(f"import {module}\n" for module in modules)
+    # Deployed servers start with compiled bytecode, so compile once before timing
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, check=True)
+    best = None
+    calibration = None
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        total = 0
+        loaded = set()
+        for line in result.stderr.splitlines():
+            match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$", line)
+            if not match or not is_local(match.group(3)):
+                continue
+            loaded.add(match.group(3))
+            if len(match.group(2)) == 1:
+                total += int(match.group(1))  # top-level entries already include their children
+        best = total if best is None else min(best, total)
+        elapsed = calibration_us(total / 1e6)
+        calibration = elapsed if calibration is None else min(calibration, elapsed)
+    return best / 1000, loaded, calibration
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="write the measured times as the new baseline")
+    parser.add_argument("--repeats", type=int, default=9)
+    args = parser.parse_args()
+
+    baselines = {"tolerance": 0.5, "min_slack_ms": 2.0, "import_ms": {}}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as f:
+            baselines.update(json.load(f))
+    import_baselines = baselines["import_ms"]
+
+    failures = []
+    for page in get_pages():
+        elapsed, loaded, calibration = measure(get_local_imports(page), args.repeats)
+        scale = machine_scale(baselines, calibration)
+        baseline = import_baselines.get(page)
+        budget = None
+        if baseline:
+            baseline *= scale
+            budget = max(baseline * (1 + baselines["tolerance"]), baseline + baselines["min_slack_ms"])
+        status = "ok"
+        if budget and elapsed > budget:
+            status = "OVER BUDGET"
+            failures.append(f"{page}: {elapsed:.1f} ms > {budget:.1f} ms budget")
+        leaked = sorted(loaded & REGION_ONLY_MODULES) if page not in REGION_PAGES else []
+        if leaked:
+            status = "EAGER IMPORT"
+            failures.append(f"{page}: imports region-only modules {', '.join(leaked)}")
+        budget_text = f"{budget:.1f} ms" if budget else "-"
+        print(f"{page:<18} {elapsed:7.1f} ms  budget {budget_text:>9}  x{scale:.2f}  {status}")
+        if args.update:
+            import_baselines[page] = round(elapsed / scale, 1)
+
+    if args.update:
+        with open(BASELINES, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {os.path.relpath(BASELINES, ROOT)}")
+    elif failures:
+        print("\n".join(failures))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Headless load test with many simulated players
+
+Every simulated player is a streamlit.testing AppTest session running
+app.py. Each one creates a warrior, explores the forest and fights what it
+finds, buys a potion, tries an upgrade at the blacksmith and saves. AppTest
+is not thread-safe, so players run in parallel worker processes. Each
+worker plays its share of sessions one after another and keeps them alive
+until the end, so their memory is counted together. No network or browser
+is needed. Saves, databases, metrics and events are written to a temporary
+directory that is removed afterwards.
+
+The report lists per-rerun latency percentiles by step, the pickled size of
+each session's state, and the growth of each worker's peak RSS per session.
+
+    python benchmarks/load_test.py --sessions 20 --concurrency 4 --turns 30
+"""
+import argparse
+import concurrent.futures
+import json
+import logging
+import os
+import pickle
+import random
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+SAVE_PREFIX = "loadtest-"
+STATE_KEYS = ["warrior", "quests", "combat_log", "current_enemy", "auto_battle_log", "expedition_log"]
+
+class Session:
+    def __init__(self, index, turns, timeout):
+        self.name = f"{SAVE_PREFIX}{index}"
+        self.turns = turns
+        self.random = random.Random(index)
+        self.app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+        self.latencies = []  # (step, ms)
+        self.errors = []
+
+    def rerun(self, step, element=None):
+        """Run the script once, optionally after interacting with an element"""
+        start = time.perf_counter()
+        if element is None:
+            self.app.run()
+        else:
+            element.run()
+        self.latencies.append((step, (time.perf_counter() - start) * 1000))
+        self.errors.extend(f"{step}: {exception.message}" for exception in self.app.exception)
+
+    def button(self, text):
+        """First button whose label contains text, or None"""
+        return next((button for button in self.app.button if text in button.label), None)
+
+    def alive(self):
+        warrior = self.app.session_state["warrior"] if "warrior" in self.app.session_state else None
+        return warrior is not None and warrior.health > 0
+
+    def play(self):
+        self.rerun("load")
+        self.app.text_input[0].input(self.name)
+        self.app.selectbox[0].select(self.random.choice(["Barbarian", "Rogue", "Knight"]))
+        self.rerun("create warrior", self.button("Create Warrior").click())
+
+        self.app.switch_page("forest.py")
+        self.rerun("forest")
+        for _ in range(self.turns):
+            if not self.alive():
+                return
+            attack = self.button("Attack")
+            if attack is not None:
+                self.rerun("fight", attack.click())
+            else:
+                areas = [button for button in self.app.button if "(Easy)" in button.label or "(Medium)" in button.label]
+                self.rerun("explore", self.random.choice(areas).click())
+
+        if not self.alive():
+            return
+        self.app.switch_page("shop.py")
+        self.rerun("shop")
+        buy_buttons = [button for button in self.app.button if button.label == "Buy"]
+        self.rerun("buy", buy_buttons[-1].click())  # potions are the last tab
+
+        self.app.switch_page("blacksmith.py")
+        self.rerun("blacksmith")
+        upgrade = self.button("Upgrade")
+        if upgrade is not None:
+            self.rerun("upgrade", upgrade.click())
+
+        self.rerun("save", self.button("Save Game").click())
+
+    def state_bytes(self):
+        """Pickled size of the game state this session keeps in memory"""
+        state = {key: self.app.session_state[key] for key in STATE_KEYS if key in self.app.session_state}
+        return len(pickle.dumps(state))
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+def run_worker(indices, turns, timeout, workdir):
+    """Play a share of the sessions in this process and return their results"""
+    # Pages load images and saves relative to the working directory, which
+    # links back to the real images so everything written stays in workdir
+    os.chdir(workdir)
+    import telemetry
+    import timing
+    telemetry.TELEMETRY_DIR = os.path.join(workdir, "telemetry")
+    timing.METRICS_DIR = os.path.join(workdir, "metrics")
+    logging.disable(logging.WARNING)
+
+    # Warm the content snapshot and page imports so the first player is not penalised
+    Session(-1, 0, timeout).rerun("warm-up")
+
+    rss_before = peak_rss_mb()
+    sessions = [Session(index, turns, timeout) for index in indices]
+    for session in sessions:
+        try:
+            session.play()
+        except Exception as error:
+            session.errors.append(f"{type(error).__name__}: {error}")
+    return {
+        "latencies": [latency for session in sessions for latency in session.latencies],
+        "state_kb": [session.state_bytes() / 1024 for session in sessions],
+        "rss_growth_mb": peak_rss_mb() - rss_before,
+        "errors": [error for session in sessions for error in session.errors]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="simulated players in total")
+    parser.add_argument("--concurrency", type=int, default=4, help="worker processes playing at the same time")
+    parser.add_argument("--turns", type=int, default=30, help="clicks in the forest per player")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.symlink(os.path.join(ROOT, "images"), os.path.join(workdir, "images"))
+        os.makedirs(os.path.join(workdir, "saves"))
+        start = time.perf_counter()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(
+                run_worker,
+                [range(worker, args.sessions, args.concurrency) for worker in range(args.concurrency)],
+                [args.turns] * args.concurrency,
+                [args.timeout] * args.concurrency,
+                [workdir] * args.concurrency
+            ))
+        elapsed = time.perf_counter() - start
+
+    latencies = [latency for result in results for latency in result["latencies"]]
+    steps = {}
+    for step, ms in latencies:
+        steps.setdefault(step, []).append(ms)
+    report = {
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "reruns": len(latencies),
+        "reruns_per_second": len(latencies) / elapsed,
+        "steps": {
+            step: {
+                "count": len(values),
+                "p50_ms": percentile(values, 0.5),
+                "p90_ms": percentile(values, 0.9),
+                "p99_ms": percentile(values, 0.99),
+                "max_ms": max(values)
+            }
+            for step, values in [("all", [ms for step, ms in latencies])] + list(steps.items())
+        },
+        "state_kb": [kb for result in results for kb in result["state_kb"]],
+        "rss_growth_mb_per_session": sum(result["rss_growth_mb"] for result in results) / args.sessions,
+        "errors": [error for result in results for error in result["errors"]]
+    }
+
+    print(f"{args.sessions} sessions, {args.concurrency} at a time: "
+          f"{report['reruns']} reruns in {elapsed:.1f} s ({report['reruns_per_second']:.1f}/s)")
+    print(f"{'step':<16} {'count':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for step, row in report["steps"].items():
+        print(f"{step:<16} {row['count']:>6} " + " ".join(
+            f"{row[key]:6.1f} ms" for key in ("p50_ms", "p90_ms", "p99_ms", "max_ms")
+        ))
+    state_kb = report["state_kb"]
+    print(f"session state: mean {sum(state_kb) / len(state_kb):.1f} KB, max {max(state_kb):.1f} KB")
+    print(f"peak RSS growth: {report['rss_growth_mb_per_session']:.2f} MB per session")
+    if report["errors"]:
+        print(f"{len(report['errors'])} errors, first: {report['errors'][0]}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if report["errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
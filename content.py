@@ -0,0 +1,86 @@
+# content.py
+# Shared, read-only views of the game content, built once per server
+# process from the content snapshot.
+import functools
+from types import MappingProxyType
+import streamlit as st
+from snapshot import load_snapshot
+from quest_config import QuestLog
+
+def freeze(value):
+    """Return a read-only view of nested config dicts and lists"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+@st.cache_resource
+def get_snapshot():
+    """Content snapshot, loaded once per server process"""
+    return load_snapshot()
+
+@st.cache_resource
+def get_shop_stock():
+    """Shop stock by category"""
+    return MappingProxyType({
+        category: tuple(items) for category, items in get_snapshot()["shop_stock"].items()
+    })
+
+@st.cache_resource
+def get_tavern_menu():
+    """Tavern food and drink"""
+    return tuple(get_snapshot()["tavern_items"])
+
+@st.cache_resource
+def get_region_config(name):
+    """Read-only region config, e.g. get_region_config("forest")"""
+    return freeze(get_snapshot()["regions"][name])
+
+@st.cache_resource
+def get_quest_catalog():
+    """Quest definitions keyed by quest id"""
+    return MappingProxyType(get_snapshot()["quests"])
+
+# Gameplay reads the next two on every encounter, where the ~13 us of an
+# st.cache_resource lookup would cost more than the encounter itself
+@functools.lru_cache(maxsize=None)
+def get_enemy_tables():
+    """Enemy spawn tables keyed by area id, e.g. "forest_easy" """
+    return freeze(get_snapshot()["enemies"])
+
+@functools.lru_cache(maxsize=None)
+def get_encounter_tables():
+    """Encounter weights, difficulty multipliers and the equipment, loot, blessing and trap tables by area"""
+    snapshot = get_snapshot()
+    return freeze({
+        key: snapshot[key]
+        for key in ("encounter_weights", "difficulty_multiplier", "weapons", "armors", "accessories", "loot_tables",
+                    "blessings", "traps")
+    })
+
+@st.cache_resource
+def get_world_bosses():
+    """World boss configs keyed by name"""
+    return freeze(get_snapshot()["world_bosses"])
+
+def new_quest_log(records=()):
+    """Per-warrior quest log over the catalog, optionally from saved records"""
+    return QuestLog(records)
+
+def reload_content():
+    """Drop every cached view, so the next read loads the snapshot of the content files on disk
+
+    Nothing is re-imported here: snapshots are built in a fresh interpreter
+    (see snapshot.py), and live sessions keep their quest classes and enums.
+    Raises ValueError, and keeps serving the old content, if the new content
+    does not validate.
+    """
+    load_snapshot()  # build and validate before dropping anything
+    for cached in (get_snapshot, get_shop_stock, get_tavern_menu, get_region_config, get_quest_catalog,
+                   get_world_bosses):
+        cached.clear()
+    get_enemy_tables.cache_clear()
+    get_encounter_tables.cache_clear()
+    import shared_world  # The shared world keeps its own copy of the stock limits and bosses
+    shared_world.reload_config()
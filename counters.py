@@ -0,0 +1,162 @@
+# counters.py
+# Kill and loot counters. Every warrior keeps a compact array of counts per
+# kind, indexed by ids from a registry built from the content snapshot:
+# kills per enemy and drops per chest loot entry. Counts are pickled by name,
+# so saves stay valid when content is added or reordered. Counting also adds
+# to process-wide arrays, which a background thread merges into a SQLite
+# table shared by every server process every MERGE_INTERVAL seconds, so
+# counting never waits on disk. Like snapshot.py this module does not
+# import streamlit.
+import atexit
+import functools
+import os
+import threading
+import time
+from array import array
+from snapshot import load_snapshot
+
+STATS_DB = os.path.join("saves", "stats.db")
+MERGE_INTERVAL = 60  # seconds
+
+@functools.lru_cache(maxsize=None)
+def registry(kind):
+    """Names counted for a kind, in id order: enemies for kills, loot entries for loot"""
+    snapshot = load_snapshot()
+    if kind == "kills":
+        names = [enemy["name"] for enemies in snapshot["enemies"].values() for enemy in enemies]
+    else:
+        names = [loot_name(loot) for table in snapshot["loot_tables"].values() for loot in table]
+    return tuple(dict.fromkeys(names))
+
+@functools.lru_cache(maxsize=None)
+def registry_ids(kind):
+    return {name: index for index, name in enumerate(registry(kind))}
+
+def loot_name(loot):
+    """Registry name of a loot table entry, e.g. "Leafy Health Potion" or "weapon" """
+    return loot.get("name", loot["item"])
+
+class Counts:
+    """Counts of one kind indexed by registry id, e.g. kills per enemy"""
+    def __init__(self, kind, counts=None):
+        self.kind = kind
+        self._ids = registry_ids(kind)
+        self._values = array("L", [0]) * len(self._ids)
+        self._other = {}  # names no longer in the content, kept so nothing is lost
+        for name, count in (counts or {}).items():
+            self.add(name, count)
+
+    def add(self, name, count=1):
+        index = self._ids.get(name)
+        if index is None:
+            self._other[name] = self._other.get(name, 0) + count
+        else:
+            self._values[index] += count
+
+    def __getitem__(self, name):
+        index = self._ids.get(name)
+        return self._values[index] if index is not None else self._other.get(name, 0)
+
+    def items(self):
+        """(name, count) of everything counted at least once"""
+        names = registry(self.kind)
+        counted = [(names[index], count) for index, count in enumerate(self._values) if count]
+        return counted + list(self._other.items())
+
+    def total(self):
+        return sum(self._values) + sum(self._other.values())
+
+    def __reduce__(self):
+        return Counts, (self.kind, dict(self.items()))
+
+_lock = threading.Lock()
+_pending = {}  # kind -> array of counts not merged into STATS_DB yet
+_thread = None
+
+def count_kill(warrior, enemy_name):
+    """Count an enemy killed by a warrior"""
+    warrior.kill_counts.add(enemy_name)
+    warrior.dirty = True  # counters change in place, see Warrior.needs_save
+    add_total("kills", enemy_name)
+
+def count_loot(warrior, loot):
+    """Count a loot table entry found by a warrior"""
+    warrior.loot_counts.add(loot_name(loot))
+    warrior.dirty = True
+    add_total("loot", loot_name(loot))
+
+def add_total(kind, name, amount=1):
+    """Add to this process's totals, merged into STATS_DB by a background thread"""
+    global _thread
+    ids = registry_ids(kind)
+    with _lock:
+        pending = _pending.get(kind)
+        if pending is None:
+            pending = _pending[kind] = array("L", [0]) * len(ids)
+        if name in ids:
+            pending[ids[name]] += amount
+        if _thread is None:
+            _thread = threading.Thread(target=_merge_loop, name="counters", daemon=True)
+            _thread.start()
+
+def _merge_loop():
+    while True:
+        time.sleep(MERGE_INTERVAL)
+        try:
+            merge_counts()
+        except Exception:
+            pass  # database busy or gone, the counts wait for the next merge
+
+def connect():
+    import sqlite3  # Only loaded once totals are merged or read
+    os.makedirs(os.path.dirname(STATS_DB), exist_ok=True)
+    connection = sqlite3.connect(STATS_DB)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS totals (kind TEXT, name TEXT, count INTEGER NOT NULL, PRIMARY KEY (kind, name))"
+    )
+    return connection
+
+def merge_counts():
+    """Add the counts gathered by this process to the shared totals"""
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+    rows = [
+        (kind, registry(kind)[index], amount)
+        for kind, values in pending.items()
+        for index, amount in enumerate(values) if amount
+    ]
+    if not rows:
+        return
+    try:
+        connection = connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO totals (kind, name, count) VALUES (?, ?, ?) "
+                    "ON CONFLICT (kind, name) DO UPDATE SET count = count + excluded.count",
+                    rows
+                )
+        finally:
+            connection.close()
+    except Exception:
+        # Keep the counts for the next merge
+        with _lock:
+            for kind, values in pending.items():
+                current = _pending.setdefault(kind, array("L", [0]) * len(values))
+                for index, amount in enumerate(values):
+                    current[index] += amount
+        raise
+
+def get_totals(kind):
+    """Counts of one kind over every warrior on every server process, largest first"""
+    merge_counts()
+    connection = connect()
+    try:
+        return connection.execute(
+            "SELECT name, count FROM totals WHERE kind = ? ORDER BY count DESC", (kind,)
+        ).fetchall()
+    finally:
+        connection.close()
+
+atexit.register(merge_counts)
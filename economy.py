@@ -0,0 +1,34 @@
+import os
+import streamlit as st
+from telemetry import event_files, flush_events
+from economy_report import load_gold_events, gold_flows, flows_per_warrior
+
+@st.cache_data(show_spinner="Reading gold events...")
+def cached_gold_flows(files):
+    """Gold flows for a set of event files, keyed by their paths, sizes and mtimes"""
+    return gold_flows(load_gold_events([path for path, size, mtime in files]))
+
+def display_gold_flows():
+    """Gold gained and spent per level from the telemetry stream"""
+    st.subheader(":material/payments: Gold economy")
+    st.caption("Gold gained and spent per warrior level, by source, from the gold events in the telemetry files.")
+
+    if st.button("Flush events now"):
+        flush_events()
+    # Files that grew since the last run get a new key, the rest come from the cache
+    files = tuple((path, os.path.getsize(path), os.path.getmtime(path)) for path in event_files())
+    flows = cached_gold_flows(files)
+    if flows.empty:
+        st.write("*No gold has changed hands yet...*")
+        return
+
+    per_warrior = st.toggle("Per warrior at each level", value=True)
+    table = flows_per_warrior(flows) if per_warrior else flows
+    st.line_chart(table[["inflow", "outflow", "net"]], x_label="level", y_label="gold")
+    st.bar_chart(
+        table[[column for column in table if column.endswith(" in") or column.endswith(" out")]],
+        x_label="level", y_label="gold"
+    )
+    st.dataframe(table.round(1), use_container_width=True)
+
+display_gold_flows()
@@ -0,0 +1,356 @@
+# encounter_configs.py
+from utils import ItemType
+
+ENCOUNTER_WEIGHTS = [
+    {"type": "enemy", "weight": 60},
+    {"type": "chest", "weight": 25},
+    {"type": "blessing", "weight": 10},
+    {"type": "trap", "weight": 5}
+]
+
+DIFFICULTY_MULTIPLIER = {"easy": 1, "medium": 1.5, "hard": 2}
+
+WEAPONS = {
+    "forest": [
+        {
+            "name": "Wooden Sword",
+            "cost": 50,
+            "base_effect": 2,
+            "variance": 1,  # Can vary by ±1
+            "difficulty": "easy"
+        },
+        {
+            "name": "Iron Sword",
+            "cost": 100,
+            "base_effect": 4,
+            "variance": 2,  # Can vary by ±2
+            "difficulty": "easy"
+        },
+        {
+            "name": "Steel Sword",
+            "cost": 200,
+            "base_effect": 6,
+            "variance": 3,  # Can vary by ±3
+            "difficulty": "medium"
+        },
+        {
+            "name": "Enchanted Blade",
+            "cost": 400,
+            "base_effect": 8,
+            "variance": 4,  # Can vary by ±4
+            "difficulty": "medium"
+        },
+        {
+            "name": "Ancient Elven Sword",
+            "cost": 800,
+            "base_effect": 12,
+            "variance": 5,  # Can vary by ±5
+            "difficulty": "hard"
+        }
+    ],
+    "mountain": [
+        {
+            "name": "Stone Axe",
+            "cost": 150,
+            "base_effect": 5,
+            "variance": 2,
+            "difficulty": "easy"
+        },
+        {
+            "name": "Frost Blade",
+            "cost": 300,
+            "base_effect": 7,
+            "variance": 3,
+            "difficulty": "medium"
+        },
+        {
+            "name": "Giant's Hammer",
+            "cost": 600,
+            "base_effect": 10,
+            "variance": 4,
+            "difficulty": "hard"
+        }
+    ]
+}
+
+ARMORS = {
+    "forest": [
+        {
+            "name": "Leather Armor",
+            "cost": 80,
+            "base_effect": 5,
+            "variance": 2,
+            "difficulty": "easy"
+        },
+        {
+            "name": "Studded Leather",
+            "cost": 150,
+            "base_effect": 8,
+            "variance": 3,
+            "difficulty": "easy"
+        },
+        {
+            "name": "Chain Mail",
+            "cost": 300,
+            "base_effect": 12,
+            "variance": 4,
+            "difficulty": "medium"
+        },
+        {
+            "name": "Elven Mail",
+            "cost": 600,
+            "base_effect": 15,
+            "variance": 5,
+            "difficulty": "medium"
+        },
+        {
+            "name": "Ancient Treant Bark",
+            "cost": 1000,
+            "base_effect": 20,
+            "variance": 6,
+            "difficulty": "hard"
+        }
+    ],
+    "mountain": [
+        {
+            "name": "Fur Armor",
+            "cost": 200,
+            "base_effect": 10,
+            "variance": 3,
+            "difficulty": "easy"
+        },
+        {
+            "name": "Ice-Forged Mail",
+            "cost": 400,
+            "base_effect": 15,
+            "variance": 4,
+            "difficulty": "medium"
+        },
+        {
+            "name": "Frost Giant Hide",
+            "cost": 800,
+            "base_effect": 25,
+            "variance": 6,
+            "difficulty": "hard"
+        }
+    ]
+}
+
+ACCESSORIES = {
+    "forest": [
+        # Luck-based accessories
+        {
+            "name": "Lucky Charm",
+            "cost": 100,
+            "base_effect": 3,
+            "variance": 1,
+            "effect_type": "luck",
+            "difficulty": "easy"
+        },
+        {
+            "name": "Forest Talisman",
+            "cost": 400,
+            "base_effect": 5,
+            "variance": 2,
+            "effect_type": "luck",
+            "difficulty": "medium"
+        },
+        # Strength-based accessories
+        {
+            "name": "Warrior's Ring",
+            "cost": 200,
+            "base_effect": 3,
+            "variance": 1,
+            "effect_type": "strength",
+            "difficulty": "easy"
+        },
+        {
+            "name": "Bear Tooth Necklace",
+            "cost": 500,
+            "base_effect": 6,
+            "variance": 2,
+            "effect_type": "strength",
+            "difficulty": "medium"
+        },
+        # Armor-based accessories
+        {
+            "name": "Barkskin Amulet",
+            "cost": 300,
+            "base_effect": 4,
+            "variance": 2,
+            "effect_type": "armour",
+            "difficulty": "easy"
+        },
+        {
+            "name": "Ancient Medallion",
+            "cost": 600,
+            "base_effect": 8,
+            "variance": 3,
+            "effect_type": "armour",
+            "difficulty": "medium"
+        },
+        # Mixed high-level accessories
+        {
+            "name": "Dragon Heart Pendant",
+            "cost": 1000,
+            "base_effect": 10,
+            "variance": 4,
+            "effect_type": "strength",
+            "difficulty": "hard"
+        }
+    ],
+    "mountain": [
+        {
+            "name": "Frost Ring",
+            "cost": 200,
+            "base_effect": 5,
+            "variance": 2,
+            "effect_type": "luck",
+            "difficulty": "easy"
+        },
+        {
+            "name": "Giant's Belt",
+            "cost": 400,
+            "base_effect": 8,
+            "variance": 3,
+            "effect_type": "strength",
+            "difficulty": "medium"
+        },
+        {
+            "name": "Ice Heart Amulet",
+            "cost": 800,
+            "base_effect": 12,
+            "variance": 4,
+            "effect_type": "armour",
+            "difficulty": "hard"
+        }
+    ]
+}
+
+LOOT_TABLES = {
+    "forest": [
+        {"item": "gold", "min": 10, "max": 50, "weight": 40},
+        # Consumables
+        {
+            "item": "health_potion",
+            "name": "Leafy Health Potion",
+            "cost": 30,
+            "effect_type": "health",
+            "effect_value": 50,
+            "icon": "🧪",
+            "type": ItemType.CONSUMABLE,
+            "weight": 20
+        },
+        {
+            "item": "strength_potion",
+            "name": "Oak Strength Potion",
+            "cost": 50,
+            "effect_type": "strength",
+            "effect_value": 2,
+            "icon": "💪",
+            "type": ItemType.CONSUMABLE,
+            "weight": 15
+        },
+        # Equipment
+        {"item": "weapon", "weight": 10},
+        {"item": "armor", "weight": 10},
+        {"item": "accessory", "weight": 5}
+    ],
+    "mountain": [
+        {"item": "gold", "min": 30, "max": 100, "weight": 40},
+        # Mountain Consumables
+        {
+            "item": "mountain_brew",
+            "name": "Mountain Brew",
+            "cost": 60,
+            "effect_type": "health",
+            "effect_value": 80,
+            "icon": "🧪",
+            "type": ItemType.CONSUMABLE,
+            "weight": 20
+        },
+        {
+            "item": "giant_strength",
+            "name": "Giant's Strength Potion",
+            "cost": 80,
+            "effect_type": "strength",
+            "effect_value": 4,
+            "icon": "💪",
+            "type": ItemType.CONSUMABLE,
+            "weight": 15
+        },
+        # Equipment
+        {"item": "weapon", "weight": 10},
+        {"item": "armor", "weight": 10},
+        {"item": "accessory", "weight": 5}
+    ]
+}
+
+BLESSINGS = {
+    "forest": [
+        {
+            "name": "Divine Healing",
+            "type": "heal",
+            "value": 30,
+            "duration": None,  # Instant effect
+            "text": ":sparkling_heart: A spirit of the forest shines a divine light and heals your wounds",
+            "icon": ":sparkling_heart:"
+        },
+        {
+            "name": "Warrior's Blessing",
+            "type": "strength",
+            "value": 3,
+            "duration": 5,  # Lasts 5 combat rounds
+            "text": ":muscle: A tree ent fills your body with renewed strength, you feel temporarily stronger",
+            "icon": ":muscle:"
+        },
+        {
+            "name": "Fortune's Favor",
+            "type": "luck",
+            "value": 4,
+            "duration": 3,  # Lasts 3 combat rounds
+            "text": ":four_leaf_clover: Fortune smiles upon you",
+            "icon": ":four_leaf_clover:"
+        }
+    ],
+    "mountain": [
+        {
+            "name": "Mountain's Strength",
+            "type": "heal",
+            "value": 50,  # Stronger healing in mountains
+            "duration": None,
+            "text": ":material/mountain: The mountain's ancient power restores you",
+            "icon": ":material/heart-plus:"
+        },
+        {
+            "name": "Giant's Might",
+            "type": "strength",
+            "value": 5,
+            "duration": 3,
+            "text": ":material/arm-flex: The spirit of the mountain giants fills you",
+            "icon": ":material/arm-flex:"
+        },
+        {
+            "name": "Ice Shield",
+            "type": "armour",
+            "value": 8,
+            "duration": 4,
+            "text": ":material/snowflake: A shield of ice forms around you",
+            "icon": ":material/shield:"
+        }
+    ]
+}
+
+TRAPS = {
+    "forest": [
+        {"damage": 10, "text": "You trigger a tripwire and take damage", "icon": ":spider_web:"},
+        {"damage": 15, "text": "Poisonous spores burst from a mushroom", "icon": ":mushroom:"},
+        {"damage": 20, "text": "A hidden pit opens beneath your feet", "icon": ":hole:"}
+    ],
+    "mountain": [
+        {"damage": 15, "text": "You slip on ice and fall", "icon": ":material/snowflake:"},
+        {"damage": 20, "text": "An avalanche catches you", "icon": ":material/weather-snowy-heavy:"},
+        {"damage": 25, "text": "You fall into a deep crevasse", "icon": ":material/crack:"},
+        {"damage": 30, "text": "Freezing winds sap your strength", "icon": ":material/weather-windy:"}
+    ]
+}
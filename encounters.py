@@ -1,7 +1,13 @@
 # encounters.py
 import streamlit as st
 import random
-from utils import area, Item, Enemy, Buff, ItemType
+from utils import Item, Buff, ItemType
+from timing import timed
+from counters import count_kill, count_loot
+from telemetry import emit, emit_gold
+from shared_world import post
+from quest_config import active_quests
+from content import get_encounter_tables
 
 def calculate_damage(attacker_strength, defender_armor):
     """Calculate damage considering strength and armor"""
@@ -35,12 +41,7 @@ def dodge_attack(luck, attacker_strength=0):
 
 def generate_encounter():
     """Generate a random encounter type"""
-    encounters = [
-        {"type": "enemy", "weight": 60},
-        {"type": "chest", "weight": 25},
-        {"type": "blessing", "weight": 10},
-        {"type": "trap", "weight": 5}
-    ]
+    encounters = get_encounter_tables()["encounter_weights"]
     
     total_weight = sum(e["weight"] for e in encounters)
     roll = random.randint(1, total_weight)
@@ -49,74 +50,14 @@ def generate_encounter():
     for encounter in encounters:
         current_weight += encounter["weight"]
         if roll <= current_weight:
+            emit("encounter", type=encounter["type"])
             return encounter["type"]
         
 def get_weapon(area, difficulty):
     """Get area and difficulty appropriate weapon with random stat variation"""
-    multiplier = {"easy": 1, "medium": 1.5, "hard": 2}
-    
-    if area == "forest":
-        weapons = [
-            {
-                "name": "Wooden Sword",
-                "cost": 50,
-                "base_effect": 2,
-                "variance": 1,  # Can vary by ±1
-                "difficulty": "easy"
-            },
-            {
-                "name": "Iron Sword",
-                "cost": 100,
-                "base_effect": 4,
-                "variance": 2,  # Can vary by ±2
-                "difficulty": "easy"
-            },
-            {
-                "name": "Steel Sword",
-                "cost": 200,
-                "base_effect": 6,
-                "variance": 3,  # Can vary by ±3
-                "difficulty": "medium"
-            },
-            {
-                "name": "Enchanted Blade",
-                "cost": 400,
-                "base_effect": 8,
-                "variance": 4,  # Can vary by ±4
-                "difficulty": "medium"
-            },
-            {
-                "name": "Ancient Elven Sword",
-                "cost": 800,
-                "base_effect": 12,
-                "variance": 5,  # Can vary by ±5
-                "difficulty": "hard"
-            }
-        ]
-    elif area == "mountain":
-        weapons = [
-            {
-                "name": "Stone Axe",
-                "cost": 150,
-                "base_effect": 5,
-                "variance": 2,
-                "difficulty": "easy"
-            },
-            {
-                "name": "Frost Blade",
-                "cost": 300,
-                "base_effect": 7,
-                "variance": 3,
-                "difficulty": "medium"
-            },
-            {
-                "name": "Giant's Hammer",
-                "cost": 600,
-                "base_effect": 10,
-                "variance": 4,
-                "difficulty": "hard"
-            }
-        ]
+    tables = get_encounter_tables()
+    multiplier = tables["difficulty_multiplier"]
+    weapons = tables["weapons"][area]
     
     # Filter weapons by difficulty
     appropriate_weapons = [w for w in weapons if w["difficulty"] == difficulty]
@@ -174,70 +115,10 @@ def get_weapon(area, difficulty):
 
 def get_armor(area, difficulty):
     """Get area and difficulty appropriate armor with random stat variation"""
-    multiplier = {"easy": 1, "medium": 1.5, "hard": 2}
-    
-    if area == "forest":
-        armors = [
-            {
-                "name": "Leather Armor",
-                "cost": 80,
-                "base_effect": 5,
-                "variance": 2,
-                "difficulty": "easy"
-            },
-            {
-                "name": "Studded Leather",
-                "cost": 150,
-                "base_effect": 8,
-                "variance": 3,
-                "difficulty": "easy"
-            },
-            {
-                "name": "Chain Mail",
-                "cost": 300,
-                "base_effect": 12,
-                "variance": 4,
-                "difficulty": "medium"
-            },
-            {
-                "name": "Elven Mail",
-                "cost": 600,
-                "base_effect": 15,
-                "variance": 5,
-                "difficulty": "medium"
-            },
-            {
-                "name": "Ancient Treant Bark",
-                "cost": 1000,
-                "base_effect": 20,
-                "variance": 6,
-                "difficulty": "hard"
-            }
-        ]
-    elif area == "mountain":
-        armors = [
-            {
-                "name": "Fur Armor",
-                "cost": 200,
-                "base_effect": 10,
-                "variance": 3,
-                "difficulty": "easy"
-            },
-            {
-                "name": "Ice-Forged Mail",
-                "cost": 400,
-                "base_effect": 15,
-                "variance": 4,
-                "difficulty": "medium"
-            },
-            {
-                "name": "Frost Giant Hide",
-                "cost": 800,
-                "base_effect": 25,
-                "variance": 6,
-                "difficulty": "hard"
-            }
-        ]
+    tables = get_encounter_tables()
+    multiplier = tables["difficulty_multiplier"]
+    
+    armors = tables["armors"][area]
     # Filter armors by difficulty
     appropriate_armors = [a for a in armors if a["difficulty"] == difficulty]
     if not appropriate_armors:
@@ -258,98 +139,10 @@ def get_armor(area, difficulty):
 
 def get_accessory(area, difficulty):
     """Get area and difficulty appropriate accessory with random stat variation"""
-    multiplier = {"easy": 1, "medium": 1.5, "hard": 2}
-    
-    if area == "forest":
-        accessories = [
-            # Luck-based accessories
-            {
-                "name": "Lucky Charm",
-                "cost": 100,
-                "base_effect": 3,
-                "variance": 1,
-                "effect_type": "luck",
-                "difficulty": "easy"
-            },
-            {
-                "name": "Forest Talisman",
-                "cost": 400,
-                "base_effect": 5,
-                "variance": 2,
-                "effect_type": "luck",
-                "difficulty": "medium"
-            },
-            # Strength-based accessories
-            {
-                "name": "Warrior's Ring",
-                "cost": 200,
-                "base_effect": 3,
-                "variance": 1,
-                "effect_type": "strength",
-                "difficulty": "easy"
-            },
-            {
-                "name": "Bear Tooth Necklace",
-                "cost": 500,
-                "base_effect": 6,
-                "variance": 2,
-                "effect_type": "strength",
-                "difficulty": "medium"
-            },
-            # Armor-based accessories
-            {
-                "name": "Barkskin Amulet",
-                "cost": 300,
-                "base_effect": 4,
-                "variance": 2,
-                "effect_type": "armour",
-                "difficulty": "easy"
-            },
-            {
-                "name": "Ancient Medallion",
-                "cost": 600,
-                "base_effect": 8,
-                "variance": 3,
-                "effect_type": "armour",
-                "difficulty": "medium"
-            },
-            # Mixed high-level accessories
-            {
-                "name": "Dragon Heart Pendant",
-                "cost": 1000,
-                "base_effect": 10,
-                "variance": 4,
-                "effect_type": "strength",
-                "difficulty": "hard"
-            }
-        ]
-    elif area == "mountain":
-        accessories = [
-            {
-                "name": "Frost Ring",
-                "cost": 200,
-                "base_effect": 5,
-                "variance": 2,
-                "effect_type": "luck",
-                "difficulty": "easy"
-            },
-            {
-                "name": "Giant's Belt",
-                "cost": 400,
-                "base_effect": 8,
-                "variance": 3,
-                "effect_type": "strength",
-                "difficulty": "medium"
-            },
-            {
-                "name": "Ice Heart Amulet",
-                "cost": 800,
-                "base_effect": 12,
-                "variance": 4,
-                "effect_type": "armour",
-                "difficulty": "hard"
-            }
-        ]
+    tables = get_encounter_tables()
+    multiplier = tables["difficulty_multiplier"]
+    
+    accessories = tables["accessories"][area]
     # Filter accessories by difficulty
     appropriate_accessories = [a for a in accessories if a["difficulty"] == difficulty]
     if not appropriate_accessories:
@@ -370,7 +163,7 @@ def get_accessory(area, difficulty):
 
 def apply_quality_variance(item_data, difficulty):
     """Apply quality variance to an item"""
-    multiplier = {"easy": 1, "medium": 1.5, "hard": 2}
+    multiplier = get_encounter_tables()["difficulty_multiplier"]
     
     # Add random variance to effect value
     variance = random.randint(-item_data["variance"], item_data["variance"])
@@ -413,70 +206,10 @@ def apply_quality_variance(item_data, difficulty):
 
 def handle_chest(difficulty="easy", area="forest"):
     """Handle chest discovery and loot with difficulty multipliers"""
-    multiplier = {
-        "easy": 1,
-        "medium": 1.5,
-        "hard": 2
-    }
+    tables = get_encounter_tables()
+    multiplier = tables["difficulty_multiplier"]
     
-    if area == "forest":
-        loot_table = [
-            {"item": "gold", "min": 10, "max": 50, "weight": 40},
-            # Consumables
-            {
-                "item": "health_potion",
-                "name": "Leafy Health Potion",
-                "cost": 30,
-                "effect_type": "health",
-                "effect_value": 50,
-                "icon": "🧪",
-                "type": ItemType.CONSUMABLE,
-                "weight": 20
-            },
-            {
-                "item": "strength_potion",
-                "name": "Oak Strength Potion",
-                "cost": 50,
-                "effect_type": "strength",
-                "effect_value": 2,
-                "icon": "💪",
-                "type": ItemType.CONSUMABLE,
-                "weight": 15
-            },
-            # Equipment
-            {"item": "weapon", "weight": 10},
-            {"item": "armor", "weight": 10},
-            {"item": "accessory", "weight": 5}
-        ]
-    elif area == "mountain":
-        loot_table = [
-            {"item": "gold", "min": 30, "max": 100, "weight": 40},
-            # Mountain Consumables
-            {
-                "item": "mountain_brew",
-                "name": "Mountain Brew",
-                "cost": 60,
-                "effect_type": "health",
-                "effect_value": 80,
-                "icon": "🧪",
-                "type": ItemType.CONSUMABLE,
-                "weight": 20
-            },
-            {
-                "item": "giant_strength",
-                "name": "Giant's Strength Potion",
-                "cost": 80,
-                "effect_type": "strength",
-                "effect_value": 4,
-                "icon": "💪",
-                "type": ItemType.CONSUMABLE,
-                "weight": 15
-            },
-            # Equipment
-            {"item": "weapon", "weight": 10},
-            {"item": "armor", "weight": 10},
-            {"item": "accessory", "weight": 5}
-        ]
+    loot_table = tables["loot_tables"][area]
     
     total_weight = sum(item["weight"] for item in loot_table)
     roll = random.randint(1, total_weight)
@@ -485,9 +218,13 @@ def handle_chest(difficulty="easy", area="forest"):
     for loot in loot_table:
         current_weight += loot["weight"]
         if roll <= current_weight:
+            count_loot(st.session_state.warrior, loot)
             if loot["item"] == "gold":
                 gold_amount = int(random.randint(loot["min"], loot["max"]) * multiplier[difficulty])
                 st.session_state.warrior.gold += gold_amount
+                emit_gold("chest", gold_amount, st.session_state.warrior)
+                emit("loot", area=area, difficulty=difficulty, item="gold", gold=gold_amount,
+                     level=st.session_state.warrior.level)
                 return f"💰 Found {gold_amount} gold!"
                 
             elif loot["item"] in ["health_potion", "strength_potion", "mountain_brew", "giant_strength"]:
@@ -502,82 +239,37 @@ def handle_chest(difficulty="easy", area="forest"):
                 )
                 st.session_state.warrior.inventory.append(item)
                 # Update quest progress here
-                for quest in st.session_state.quests.values():
+                for quest in active_quests(st.session_state.quests):
                     quest.update_progress("item_collected", {"item_name": item.name})
 
+                emit("loot", area=area, difficulty=difficulty, item=item.name, value=item.cost,
+                     level=st.session_state.warrior.level)
                 return f"{item.icon} Found a {item.name}!"
                 
             elif loot["item"] == "weapon":
                 weapon = get_weapon(area, difficulty)  # This already has correct ItemType.WEAPON
                 st.session_state.warrior.inventory.append(weapon)
+                emit("loot", area=area, difficulty=difficulty, item=weapon.name, value=weapon.cost,
+                     level=st.session_state.warrior.level)
                 return f"{weapon.icon} Found a {weapon.name}!"
                 
             elif loot["item"] == "armor":
                 armor = get_armor(area, difficulty)  # This already has correct ItemType.ARMOR
                 st.session_state.warrior.inventory.append(armor)
+                emit("loot", area=area, difficulty=difficulty, item=armor.name, value=armor.cost,
+                     level=st.session_state.warrior.level)
                 return f"{armor.icon} Found {armor.name}!"
                 
             elif loot["item"] == "accessory":
                 accessory = get_accessory(area, difficulty)  # This already has correct ItemType.ACCESSORY
                 st.session_state.warrior.inventory.append(accessory)
+                emit("loot", area=area, difficulty=difficulty, item=accessory.name, value=accessory.cost,
+                     level=st.session_state.warrior.level)
                 return f"{accessory.icon} Found a {accessory.name}!"
 
 def handle_blessing(area="forest"):
     """Handle divine blessing encounters with area-specific effects"""
-    if area == "forest":
-        blessings = [
-            {
-                "name": "Divine Healing",
-                "type": "heal",
-                "value": 30,
-                "duration": None,  # Instant effect
-                "text": ":sparkling_heart: A spirit of the forest shines a divine light and heals your wounds",
-                "icon": ":sparkling_heart:"
-            },
-            {
-                "name": "Warrior's Blessing",
-                "type": "strength",
-                "value": 3,
-                "duration": 5,  # Lasts 5 combat rounds
-                "text": ":muscle: A tree ent fills your body with renewed strength, you feel temporarily stronger",
-                "icon": ":muscle:"
-            },
-            {
-                "name": "Fortune's Favor",
-                "type": "luck",
-                "value": 4,
-                "duration": 3,  # Lasts 3 combat rounds
-                "text": ":four_leaf_clover: Fortune smiles upon you",
-                "icon": ":four_leaf_clover:"
-            }
-        ]
-    elif area == "mountain":
-        blessings = [
-            {
-                "name": "Mountain's Strength",
-                "type": "heal",
-                "value": 50,  # Stronger healing in mountains
-                "duration": None,
-                "text": ":material/mountain: The mountain's ancient power restores you",
-                "icon": ":material/heart-plus:"
-            },
-            {
-                "name": "Giant's Might",
-                "type": "strength",
-                "value": 5,
-                "duration": 3,
-                "text": ":material/arm-flex: The spirit of the mountain giants fills you",
-                "icon": ":material/arm-flex:"
-            },
-            {
-                "name": "Ice Shield",
-                "type": "armour",
-                "value": 8,
-                "duration": 4,
-                "text": ":material/snowflake: A shield of ice forms around you",
-                "icon": ":material/shield:"
-            }
-        ]
+    blessings = get_encounter_tables()["blessings"][area]
     
     blessing = random.choice(blessings)
     warrior = st.session_state.warrior
@@ -631,23 +323,13 @@ def level_up_warrior():
         f"• {warrior.build_type} bonus: +{stat_gain} to primary stat\n"
         f"• Next level requires {next_xp} XP"
     )
+    if warrior.level % 5 == 0:
+        post(f"⭐ {warrior.name} the {warrior.build_type} reached level {warrior.level}!")
     st.balloons()
 
 def handle_trap(area="forest"):
     """Handle trap encounters"""
-    if area == "forest":
-        traps = [
-            {"damage": 10, "text": "You trigger a tripwire and take damage", "icon": ":spider_web:"},
-            {"damage": 15, "text": "Poisonous spores burst from a mushroom", "icon": ":mushroom:"},
-            {"damage": 20, "text": "A hidden pit opens beneath your feet", "icon": ":hole:"}
-        ]
-    elif area == "mountain":
-        traps = [
-            {"damage": 15, "text": "You slip on ice and fall", "icon": ":material/snowflake:"},
-            {"damage": 20, "text": "An avalanche catches you", "icon": ":material/weather-snowy-heavy:"},
-            {"damage": 25, "text": "You fall into a deep crevasse", "icon": ":material/crack:"},
-            {"damage": 30, "text": "Freezing winds sap your strength", "icon": ":material/weather-windy:"}
-        ]
+    traps = get_encounter_tables()["traps"][area]
     
     trap = random.choice(traps)
     warrior = st.session_state.warrior
@@ -655,9 +337,132 @@ def handle_trap(area="forest"):
     
     if warrior.health <= 0:
         warrior.status = "Dead"
+        warrior.cause_of_death = trap["text"]
         return f"{trap['icon']} {trap['text']}! The trap was fatal!"
     return f"{trap['icon']} {trap['text']}! You take {trap['damage']} damage"
 
+CLASS_ABILITIES = {"Barbarian": "berserk", "Rogue": "backstab", "Knight": "shield_bash"}
+
+DEFAULT_AUTO_POLICY = {
+    "action": "normal_attack",  # action used every round
+    "potion_below": 0.4,        # drink a health potion below this share of max health
+    "run_below": 0.2,           # run away below this share if no potion is left
+    "max_rounds": 100           # give up and run after this many rounds
+}
+
+def find_health_potion(warrior):
+    """Return the inventory key of the weakest healing consumable, or None"""
+    potions = [
+        (item.effect_value, key) for key, item, count in warrior.inventory.stacks()
+        if item.item_type == ItemType.CONSUMABLE and item.effect_type == "health" and item.effect_value > 0
+    ]
+    return min(potions)[1] if potions else None
+
+def auto_resolve_combat(policy=None):
+    """Fight the current enemy to the end in one call, following a policy
+
+    Rounds are resolved with process_combat_round. The round-by-round log
+    goes to st.session_state.auto_battle_log and only a summary stays in
+    the adventure log.
+    """
+    policy = {**DEFAULT_AUTO_POLICY, **(policy or {})}
+    warrior = st.session_state.warrior
+    enemy = st.session_state.current_enemy
+    log = st.session_state.combat_log
+    
+    start = len(log)
+    start_health, start_gold, start_level = warrior.health, warrior.gold, warrior.level
+    rounds = []
+    potions_used = 0
+    outcome = "ran away"
+    
+    while len(rounds) < policy["max_rounds"]:
+        round_start = len(log)
+        health_share = warrior.health / warrior.max_health
+        
+        if health_share < policy["potion_below"]:
+            potion_key = find_health_potion(warrior)
+            if potion_key is not None:
+                log.append(warrior.use_item(potion_key, notify=False))
+                potions_used += 1
+                health_share = warrior.health / warrior.max_health
+        
+        if health_share < policy["run_below"]:
+            log.append("🏃 You retreat from the fight!")
+            rounds.append(log[round_start:])
+            break
+        
+        process_combat_round(policy["action"])
+        rounds.append(log[round_start:])
+        
+        if warrior.status == "Dead":
+            outcome = "defeated"
+            break
+        if st.session_state.current_enemy is None:
+            outcome = "victory"
+            break
+    
+    st.session_state.current_enemy = None
+    del log[start:]
+    st.session_state.auto_battle_log = rounds
+    
+    round_text = f"{len(rounds)} round{'s' if len(rounds) != 1 else ''}"
+    summary = {
+        "victory": f"⚡ Auto-battle: you defeated {enemy.name} in {round_text}",
+        "defeated": f"⚡ Auto-battle: {enemy.name} defeated you after {round_text}",
+        "ran away": f"⚡ Auto-battle: you escaped from {enemy.name} after {round_text}"
+    }[outcome]
+    details = [
+        f"{warrior.health - start_health:+d} health",
+        f"{warrior.gold - start_gold:+d} gold"
+    ]
+    if potions_used:
+        details.append(f"{potions_used} potions used")
+    if warrior.level > start_level:
+        details.append(f"reached level {warrior.level}")
+    log.append(f"{summary} ({', '.join(details)})")
+    return outcome
+
+def display_auto_battle_log():
+    """Show the rounds of the last auto-battle in a collapsible log"""
+    rounds = st.session_state.get("auto_battle_log")
+    if not rounds:
+        return
+    with st.expander(f"Auto-battle log ({len(rounds)} rounds)"):
+        st.markdown("\n\n".join(
+            f"**Round {number}**  \n" + "  \n".join(entries)
+            for number, entries in enumerate(rounds, start=1)
+        ))
+
+def get_auto_policy():
+    """Auto-battle policy from the player's current control settings"""
+    action = st.session_state.get("auto_action", DEFAULT_AUTO_POLICY["action"])
+    if getattr(st.session_state.current_enemy, "members", None):
+        action = "normal_attack"  # the only action of a group fight, see process_group_round
+    return {
+        "action": action,
+        "potion_below": st.session_state.get("auto_potion_below", 40) / 100,
+        "run_below": st.session_state.get("auto_run_below", 20) / 100
+    }
+
+def display_auto_battle_controls(warrior):
+    """Policy settings and the auto-resolve button"""
+    with st.expander("⚡ Auto-battle"):
+        if getattr(st.session_state.current_enemy, "members", None):
+            st.caption("A group is fought with normal attacks every round.")
+        else:
+            actions = ["normal_attack", "heavy_attack"]
+            if warrior.build_type in CLASS_ABILITIES:
+                actions.append(CLASS_ABILITIES[warrior.build_type])
+            st.selectbox(
+                "Action each round", actions,
+                format_func=lambda action: action.replace("_", " ").title(), key="auto_action"
+            )
+        st.slider("Drink a health potion below % health", 0, 100, 40, key="auto_potion_below")
+        st.slider("Run away below % health", 0, 100, 20, key="auto_run_below")
+        st.button("⚡ Auto-resolve", on_click=lambda: auto_resolve_combat(get_auto_policy()), use_container_width=True)
+
+@timed("handle_combat")
 def handle_combat():
     """Handle combat encounters with multiple action choices"""
     warrior = st.session_state.warrior
@@ -669,9 +474,17 @@ def handle_combat():
     info_col, image_col = st.columns([3, 2])
     
     with info_col:
-        st.markdown(f"{enemy.name} stands before you!")
-        st.metric("Enemy Health", enemy.health)
-        st.metric("Enemy Strength", enemy.strength)
+        members = getattr(enemy, "members", None)
+        if members:
+            standing = sum(health > 0 for health in members)
+            st.markdown(f"A {enemy.name} surrounds you, {standing} of them still standing!")
+            st.metric("Enemy Health", enemy.health)
+            st.caption(" · ".join(f"{enemy.member_name} {health} HP" for health in members if health > 0))
+            st.metric("Enemy Strength", f"{enemy.member_strength} each")
+        else:
+            st.markdown(f"{enemy.name} stands before you!")
+            st.metric("Enemy Health", enemy.health)
+            st.metric("Enemy Strength", enemy.strength)
         st.metric("Enemy Armor", enemy.armour)
         
         # Calculate action costs
@@ -683,19 +496,24 @@ def handle_combat():
         
         # Basic actions
         st.button("⚔️ Attack", on_click=process_combat_round, args=("normal_attack",), use_container_width=True)
-        st.button("🛡️ Defend", on_click=process_combat_round, args=("defend",), use_container_width=True)
-        st.button(f"🔥 Heavy Attack (-{heavy_attack_cost} HP)", on_click=process_combat_round, args=("heavy_attack",), use_container_width=True)
-        
-        # Class-specific ability
-        if warrior.build_type == "Barbarian":
-            st.button(f"💢 Berserk (-{power_cost} HP)", on_click=process_combat_round, args=("berserk",), use_container_width=True)
-        elif warrior.build_type == "Rogue":
-            st.button("🗡️ Backstab", on_click=process_combat_round, args=("backstab",), use_container_width=True)
-        elif warrior.build_type == "Knight":
-            st.button("🛡️ Shield Bash", on_click=process_combat_round, args=("shield_bash",), use_container_width=True)
+        # Other actions and class abilities are for single enemies, a group is
+        # fought with normal attacks, see process_group_round
+        if not members:
+            st.button("🛡️ Defend", on_click=process_combat_round, args=("defend",), use_container_width=True)
+            st.button(f"🔥 Heavy Attack (-{heavy_attack_cost} HP)", on_click=process_combat_round, args=("heavy_attack",), use_container_width=True)
+            
+            # Class-specific ability
+            if warrior.build_type == "Barbarian":
+                st.button(f"💢 Berserk (-{power_cost} HP)", on_click=process_combat_round, args=("berserk",), use_container_width=True)
+            elif warrior.build_type == "Rogue":
+                st.button("🗡️ Backstab", on_click=process_combat_round, args=("backstab",), use_container_width=True)
+            elif warrior.build_type == "Knight":
+                st.button("🛡️ Shield Bash", on_click=process_combat_round, args=("shield_bash",), use_container_width=True)
         
         # Run away button
         st.button("🏃 Run Away", on_click=lambda: setattr(st.session_state, 'current_enemy', None), use_container_width=True)
+        
+        display_auto_battle_controls(warrior)
     
     with image_col:
         try:
@@ -711,10 +529,11 @@ def handle_enemy_defeat():
     enemy = st.session_state.current_enemy
     
     # Update quest progress for kill quests
-    for quest in st.session_state.quests.values():
+    for quest in active_quests(st.session_state.quests):
         quest.update_progress("enemy_killed", {"enemy_name": enemy.name})
     
     st.session_state.combat_log.append(f"🏆 You defeated {enemy.name}!")
+    count_kill(warrior, enemy.name)
     
     # Lucky loot chance
     lucky_bonus = random.random() < (warrior.luck / 150)  # Chance for bonus rewards
@@ -737,6 +556,7 @@ def handle_enemy_defeat():
     
     warrior.experience += xp_gained
     warrior.gold += gold_gained
+    emit_gold("kill", gold_gained, warrior)
     st.session_state.combat_log.append(
         f"💰 Gained {gold_gained} gold and {xp_gained} experience!"
     )
@@ -755,6 +575,7 @@ def handle_warrior_defeat():
     """Handle warrior defeat"""
     st.session_state.combat_log.append(":material/skull: You have been defeated!")
     st.session_state.warrior.status = "Dead"
+    st.session_state.warrior.cause_of_death = f"Slain by {st.session_state.current_enemy.name}"
     st.session_state.current_enemy = None
 
 
@@ -762,6 +583,10 @@ def process_combat_round(action_type):
     """Process combat round with different action types"""
     warrior = st.session_state.warrior
     enemy = st.session_state.current_enemy
+    if getattr(enemy, "members", None):
+        process_group_round(action_type)
+        return
+    warrior_health, enemy_health = warrior.health, enemy.health
     
     # Player action phase
     if action_type == "normal_attack":
@@ -777,15 +602,19 @@ def process_combat_round(action_type):
     elif action_type == "shield_bash":
         handle_shield_bash(warrior, enemy)
     
+    # Enemy action phase, unless the enemy is already down
+    enemy_defeated = enemy.health <= 0
+    if not enemy_defeated and not is_stunned(enemy):
+        handle_enemy_attack(warrior, enemy)
+    
+    emit("damage", enemy=enemy.name, action=action_type, level=warrior.level,
+         dealt=enemy_health - enemy.health, taken=warrior_health - warrior.health)
+    
     # Check for enemy defeat
-    if enemy.health <= 0:
+    if enemy_defeated:
         handle_enemy_defeat()
         return
     
-    # Enemy action phase
-    if not is_stunned(enemy):
-        handle_enemy_attack(warrior, enemy)
-    
     # Check for warrior defeat
     if warrior.health <= 0:
         handle_warrior_defeat()
@@ -796,6 +625,44 @@ def process_combat_round(action_type):
     for buff in expired_buffs:
         st.session_state.combat_log.append(f"{buff.icon} {buff.name} has worn off!")
 
+def process_group_round(action_type):
+    """Combat round against an enemy group such as a wolf pack, with the party engine
+
+    Every action is a normal attack on the first member still standing, so
+    handle_combat and the auto-battle controls only offer that, running
+    away and potions against a group.
+    """
+    from party_combat import Battles, party_stats, group_stats  # Loads NumPy, only once a group is fought
+    warrior = st.session_state.warrior
+    enemy = st.session_state.current_enemy
+    log = st.session_state.combat_log
+    standing_before = sum(health > 0 for health in enemy.members)
+
+    battle = Battles(party_stats([warrior]), group_stats(enemy))
+    dealt, taken = battle.round()
+    warrior.health = int(battle.party["health"][0, 0])
+    enemy.members = [max(0, int(health)) for health in battle.enemies["health"][0]]
+    enemy.health = sum(enemy.members)
+    standing = sum(health > 0 for health in enemy.members)
+
+    log.append(f"🗡️ You strike the {enemy.name} for {int(dealt[0, 0])} damage")
+    if standing < standing_before:
+        fallen = standing_before - standing
+        log.append(f"🐾 A {enemy.member_name} falls! {standing} left" if fallen == 1 else f"🐾 {fallen} of them fall! {standing} left")
+    if taken[0, 0]:
+        log.append(f"💥 The {enemy.name} hits you for {int(taken[0, 0])} damage")
+    emit("damage", enemy=enemy.name, action=action_type, level=warrior.level,
+         dealt=int(dealt[0, 0]), taken=int(taken[0, 0]))
+
+    if battle.won[0]:
+        handle_enemy_defeat()
+        return
+    if battle.lost[0]:
+        handle_warrior_defeat()
+        return
+    for buff in warrior.update_buff_durations():
+        log.append(f"{buff.icon} {buff.name} has worn off!")
+
 def handle_normal_attack(warrior, enemy):
     """Regular attack with critical chance"""
     if random.random() < calculate_critical_chance(warrior.luck):
@@ -0,0 +1,84 @@
+# enemy_configs.py
+
+ENEMIES = {
+    "forest_easy": [
+        {"name": "Forest Imp", "health": 35, "strength": 6, "armour": 1, "xp": 20, "gold": 35, "image": "imp.png", "weight": 25},  # Weakest, most common
+        {"name": "Goblin Scout", "health": 45, "strength": 7, "armour": 2, "xp": 25, "gold": 30, "image": "goblin.png", "weight": 20},
+        {"name": "Wolf", "health": 50, "strength": 8, "armour": 3, "xp": 30, "gold": 15, "image": "wolf.png", "weight": 15},
+        {"name": "Giant Spider", "health": 40, "strength": 12, "armour": 4, "xp": 35, "gold": 18, "image": "spider.png", "weight": 15},
+        {"name": "Hostile Hunter", "health": 55, "strength": 9, "armour": 4, "xp": 32, "gold": 28, "image": "hunter.png", "weight": 10},
+        {"name": "Bandit", "health": 60, "strength": 10, "armour": 5, "xp": 40, "gold": 25, "image": "bandit.png", "weight": 8},
+        {"name": "Wild Boar", "health": 55, "strength": 9, "armour": 6, "xp": 35, "gold": 20, "image": "boar.png", "weight": 5},
+        {"name": "Rabid Bear", "health": 65, "strength": 11, "armour": 8, "xp": 45, "gold": 22, "image": "bear.png", "weight": 2}  # Strongest, rarest
+    ],
+    "forest_medium": [
+        {"name": "Harpy Warrior", "health": 65, "strength": 18, "armour": 6, "xp": 52, "gold": 60, "image": "harpy.png", "weight": 20},
+        {"name": "Forest Witch", "health": 60, "strength": 20, "armour": 5, "xp": 65, "gold": 70, "image": "witch.png", "weight": 15},
+        {"name": "Werewolf", "health": 75, "strength": 16, "armour": 8, "xp": 60, "gold": 55, "image": "werewolf.png", "weight": 15},
+        {"name": "Dark Dwarf", "health": 70, "strength": 15, "armour": 15, "xp": 45, "gold": 50, "image": "dark_dwarf.png", "weight": 12},
+        {"name": "Bandit Chief", "health": 70, "strength": 17, "armour": 14, "xp": 56, "gold": 65, "image": "bandit_chief.png", "weight": 10},
+        {"name": "Dire Wolf Pack", "health": 85, "strength": 15, "armour": 7, "xp": 57, "gold": 52, "image": "dire_wolf.png", "weight": 10,
+         "group": {"member": "Dire Wolf", "count": 3, "health": 25, "strength": 6}},  # Fought as three wolves, see party_combat.py
+        {"name": "Troll", "health": 80, "strength": 12, "armour": 12, "xp": 50, "gold": 40, "image": "troll.png", "weight": 8},
+        {"name": "Forest Ogre", "health": 90, "strength": 14, "armour": 10, "xp": 55, "gold": 45, "image": "ogre.png", "weight": 5},
+        {"name": "Shambling Mound", "health": 95, "strength": 14, "armour": 18, "xp": 54, "gold": 45, "image": "mound.png", "weight": 3},
+        {"name": "Corrupted Ent", "health": 100, "strength": 13, "armour": 20, "xp": 58, "gold": 48, "image": "ent.png", "weight": 2}
+    ],
+    "forest_hard": [
+        {"name": "Dark Elf Champion", "health": 85, "strength": 28, "armour": 16, "xp": 100, "gold": 150, "image": "dark_elf.png", "weight": 25},
+        {"name": "Demon Hunter", "health": 90, "strength": 25, "armour": 18, "xp": 90, "gold": 120, "image": "demon_hunter.png", "weight": 20},
+        {"name": "Corrupted Unicorn", "health": 110, "strength": 24, "armour": 15, "xp": 88, "gold": 130, "image": "unicorn.png", "weight": 15},
+        {"name": "Giant", "health": 120, "strength": 18, "armour": 20, "xp": 70, "gold": 80, "image": "giant.png", "weight": 12},
+        {"name": "Forest Hydra", "health": 130, "strength": 22, "armour": 22, "xp": 95, "gold": 110, "image": "hydra.png", "weight": 10},
+        {"name": "Elder Wyrm", "health": 140, "strength": 21, "armour": 28, "xp": 92, "gold": 140, "image": "wyrm.png", "weight": 8},
+        {"name": "Shadow Giant", "health": 160, "strength": 19, "armour": 24, "xp": 87, "gold": 95, "image": "shadow_giant.png", "weight": 5},
+        {"name": "Ancient Treant", "health": 150, "strength": 16, "armour": 30, "xp": 85, "gold": 90, "image": "treant.png", "weight": 3},
+        {"name": "Dragon", "health": 100, "strength": 20, "armour": 25, "xp": 80, "gold": 100, "image": "dragon.png", "weight": 2}
+    ],
+    "mountain_easy": [
+        {"name": "Frost Imp", "health": 65, "strength": 10, "armour": 2, "xp": 40, "gold": 45, "image": "mountains/imp.png", "weight": 25},
+        {"name": "Snow Wolf", "health": 75, "strength": 14, "armour": 4, "xp": 45, "gold": 35, "image": "mountains/wolf.png", "weight": 20},
+        {"name": "Ice Goblin", "health": 85, "strength": 11, "armour": 6, "xp": 48, "gold": 42, "image": "mountains/goblin.png", "weight": 15},
+        {"name": "Mountain Bandit", "health": 88, "strength": 14, "armour": 7, "xp": 54, "gold": 48, "image": "mountains/bandit.png", "weight": 15},
+        {"name": "Crystal Spider", "health": 70, "strength": 13, "armour": 8, "xp": 55, "gold": 38, "image": "mountains/spider.png", "weight": 10},
+        {"name": "Mountain Goat", "health": 80, "strength": 12, "armour": 5, "xp": 50, "gold": 30, "image": "mountains/goat.png", "weight": 8},
+        {"name": "Cave Dweller", "health": 95, "strength": 13, "armour": 10, "xp": 52, "gold": 36, "image": "mountains/dweller.png", "weight": 5},
+        {"name": "Rock Elemental", "health": 90, "strength": 15, "armour": 15, "xp": 60, "gold": 40, "image": "mountains/rock_elemental.png", "weight": 2}
+    ],
+    "mountain_medium": [
+        {"name": "Storm Harpy", "health": 95, "strength": 24, "armour": 8, "xp": 78, "gold": 75, "image": "harpy.png", "weight": 20},
+        {"name": "Ice Witch", "health": 90, "strength": 26, "armour": 10, "xp": 88, "gold": 85, "image": "witch.png", "weight": 15},
+        {"name": "Ice Troll", "health": 100, "strength": 20, "armour": 15, "xp": 75, "gold": 70, "image": "troll.png", "weight": 15},
+        {"name": "Avalanche Spirit", "health": 110, "strength": 23, "armour": 14, "xp": 84, "gold": 78, "image": "spirit.png", "weight": 12},
+        {"name": "Frost Giant", "health": 120, "strength": 18, "armour": 18, "xp": 80, "gold": 60, "image": "giant.png", "weight": 10},
+        {"name": "Mountain Ogre", "health": 150, "strength": 21, "armour": 16, "xp": 76, "gold": 72, "image": "ogre.png", "weight": 10},
+        {"name": "Yeti", "health": 130, "strength": 22, "armour": 12, "xp": 85, "gold": 65, "image": "yeti.png", "weight": 8},
+        {"name": "Frost Wyrm", "health": 140, "strength": 19, "armour": 20, "xp": 82, "gold": 68, "image": "wyrm.png", "weight": 5},
+        {"name": "Ice Drake", "health": 125, "strength": 25, "armour": 22, "xp": 90, "gold": 80, "image": "drake.png", "weight": 3},
+        {"name": "Crystal Golem", "health": 160, "strength": 20, "armour": 25, "xp": 86, "gold": 66, "image": "golem.png", "weight": 2}
+    ],
+    "mountain_hard": [
+        {"name": "Glacier Queen", "health": 170, "strength": 30, "armour": 25, "xp": 140, "gold": 180, "image": "queen.png", "weight": 20},
+        {"name": "Eternal Ice Elemental", "health": 185, "strength": 31, "armour": 28, "xp": 138, "gold": 170, "image": "ice_elemental.png", "weight": 15},
+        {"name": "Blizzard Demon", "health": 195, "strength": 32, "armour": 26, "xp": 150, "gold": 200, "image": "demon.png", "weight": 15},
+        {"name": "Elder Frost Wyrm", "health": 190, "strength": 29, "armour": 38, "xp": 135, "gold": 175, "image": "elder_wyrm.png", "weight": 12},
+        {"name": "Mountain Titan", "health": 180, "strength": 28, "armour": 30, "xp": 130, "gold": 160, "image": "titan.png", "weight": 10},
+        {"name": "Storm Giant King", "health": 220, "strength": 26, "armour": 32, "xp": 125, "gold": 165, "image": "giant_king.png", "weight": 8},
+        {"name": "Mountain Overlord", "health": 210, "strength": 27, "armour": 34, "xp": 145, "gold": 190, "image": "overlord.png", "weight": 8},
+        {"name": "Ancient Frost Giant", "health": 240, "strength": 28, "armour": 36, "xp": 142, "gold": 185, "image": "ancient_giant.png", "weight": 5},
+        {"name": "Crystal Behemoth", "health": 230, "strength": 24, "armour": 40, "xp": 128, "gold": 155, "image": "behemoth.png", "weight": 4},
+        {"name": "Ancient Dragon", "health": 200, "strength": 25, "armour": 35, "xp": 120, "gold": 150, "image": "ancient_dragon.png", "weight": 2},
+        {"name": "Mountain Dragon Lord", "health": 250, "strength": 35, "armour": 45, "xp": 160, "gold": 250, "image": "dragon_lord.png", "weight": 1}  # Ultimate boss, very rare
+    ]
+}
+
+# World bosses are fought by every warrior on the server at once and share
+# one health pool (see shared_world.py). Every hit pays xp_per_hit and
+# gold_per_hit, the killing blow also xp and gold. A slain boss returns
+# after respawn seconds.
+WORLD_BOSSES = {
+    "Frost Titan": {
+        "health": 20000, "strength": 30, "armour": 30, "xp": 500, "gold": 600,
+        "xp_per_hit": 8, "gold_per_hit": 5, "min_level": 5, "respawn": 1800, "image": "giant.png"
+    }
+}
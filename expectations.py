@@ -0,0 +1,141 @@
+# expectations.py
+# Expected outcome of one click on an area button for a given warrior:
+# gold, XP, health lost and chance of death. Encounter, loot, blessing and
+# trap odds are summed exactly from the content snapshot. Fights have too
+# many paths to sum by hand, so every enemy of the area is fought
+# FIGHT_TRIALS times with party_combat.Battles and a fixed seed. Results
+# are cached per area and stat profile. Like snapshot.py this module does
+# not import streamlit.
+import functools
+import numpy as np
+from snapshot import load_snapshot
+from tables import load_tables, area_rows
+from party_combat import Battles, table_groups
+
+FIGHT_TRIALS = 500
+MAX_ROUNDS = 100
+HEALTH_STEP = 5  # health is rounded down to this step in profiles, so nearby values share a cache entry
+
+def stat_profile(warrior):
+    """Stats that decide a click's outcome, as a hashable tuple for the cache"""
+    health = max(1, warrior.health // HEALTH_STEP * HEALTH_STEP)
+    return (health, warrior.max_health, warrior.strength, warrior.armour, warrior.luck)
+
+def area_expectations(warrior, area_id):
+    """Expected gold, xp, item_value, health_lost and death per click in an area, e.g. "forest_easy" """
+    return expectations_for_profile(area_id, stat_profile(warrior))
+
+def region_expectations(warrior, region):
+    """area_expectations for every difficulty of a region config, keyed by difficulty"""
+    profile = stat_profile(warrior)
+    return {
+        difficulty: expectations_for_profile(f"{region['name']}_{difficulty}", profile)
+        for area_name, difficulty in region["areas"]
+    }
+
+@functools.lru_cache(maxsize=1024)
+def expectations_for_profile(area_id, profile):
+    health, max_health, strength, armour, luck = profile
+    snapshot = load_snapshot()
+    region, difficulty = area_id.split("_")
+    multiplier = snapshot["difficulty_multiplier"][difficulty]
+    weights = {encounter["type"]: encounter["weight"] for encounter in snapshot["encounter_weights"]}
+    total = sum(weights.values())
+    chance = {kind: weight / total for kind, weight in weights.items()}
+
+    fight = fight_expectations(area_id, profile)
+    chest_gold, chest_items = chest_expectations(region, difficulty, multiplier)
+
+    blessings = snapshot["blessings"][region]
+    healed = sum(
+        min(blessing["value"], max_health - health) for blessing in blessings if blessing["type"] == "heal"
+    ) / len(blessings)
+    traps = [trap["damage"] for trap in snapshot["traps"][region]]
+    trap_loss = sum(min(damage, health) for damage in traps) / len(traps)
+    trap_death = sum(damage >= health for damage in traps) / len(traps)
+
+    return {
+        "gold": chance["enemy"] * fight["gold"] + chance["chest"] * chest_gold,
+        "xp": chance["enemy"] * fight["xp"],
+        "item_value": chance["chest"] * chest_items,
+        "health_lost": chance["enemy"] * fight["health_lost"] + chance["trap"] * trap_loss - chance["blessing"] * healed,
+        "death": chance["enemy"] * fight["death"] + chance["trap"] * trap_death,
+        "win": fight["win"]
+    }
+
+def chest_expectations(region, difficulty, multiplier):
+    """Expected gold and sell value of the items in one chest"""
+    snapshot = load_snapshot()
+    table = snapshot["loot_tables"][region]
+    total = sum(loot["weight"] for loot in table)
+    gold = items = 0
+    for loot in table:
+        share = loot["weight"] / total
+        if loot["item"] == "gold":
+            rolls = range(loot["min"], loot["max"] + 1)
+            gold += share * sum(int(roll * multiplier) for roll in rolls) / len(rolls)
+        elif loot["item"] in ("weapon", "armor", "accessory"):
+            kind = {"weapon": "weapons", "armor": "armors", "accessory": "accessories"}[loot["item"]]
+            items += share * equipment_value(kind, region, difficulty, multiplier)
+        else:
+            items += share * int(loot["cost"] * 0.5)  # consumables sell for half
+    return gold, items
+
+def equipment_value(kind, region, difficulty, multiplier):
+    """Expected sell price of a chest item, over the templates and variance rolls of apply_quality_variance"""
+    templates = load_snapshot()[kind][region]
+    templates = [template for template in templates if template["difficulty"] == difficulty] or templates
+    value = 0
+    for template in templates:
+        rolls = range(-template["variance"], template["variance"] + 1)
+        costs = [int(template["cost"] * (1 + roll / template["variance"] / 2) * multiplier) for roll in rolls]
+        value += sum(int(cost * 0.75) for cost in costs) / len(costs)
+    return value / len(templates)
+
+def fight_expectations(area_id, profile):
+    """Chance to win and die, expected health lost and rewards of a fight to the end in an area
+
+    Warriors use the normal attack every round and drink nothing. A fight
+    still going after MAX_ROUNDS counts as neither won nor lost.
+    """
+    health, max_health, strength, armour, luck = profile
+    tables = load_tables()
+    enemies = tables["enemies"]
+    rows = area_rows(tables, area_id)
+    weights = np.asarray(enemies["weight"][rows], dtype=np.float64)
+    weights /= weights.sum()
+    won, died, lost = simulate_fights(profile, np.arange(rows.start, rows.stop))
+    # Lucky kills give half as much again, see handle_enemy_defeat
+    lucky = min(1.0, luck / 150)
+    xp = np.asarray(enemies["xp"][rows], dtype=np.int64)
+    gold = np.asarray(enemies["gold"][rows], dtype=np.int64)
+    xp_gained = (1 - lucky) * xp + lucky * (xp * 1.5).astype(np.int64)
+    gold_gained = (1 - lucky) * gold + lucky * (gold * 1.5).astype(np.int64)
+    return {
+        "win": float(weights @ won),
+        "death": float(weights @ died),
+        "health_lost": float(weights @ lost),
+        "xp": float(weights @ (won * xp_gained)),
+        "gold": float(weights @ (won * gold_gained))
+    }
+
+def simulate_fights(profile, rows, trials=FIGHT_TRIALS, seed=0):
+    """Fight the enemies at some table rows trials times each, returning win and death rates and mean health lost per row"""
+    health, max_health, strength, armour, luck = profile
+    fights = np.repeat(rows, trials)
+    party = {"health": health, "strength": strength, "armour": armour, "luck": luck}
+    battles = Battles(
+        {stat: np.full((fights.size, 1), value) for stat, value in party.items()},
+        table_groups(load_tables(), fights),
+        np.random.default_rng(seed)
+    ).run(MAX_ROUNDS)
+    lost = health - np.maximum(battles.party["health"][:, 0], 0)
+    shape = (-1, trials)
+    return battles.won.reshape(shape).mean(axis=1), battles.lost.reshape(shape).mean(axis=1), lost.reshape(shape).mean(axis=1)
+
+def describe(expected):
+    """One line hint for an area button, e.g. "≈ 21 gold · 14 XP · -6 HP · 0.4% death" """
+    return (
+        f"≈ {expected['gold']:.0f} gold · {expected['xp']:.0f} XP · "
+        f"{-expected['health_lost']:+.0f} HP · {expected['death']:.1%} death per click"
+    )
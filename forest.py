@@ -1,11 +1,11 @@
 import streamlit as st
 from region import Region
-from region_configs import FOREST_CONFIG
+from content import get_region_config
 from utils import init_session
 
 def main():
     init_session()
-    forest = Region(FOREST_CONFIG)
+    forest = Region(get_region_config("forest"))
     forest.render()
 
 main()
\ No newline at end of file
@@ -0,0 +1,36 @@
+import streamlit as st
+from leaderboard import top_warriors, fallen_count
+
+st.subheader(":material/trophy: Hall of fame")
+st.markdown("*Names of fallen warriors are carved into the stone walls, the greatest nearest the door.*")
+
+cols = st.columns(3)
+with cols[0]:
+    build_type = st.selectbox("Class", ["All classes", "Barbarian", "Rogue", "Knight"])
+with cols[1]:
+    ranking = st.selectbox("Ranked by", ["level", "gold"], format_func=str.title)
+with cols[2]:
+    k = st.number_input("Show the top", min_value=1, max_value=100, value=10)
+
+rows = top_warriors(None if build_type == "All classes" else build_type, ranking, k)
+if not rows:
+    st.write("*The walls are still bare, no warrior has fallen yet...*")
+else:
+    st.dataframe(
+        [
+            {
+                "rank": rank,
+                "name": row["name"],
+                "class": row["build_type"],
+                "level": row["level"],
+                "gold": row["gold"],
+                "kills": row["kills"],
+                "cause of death": row["cause"] or "Unknown",
+                "died": row["died_at"][:16]
+            }
+            for rank, row in enumerate(rows, 1)
+        ],
+        hide_index=True,
+        use_container_width=True
+    )
+    st.caption(f"{fallen_count()} warriors have fallen so far.")
@@ -0,0 +1,72 @@
+# item_configs.py
+from utils import Item, ItemType
+
+def get_weapons():
+    return [
+        Item("Iron Sword", 100, "strength", 5, ":material/swords:", 
+             ItemType.WEAPON, "A reliable iron sword"),
+        Item("Battle Axe", 150, "strength", 8, ":material/swords:", 
+             ItemType.WEAPON, "A mighty battle axe"),
+        Item("War Hammer", 200, "strength", 12, ":material/swords:", 
+             ItemType.WEAPON, "A devastating war hammer"),
+        Item("Legendary Blade", 500, "strength", 20, ":material/swords:", 
+             ItemType.WEAPON, "A blade of legendary power")
+    ]
+
+def get_armor():
+    return [
+        Item("Leather Armor", 80, "armour", 8, ":material/shield:", 
+             ItemType.ARMOR, "Basic but reliable protection"),
+        Item("Chain Mail", 150, "armour", 15, ":material/shield:", 
+             ItemType.ARMOR, "Flexible chain mail protection"),
+        Item("Plate Armor", 300, "armour", 25, ":material/shield:", 
+             ItemType.ARMOR, "Heavy but effective plate armor"),
+        Item("Dragon Scale", 600, "armour", 40, ":material/shield:", 
+             ItemType.ARMOR, "Legendary armor made from dragon scales")
+    ]
+
+def get_accessories():
+    return [
+        Item("Lucky Penny", 150, "luck", 10, ":material/paid:", 
+             ItemType.ACCESSORY, "A coin that brings good fortune"),
+        Item("Adventurer's Ring", 200, "luck", 5, ":material/money_bag:", 
+             ItemType.ACCESSORY, "A ring worn by experienced adventurers"),
+        Item("Ancient Medallion", 300, "health", 25, ":material/money_bag:", 
+             ItemType.ACCESSORY, "A medallion pulsing with ancient power"),
+        Item("Warrior's Pendant", 400, "strength", 8, ":material/money_bag:", 
+             ItemType.ACCESSORY, "A pendant empowered with warrior spirit")
+    ]
+
+def get_potions():
+    return [
+        Item("Health Potion", 30, "health", 50, ":material/science:", 
+             ItemType.CONSUMABLE, "Restores 50 health"),
+        Item("Greater Health Potion", 80, "health", 100, ":material/science:", 
+             ItemType.CONSUMABLE, "Restores 100 health"),
+        Item("Strength Potion", 50, "strength", 2, ":material/science:", 
+             ItemType.CONSUMABLE, "Temporarily increases strength"),
+        Item("Greater Strength Potion", 100, "strength", 4, ":material/science:", 
+             ItemType.CONSUMABLE, "Greatly increases strength"),
+        Item("Stoneskin Potion", 35, "armour", 6, ":material/science:", 
+             ItemType.CONSUMABLE, "Temporarily increases armor"),
+        Item("Greater Stoneskin Potion", 55, "armour", 14, ":material/science:", 
+             ItemType.CONSUMABLE, "Greatly increases armor")
+    ]
+
+def get_tavern_items():
+    return [
+        Item("Honey beer", 5, "health", -5, ":material/sports_bar:"),
+        Item("Lamb shank", 15, "health", 10, ":material/stockpot:"),
+        Item("Sunday roast", 30, "health", 25, ":material/stockpot:"),
+    ]
+
+# Shop items sold in limited numbers, shared by every warrior on the server
+# (see shared_world.py). The shop restocks them every RESTOCK_INTERVAL seconds.
+STOCK_LIMITS = {
+    "Legendary Blade": 3,
+    "Dragon Scale": 3,
+    "Warrior's Pendant": 5,
+    "Greater Health Potion": 40,
+    "Greater Strength Potion": 20
+}
+RESTOCK_INTERVAL = 3600
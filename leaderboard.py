@@ -0,0 +1,115 @@
+# leaderboard.py
+# Hall of fame of fallen warriors. Every warrior that dies is recorded once
+# in an indexed SQLite table, so the top warriors of a class by level or
+# gold are read off an index instead of scanning saves. Top lists are cached
+# per server process and new deaths are merged into them as they arrive,
+# including deaths recorded by other server processes.
+import bisect
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+HALL_OF_FAME_DB = os.path.join("saves", "hall_of_fame.db")
+CACHE_SIZE = 100  # entries kept per cached top list
+
+# Sort orders, best first, and the columns compared for each
+RANKINGS = {
+    "level": ("level", "gold"),
+    "gold": ("gold", "level"),
+}
+
+_lock = threading.Lock()
+_connection = None
+_top = {}  # (build_type or None, ranking) -> best CACHE_SIZE rows
+_last_id = None  # newest row merged into the cached lists, None until first read
+
+def connect():
+    """Shared connection to the hall of fame, creating the table and indexes"""
+    global _connection
+    if _connection is None:
+        os.makedirs(os.path.dirname(HALL_OF_FAME_DB), exist_ok=True)
+        _connection = sqlite3.connect(HALL_OF_FAME_DB, check_same_thread=False)
+        _connection.row_factory = sqlite3.Row
+        _connection.executescript("""
+            CREATE TABLE IF NOT EXISTS fallen (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                build_type TEXT NOT NULL,
+                level INTEGER NOT NULL,
+                gold INTEGER NOT NULL,
+                kills INTEGER NOT NULL,
+                cause TEXT,
+                died_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS fallen_class_level ON fallen (build_type, level DESC, gold DESC, id);
+            CREATE INDEX IF NOT EXISTS fallen_class_gold ON fallen (build_type, gold DESC, level DESC, id);
+            CREATE INDEX IF NOT EXISTS fallen_level ON fallen (level DESC, gold DESC, id);
+            CREATE INDEX IF NOT EXISTS fallen_gold ON fallen (gold DESC, level DESC, id);
+        """)
+    return _connection
+
+def sort_key(row, ranking):
+    """Key that sorts rows best first, ties going to the earlier death"""
+    first, second = RANKINGS[ranking]
+    return (-row[first], -row[second], row["id"])
+
+def record_death(warrior):
+    """Add a dead warrior to the hall of fame"""
+    with _lock:
+        connection = connect()
+        with connection:
+            connection.execute(
+                "INSERT INTO fallen (name, build_type, level, gold, kills, cause, died_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (warrior.name, warrior.build_type, warrior.level, warrior.gold,
+                 warrior.kills, warrior.cause_of_death, str(datetime.now()))
+            )
+        refresh()
+
+def refresh():
+    """Merge rows added since the last refresh into the cached top lists (hold _lock)"""
+    global _last_id
+    if _last_id is None:
+        # Nothing is cached yet, top lists are read off the indexes up to this row
+        _last_id = connect().execute("SELECT coalesce(max(id), 0) FROM fallen").fetchone()[0]
+        return
+    rows = [dict(row) for row in connect().execute("SELECT * FROM fallen WHERE id > ? ORDER BY id", (_last_id,))]
+    if not rows:
+        return
+    _last_id = rows[-1]["id"]
+    for (build_type, ranking), top in _top.items():
+        keys = [sort_key(row, ranking) for row in top]
+        for row in rows:
+            if build_type is not None and row["build_type"] != build_type:
+                continue
+            key = sort_key(row, ranking)
+            index = bisect.bisect(keys, key)
+            if index < CACHE_SIZE:
+                keys.insert(index, key)
+                top.insert(index, row)
+        del top[CACHE_SIZE:]
+
+def top_warriors(build_type=None, ranking="level", k=10):
+    """Best k fallen warriors of a class, or of every class, by level or gold"""
+    first, second = RANKINGS[ranking]
+    with _lock:
+        connection = connect()
+        refresh()
+        top = _top.get((build_type, ranking))
+        if top is None or k > CACHE_SIZE:
+            # Read straight off the index for this class and ranking
+            # Rows newer than _last_id are left for the next refresh() to merge,
+            # the unary plus keeps SQLite on the ranking index for this filter
+            where, params = ("build_type = ? AND", (build_type,)) if build_type is not None else ("", ())
+            top = [dict(row) for row in connection.execute(
+                f"SELECT * FROM fallen WHERE {where} +id <= ? ORDER BY {first} DESC, {second} DESC, id LIMIT ?",
+                (*params, _last_id, max(k, CACHE_SIZE))
+            )]
+            if k <= CACHE_SIZE:
+                _top[(build_type, ranking)] = top
+        return top[:k]
+
+def fallen_count():
+    """Number of warriors in the hall of fame"""
+    with _lock:
+        return connect().execute("SELECT count(*) FROM fallen").fetchone()[0]
@@ -1,12 +1,12 @@
 # mountains.py
 import streamlit as st
 from region import Region
-from region_configs import MOUNTAIN_CONFIG
+from content import get_region_config
 from utils import init_session
 
 def main():
     init_session()
-    mountains = Region(MOUNTAIN_CONFIG)
+    mountains = Region(get_region_config("mountain"))
     mountains.render()
 
 main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+# party_combat.py
+# Fights between parties of up to MAX_PARTY warriors and groups of enemies,
+# such as a Dire Wolf Pack of three wolves. Combatant stats are 2-D NumPy
+# arrays with one row per fight and one column per slot, so many fights
+# advance together and a round is the same handful of vector operations
+# for any party or group size. Region pages run one fight at a time, the
+# simulators thousands. The rules are those of the one-on-one combat in
+# encounters.py: every warrior makes a normal attack on the first enemy
+# still standing, then every enemy still standing attacks a random living
+# warrior, who may dodge it and counter. Like snapshot.py this module does
+# not import streamlit.
+import numpy as np
+
+MAX_PARTY = 4
+WARRIOR_STATS = ["health", "strength", "armour", "luck"]
+ENEMY_STATS = ["health", "strength", "armour"]
+
+_rng = np.random.default_rng()
+
+class Battles:
+    """Party against group fights, advancing one round at a time
+
+    party and enemies map stat names to arrays of shape (fights, slots):
+    WARRIOR_STATS for the party and ENEMY_STATS for the enemies. Slots
+    without health are empty, so parties and groups of different sizes
+    share one array. Fights that are won or lost stop being active, and
+    callers may deactivate others, e.g. when a party runs away.
+    """
+    def __init__(self, party, enemies, rng=None):
+        self.rng = rng or _rng
+        self.party = {stat: np.array(party[stat], dtype=np.int64, ndmin=2) for stat in WARRIOR_STATS}
+        self.enemies = {stat: np.array(enemies[stat], dtype=np.int64, ndmin=2) for stat in ENEMY_STATS}
+        if self.party["health"].shape[1] > MAX_PARTY:
+            raise ValueError(f"A party has at most {MAX_PARTY} warriors")
+        self.active = (self.party["health"] > 0).any(axis=1) & (self.enemies["health"] > 0).any(axis=1)
+
+    @property
+    def won(self):
+        return ~(self.enemies["health"] > 0).any(axis=1)
+
+    @property
+    def lost(self):
+        return ~(self.party["health"] > 0).any(axis=1)
+
+    @staticmethod
+    def damage(strength, armour, rolls):
+        """calculate_damage for arrays of attackers and defenders, with uniform rolls in [0, 1)"""
+        base = 3 + (rolls * 6).astype(np.int64) + strength
+        return np.maximum(1, base - (base * np.minimum(0.75, armour / 100)).astype(np.int64))
+
+    def round(self):
+        """Play one round of every active fight
+
+        Returns the damage each warrior dealt and took this round, as
+        arrays shaped like the party stats.
+        """
+        fights = np.flatnonzero(self.active)
+        dealt = np.zeros_like(self.party["health"])
+        taken = np.zeros_like(self.party["health"])
+        if not fights.size:
+            return dealt, taken
+        party, enemies = self.party, self.enemies
+        health, strength, armour, luck = (party[stat][fights] for stat in WARRIOR_STATS)
+        enemy_health, enemy_strength, enemy_armour = (enemies[stat][fights] for stat in ENEMY_STATS)
+        rows = np.arange(fights.size)[:, None]
+        standing = health > 0
+        # Every roll of the round in three draws: attack and crit per warrior,
+        # blow, dodge, counter and counter blow per enemy, victim choice
+        attack_rolls = self.rng.random((2,) + health.shape)
+        enemy_rolls = self.rng.random((4,) + enemy_health.shape)
+
+        # Warriors focus the first enemy still standing
+        target = (enemy_health > 0).argmax(axis=1)[:, None]
+        hits = self.damage(strength, enemy_armour[rows, target], attack_rolls[0])
+        crit = attack_rolls[1] < np.minimum(0.25, 0.05 + luck / 200)
+        hits = np.where(crit, hits * 2, hits) * standing
+        enemy_health[rows, target] -= hits.sum(axis=1, keepdims=True)
+
+        # Enemies left standing each pick a random living warrior
+        victim = (self.rng.random(enemy_health.shape + (health.shape[1],)) * standing[:, None, :]).argmax(axis=2)
+        victim_luck = luck[rows, victim]
+        dodge_chance = np.maximum(0.05, np.minimum(0.3, victim_luck / 150) - enemy_strength / 300)
+        landed = (enemy_health > 0) & (enemy_rolls[1] >= dodge_chance)
+        blows = self.damage(enemy_strength, armour[rows, victim], enemy_rolls[0]) * landed
+        countered = landed & (enemy_rolls[2] < victim_luck / 200)
+        counters = np.maximum(1, self.damage(strength[rows, victim], enemy_armour, enemy_rolls[3]) // 2) * countered
+        enemy_health -= counters
+
+        # Add up blows and counters per warrior slot, several enemies may pick the same warrior
+        slots = (rows * health.shape[1] + victim).ravel()
+        round_taken = np.bincount(slots, blows.ravel(), minlength=health.size).astype(np.int64).reshape(health.shape)
+        round_counters = np.bincount(slots, counters.ravel(), minlength=health.size).astype(np.int64).reshape(health.shape)
+        health -= round_taken
+
+        party["health"][fights] = health
+        enemies["health"][fights] = enemy_health
+        dealt[fights], taken[fights] = hits + round_counters, round_taken
+        self.active[fights] = (health > 0).any(axis=1) & (enemy_health > 0).any(axis=1)
+        return dealt, taken
+
+    def run(self, max_rounds=100):
+        """Play rounds until every fight is over or max_rounds were played"""
+        for _ in range(max_rounds):
+            if not self.active.any():
+                break
+            self.round()
+        return self
+
+def party_stats(warriors):
+    """Stats of one party of Warrior objects, as a single fight row"""
+    return {stat: [[getattr(warrior, stat) for warrior in warriors]] for stat in WARRIOR_STATS}
+
+def group_stats(enemy):
+    """Stats of an Enemy object, one slot per member of a group, as a single fight row"""
+    members = getattr(enemy, "members", None) or [enemy.health]
+    strength = getattr(enemy, "member_strength", enemy.strength)
+    return {
+        "health": [members],
+        "strength": [[strength] * len(members)],
+        "armour": [[enemy.armour] * len(members)]
+    }
+
+def table_groups(tables, rows):
+    """Stats of the enemies at some rows of tables.load_tables(), one fight row each
+
+    Groups get one slot per member, single enemies one slot and the rest
+    stay empty.
+    """
+    enemies = tables["enemies"]
+    size = np.asarray(enemies["group_size"][rows])
+    slots = np.arange(size.max(initial=1))[None, :] < size[:, None]
+    return {
+        "health": np.asarray(enemies["member_health"][rows])[:, None] * slots,
+        "strength": np.repeat(np.asarray(enemies["member_strength"][rows])[:, None], slots.shape[1], axis=1),
+        "armour": np.repeat(np.asarray(enemies["armour"][rows])[:, None], slots.shape[1], axis=1)
+    }
+
+def split_reward(amount, standing):
+    """Equal shares of a reward for the warriors still standing, the remainder to the first"""
+    count = max(1, int(np.count_nonzero(standing)))
+    shares = np.where(standing, amount // count, 0)
+    shares[np.argmax(standing)] += amount - shares.sum()
+    return shares
@@ -1,20 +1,22 @@
 # quest_board.py
 import streamlit as st
 from utils import warrior_profile
-from quest_config import QuestStatus, FOREST_QUESTS, MOUNTAIN_QUESTS
+from quest_config import QuestStatus, QuestLog
+from content import new_quest_log
 import random
+from timing import timed
 
 def initialize_quests():
     """Initialize quest tracking in session state"""
-    if 'quests' not in st.session_state:
-        st.session_state.quests = {}
-        
-    # Add any new quests that aren't in session state
-    all_quests = FOREST_QUESTS + MOUNTAIN_QUESTS
-    for quest in all_quests:
-        if quest.id not in st.session_state.quests:
-            st.session_state.quests[quest.id] = quest
+    quests = st.session_state.get('quests') or {}
+    
+    # Sessions from before quest logs hold a plain dict of Quest objects
+    if not isinstance(quests, QuestLog):
+        st.session_state.quests = new_quest_log(
+            (quest_id, quest.status.value, quest.progress) for quest_id, quest in quests.items()
+        )
 
+@timed("display_quest_board")
 def display_quest_board():
     """Display the quest board interface"""
     if not st.session_state.warrior:
@@ -1,6 +1,8 @@
 from enum import Enum
+import copy
 import streamlit as st
 from utils import Item, ItemType
+from telemetry import emit_gold
 
 class QuestType(Enum):
     KILL = "kill"           # Kill X number of specific enemies
@@ -107,6 +109,7 @@ class Quest:
         # Give rewards
         if "gold" in self.rewards:
             warrior.gold += self.rewards["gold"]
+            emit_gold("quest", self.rewards["gold"], warrior)
             st.toast(f"Received {self.rewards['gold']} gold!")
         
         if "xp" in self.rewards:
@@ -153,6 +156,90 @@ class Quest:
         
         return "Unknown progress"
     
+class QuestLog:
+    """One warrior's quests: the shared catalog plus (quest_id, status, progress) records
+
+    Quest objects are copied from the catalog the first time they are looked
+    up, so loading a save only reads the compact records. Game events only
+    need active() quests. Iterating every quest, as the quest board does,
+    copies them all.
+    """
+    def __init__(self, records=()):
+        self._records = {quest_id: (status, progress) for quest_id, status, progress in records}
+        self._quests = {}
+        self._catalog = None
+
+    @property
+    def catalog(self):
+        # Kept per log, as every cached lookup hashes its arguments
+        if self._catalog is None:
+            from content import get_quest_catalog  # Import at function level to avoid circular imports
+            self._catalog = get_quest_catalog()
+        return self._catalog
+
+    def __getitem__(self, quest_id):
+        quest = self._quests.get(quest_id)
+        if quest is None:
+            quest = copy.copy(self.catalog[quest_id])
+            status, progress = self._records.pop(quest_id, (QuestStatus.AVAILABLE.value, {}))
+            quest.status = QuestStatus(status)
+            quest.progress = dict(progress)
+            self._quests[quest_id] = quest
+        return quest
+
+    def __setitem__(self, quest_id, quest):
+        self._records.pop(quest_id, None)
+        self._quests[quest_id] = quest
+
+    def __contains__(self, quest_id):
+        return quest_id in self._quests or quest_id in self.catalog
+
+    def __iter__(self):
+        catalog = self.catalog
+        yield from catalog
+        yield from (quest_id for quest_id in self._quests if quest_id not in catalog)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def keys(self):
+        return list(self)
+
+    def active(self):
+        """Quests in progress, copying only those whose record says active"""
+        active = QuestStatus.ACTIVE.value
+        for quest_id in [quest_id for quest_id, (status, progress) in self._records.items() if status == active]:
+            self[quest_id]
+        return [quest for quest in self._quests.values() if quest.status == QuestStatus.ACTIVE]
+
+    def values(self):
+        quests = self._quests
+        return [quests.get(quest_id) or self[quest_id] for quest_id in self]
+
+    def items(self):
+        return [(quest_id, self[quest_id]) for quest_id in self]
+
+    def records(self):
+        """Compact (quest_id, status, progress) records of every quest that was started"""
+        records = [
+            (quest_id, status, dict(progress)) for quest_id, (status, progress) in self._records.items()
+            if quest_id in self.catalog  # quests removed from the game are dropped
+        ]
+        records.extend(
+            (quest_id, quest.status.value, dict(quest.progress)) for quest_id, quest in self._quests.items()
+            if quest.status != QuestStatus.AVAILABLE or quest.progress
+        )
+        return sorted(records, key=lambda record: record[0])
+
+    def __reduce__(self):
+        return QuestLog, (self.records(),)
+
+def active_quests(quests):
+    """Active quests of a QuestLog, or of the plain dict a session starts with"""
+    if isinstance(quests, QuestLog):
+        return quests.active()
+    return [quest for quest in quests.values() if quest.status == QuestStatus.ACTIVE]
+
 def create_reward_item(item_name):
     """Create an item object from a reward item name"""
     reward_items = {
@@ -1,8 +1,10 @@
 import streamlit as st
-from utils import init_session, warrior_profile, area, Enemy
-from encounters import generate_encounter, handle_chest, handle_blessing, handle_trap, handle_combat
-from quest_config import QuestStatus, QuestType
+from utils import warrior_profile, Enemy
+from encounters import generate_encounter, handle_chest, handle_blessing, handle_trap, handle_combat, display_auto_battle_log, auto_resolve_combat, get_auto_policy
+from quest_config import QuestStatus, QuestType, active_quests
 import random
+from timing import timed
+from adventure_log import display_adventure_log
 
 class Region:
     def __init__(self, config):
@@ -27,13 +29,17 @@ class Region:
         return True
 
     def handle_area_selection(self, area_name, difficulty):
-        warrior = st.session_state.warrior
+        encounter_type = self.resolve_encounter(area_name, difficulty)
+        return encounter_type == "enemy" or st.session_state.warrior.status == "Dead"
+
+    def resolve_encounter(self, area_name, difficulty):
+        """Record the area visit and roll one encounter, returning its type"""
         area_id = f"{area_name}_{difficulty}"
         
         # Record area visit first, before any encounters
         if 'quests' in st.session_state:
-            for quest in st.session_state.quests.values():
-                if quest.status == QuestStatus.ACTIVE and quest.quest_type == QuestType.EXPLORE:
+            for quest in active_quests(st.session_state.quests):
+                if quest.quest_type == QuestType.EXPLORE:
                     if area_id in quest.requirements["areas"]:
                         if not quest.progress.get(area_id, False):  # Only update if not already visited
                             quest.progress[area_id] = True
@@ -49,12 +55,12 @@ class Region:
                                 st.toast(f"🎯 Quest Complete: {quest.title}!")
         
         # Generate and handle encounter
+        st.session_state.auto_battle_log = []
         encounter_type = generate_encounter()
         st.session_state.combat_log.append(self.config['area_messages'][difficulty])
         
         if encounter_type == "enemy":
             st.session_state.current_enemy = Enemy(f"{area_name}_{difficulty}")
-            return True
         elif encounter_type == "chest":
             message = handle_chest(difficulty, area_name)
             st.session_state.combat_log.append(message)
@@ -64,11 +70,91 @@ class Region:
         elif encounter_type == "trap":
             message = handle_trap(area_name)
             st.session_state.combat_log.append(message)
+        
+        return encounter_type
+
+    def run_expedition(self, difficulty, encounters, stop_below=0.3, max_items=100, policy=None):
+        """Chain several encounters in one area, auto-resolving every fight
+
+        Stops early when health drops below stop_below of max health, when
+        the inventory holds max_items, or when the warrior dies. The full
+        log goes to st.session_state.expedition_log and a summary line to
+        the adventure log.
+        """
+        warrior = st.session_state.warrior
+        log = st.session_state.combat_log
+        start = len(log)
+        start_health, start_gold, start_items, start_level = (
+            warrior.health, warrior.gold, len(warrior.inventory), warrior.level
+        )
+        counts = {"enemy": 0, "chest": 0, "blessing": 0, "trap": 0}
+        stop_reason = "expedition complete"
+        
+        for _ in range(encounters):
+            if warrior.health < warrior.max_health * stop_below:
+                stop_reason = "health too low to continue"
+                break
+            if len(warrior.inventory) >= max_items:
+                stop_reason = "inventory full"
+                break
+            
+            encounter_type = self.resolve_encounter(self.config['name'], difficulty)
+            counts[encounter_type] += 1
+            if encounter_type == "enemy":
+                auto_resolve_combat(policy)
             if warrior.status == "Dead":
-                return True
+                stop_reason = "you were slain"
+                break
+        
+        st.session_state.expedition_log = log[start:]
+        st.session_state.auto_battle_log = []
+        del log[start:]
         
-        return False
+        area_title = next(area for area, diff in self.config['areas'] if diff == difficulty)
+        encounter_text = ", ".join(f"{count} {kind}" for kind, count in counts.items() if count)
+        details = [
+            f"{warrior.health - start_health:+d} health",
+            f"{warrior.gold - start_gold:+d} gold",
+            f"{len(warrior.inventory) - start_items:+d} items"
+        ]
+        if warrior.level > start_level:
+            details.append(f"reached level {warrior.level}")
+        log.append(
+            f"🧭 Expedition to {area_title}: {encounter_text or 'no encounters'} "
+            f"({', '.join(details)}) - {stop_reason}"
+        )
+
+    def display_expedition_controls(self):
+        """Settings and start button for a multi-encounter expedition"""
+        with st.expander("🧭 Expedition"):
+            areas = dict((difficulty, area) for area, difficulty in self.config['areas'])
+            st.selectbox(
+                "Area", list(areas), format_func=lambda difficulty: areas[difficulty],
+                key=f"{self.config['name']}_expedition_area"
+            )
+            st.slider("Encounters", 1, 25, 10, key="expedition_encounters")
+            st.slider("Return to town below % health", 0, 100, 30, key="expedition_stop_below")
+            st.number_input("Return when carrying this many items", min_value=1, value=100, key="expedition_max_items")
+            st.button("Set out", use_container_width=True, on_click=self.start_expedition)
 
+    def start_expedition(self):
+        """Run an expedition with the player's current expedition settings"""
+        self.run_expedition(
+            st.session_state[f"{self.config['name']}_expedition_area"],
+            st.session_state.expedition_encounters,
+            st.session_state.expedition_stop_below / 100,
+            st.session_state.expedition_max_items,
+            get_auto_policy()
+        )
+
+    def display_expedition_log(self):
+        """Show the entries of the last expedition in a collapsible log"""
+        entries = st.session_state.get("expedition_log")
+        if entries:
+            with st.expander(f"Expedition log ({len(entries)} entries)"):
+                st.markdown("  \n".join(entries))
+
+    @timed("Region.render")
     def render(self):
         if not self.check_requirements():
             return
@@ -82,23 +168,33 @@ class Region:
             if not st.session_state.current_enemy:
                 st.markdown(random.choice(self.config['welcome_messages']))
                 st.subheader("Choose an area to explore")
+                hints = None
+                if st.toggle("Show expected outcomes", key="area_hints",
+                             help="Average gold, XP, health change and chance of death per click, for your current stats"):
+                    from expectations import region_expectations, describe  # Loads NumPy, only once hints are shown
+                    hints = region_expectations(st.session_state.warrior, self.config)
 
                 area_cols = st.columns(len(self.config['areas']))
                 for col, (area_name, difficulty) in zip(area_cols, self.config['areas']):
                     with col:
                         st.image(f"images/{self.config['area_image_prefix']}_{difficulty}.png", use_container_width=True)
                         if st.button(f"{area_name} ({difficulty.title()})", key=f"{self.config['name']}_{difficulty}", use_container_width=True):
+                            st.session_state.expedition_log = []
                             needs_rerun = self.handle_area_selection(self.config['name'], difficulty)
                             if needs_rerun:
                                 st.rerun()
+                        if hints:
+                            st.caption(describe(hints[difficulty]))
+
+                self.display_expedition_controls()
 
             if st.session_state.current_enemy:
                 handle_combat()
+            else:
+                display_auto_battle_log()
+                self.display_expedition_log()
 
-            if st.session_state.combat_log:
-                st.subheader("Adventure Log")
-                for log in reversed(st.session_state.combat_log):
-                    st.write(log)
+            display_adventure_log()
 
         with right:
             st.image(self.config['side_image'], use_container_width=True)
\ No newline at end of file
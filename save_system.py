@@ -2,43 +2,253 @@ import json
 import base64
 import pickle
 import os
+import threading
+import time
 from datetime import datetime
 import streamlit as st
+from timing import timed
 
-def save_warrior(warrior):
-    """Save warrior to file"""
+# Game state of sessions evicted while idle, see sessions.py
+PARKED_DIR = os.path.join("saves", "sessions")
+
+# Autosaves append what changed to saves/<name>.journal and only write a full
+# snapshot every JOURNAL_COMPACT_EVERY records, or once the journal has
+# grown bigger than the snapshot. Each snapshot has a new
+# generation and journal records only replay onto the snapshot they extend.
+# Quests are saved next to the warrior as (quest_id, status, progress)
+# records, see QuestLog in quest_config.py.
+JOURNAL_COMPACT_EVERY = 50
+
+_journal_lock = threading.Lock()
+_baselines = {}  # warrior name -> what the files on disk hold, as pickled pieces
+
+def journal_state(warrior):
+    """Pickled fields and inventory entries that journal records are diffed against"""
+    fields = {
+        name: pickle.dumps(value) for name, value in warrior.__dict__.items()
+        if name not in ("inventory", "dirty")
+    }
+    inventory = {key: pickle.dumps(value) for key, value in warrior.inventory.entries().items()}
+    return fields, inventory
+
+def quest_state(quests):
+    """Started quests of a quest log as {quest_id: [status, progress]}, or None without one"""
+    if quests is None or isinstance(quests, dict):
+        return None  # no quest log yet, e.g. a session from before quest logs
+    return {quest_id: [status, progress] for quest_id, status, progress in quests.records()}
+
+def encode_snapshot(warrior, quests=None, journal=True):
+    """Pickle a whole warrior under a new generation, returning (data, generation, quests)
+
+    Without journal the next autosave starts over with a snapshot, which
+    spares direct saves the cost of the per-entry baseline.
+    """
+    data = pickle.dumps(warrior)
+    generation = os.urandom(8).hex()
+    fields, inventory = journal_state(warrior) if journal else (None, None)
+    quest_records = quest_state(quests)
+    with _journal_lock:
+        _baselines[warrior.name] = {
+            "generation": generation, "fields": fields, "inventory": inventory, "quests": quest_records,
+            "records": 0, "journal_bytes": 0, "snapshot_bytes": len(data)
+        }
+    return data, generation, quest_records
+
+def quests_changed(name, quests):
+    """Whether a quest log differs from what the saves of a warrior hold"""
+    if quests is None or isinstance(quests, dict):
+        return False
+    with _journal_lock:
+        baseline = _baselines.get(name)
+    return baseline is None or baseline["quests"] != quest_state(quests)
+
+def encode_changes(warrior, quests=None):
+    """What to write for a changed warrior and quest log
+
+    Returns ("snapshot", (data, generation, quests)), ("delta", record) or
+    ("unchanged", None) when nothing that is saved differs.
+    """
+    current_quests = quest_state(quests)
+    with _journal_lock:
+        baseline = _baselines.get(warrior.name)
+    if (baseline is None or baseline["fields"] is None or baseline["records"] >= JOURNAL_COMPACT_EVERY
+            or baseline["journal_bytes"] > baseline["snapshot_bytes"]
+            or (current_quests is not None and baseline["quests"] is None)):
+        return "snapshot", encode_snapshot(warrior, quests)
+
+    fields = {}
+    if warrior.needs_save():
+        for name, value in warrior.__dict__.items():
+            if name in ("inventory", "dirty"):
+                continue
+            data = pickle.dumps(value)
+            if baseline["fields"].get(name) != data:
+                fields[name] = baseline["fields"][name] = data
+    inventory = {}
+    if warrior.inventory.dirty:
+        current = {key: pickle.dumps(value) for key, value in warrior.inventory.entries().items()}
+        inventory = {key: data for key, data in current.items() if baseline["inventory"].get(key) != data}
+        inventory.update((key, None) for key in baseline["inventory"].keys() - current.keys())
+        baseline["inventory"] = current
+    quest_changes = {}
+    if current_quests is not None:
+        quest_changes = {
+            quest_id: record for quest_id, record in current_quests.items()
+            if baseline["quests"].get(quest_id) != record
+        }
+        quest_changes.update((quest_id, None) for quest_id in baseline["quests"].keys() - current_quests.keys())
+        baseline["quests"] = current_quests
+    if not fields and not inventory and not quest_changes:
+        return "unchanged", None
+    baseline["records"] += 1
+    baseline["journal_bytes"] += (sum(map(len, fields.values())) + sum(len(data or b"") for data in inventory.values())
+                                  + len(json.dumps(quest_changes)))
+    return "delta", {
+        "generation": baseline["generation"], "fields": fields, "inventory": inventory, "quests": quest_changes
+    }
+
+def is_current(name, generation):
+    """Whether a snapshot or record still belongs to the newest generation of a warrior"""
+    with _journal_lock:
+        baseline = _baselines.get(name)
+    return baseline is None or baseline["generation"] == generation
+
+@timed("save_warrior")
+def save_warrior(warrior, quests=None):
+    """Save warrior to file, with its quest log if given"""
+    write_save(warrior.name, *encode_snapshot(warrior, quests, journal=False))
+
+def write_save(name, warrior_data, generation=None, quests=None):
+    """Write an already pickled warrior to its save file, starting a new journal"""
+    if generation is not None and not is_current(name, generation):
+        return  # a newer snapshot was taken since this one was queued
     if not os.path.exists('saves'):
         os.makedirs('saves')
         
-    warrior_data = pickle.dumps(warrior)
     encoded_data = base64.b64encode(warrior_data).decode('utf-8')
     
-    with open(f"saves/{warrior.name}.json", "w") as f:
+    # Write aside and swap in, so a reader never sees half a save
+    temp_path = f"saves/{name}.json.{threading.get_ident()}.tmp"
+    with open(temp_path, "w") as f:
         json.dump({
-            "name": warrior.name,
+            "name": name,
             "data": encoded_data,
-            "date": str(datetime.now())
+            "date": str(datetime.now()),
+            "generation": generation,
+            "quests": [[quest_id, *record] for quest_id, record in quests.items()] if quests is not None else None
         }, f)
+    os.replace(temp_path, f"saves/{name}.json")
+    if os.path.exists(f"saves/{name}.journal"):
+        os.remove(f"saves/{name}.journal")
 
-def load_warrior(filename):
-    """Load warrior from file"""
+def append_journal(name, record):
+    """Append one record from encode_changes to a warrior's journal"""
+    if not is_current(name, record["generation"]):
+        return
+    encode = lambda data: base64.b64encode(data).decode('utf-8') if data is not None else None
+    line = json.dumps({
+        "generation": record["generation"],
+        "fields": {field: encode(data) for field, data in record["fields"].items()},
+        "inventory": {key: encode(data) for key, data in record["inventory"].items()},
+        "quests": record["quests"]
+    })
+    with open(f"saves/{name}.journal", "a") as f:
+        f.write(line + "\n")
+
+def merge_records(older, newer):
+    """One journal record with the changes of two consecutive ones"""
+    return {
+        "generation": newer["generation"],
+        "fields": {**older["fields"], **newer["fields"]},
+        "inventory": {**older["inventory"], **newer["inventory"]},
+        "quests": {**older["quests"], **newer["quests"]}
+    }
+
+@timed("load_warrior")
+def load_save(filename):
+    """Load warrior and quest records from file, replaying its journal onto the snapshot
+
+    The quest records are None for saves written before quests were saved.
+    """
     with open(f"saves/{filename}", "r") as f:
         save_data = json.load(f)
     
     warrior_data = base64.b64decode(save_data["data"])
-    return pickle.loads(warrior_data)
+    warrior = pickle.loads(warrior_data)
+    quests = save_data.get("quests")
+    if quests is not None:
+        quests = {quest_id: [status, progress] for quest_id, status, progress in quests}
+    
+    journal_path = f"saves/{save_data['name']}.journal"
+    if save_data.get("generation") and os.path.exists(journal_path):
+        with open(journal_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # the last line was cut off mid-write
+                if record["generation"] != save_data["generation"]:
+                    continue
+                for field, data in record["fields"].items():
+                    warrior.__dict__[field] = pickle.loads(base64.b64decode(data))
+                for key, data in record["inventory"].items():
+                    warrior.inventory.set_entry(key, pickle.loads(base64.b64decode(data)) if data else None)
+                if quests is not None:
+                    for quest_id, quest_record in record.get("quests", {}).items():
+                        if quest_record is None:
+                            quests.pop(quest_id, None)
+                        else:
+                            quests[quest_id] = quest_record
+        warrior.mark_saved()
+    if quests is not None:
+        quests = [(quest_id, status, progress) for quest_id, (status, progress) in quests.items()]
+    return warrior, quests
+
+def load_warrior(filename):
+    """Load warrior from file, replaying its journal onto the snapshot"""
+    return load_save(filename)[0]
 
 def add_save_load_ui():
     """Add save/load buttons to sidebar"""
     st.sidebar.subheader("💾 Save/Load")
     
     if st.sidebar.button("Save Game"):
-        save_warrior(st.session_state.warrior)
+        save_warrior(st.session_state.warrior, st.session_state.get("quests"))
         st.sidebar.success("Game saved!")
     
     save_files = [f for f in os.listdir("saves") if f.endswith('.json')]
     if save_files:
         selected_save = st.sidebar.selectbox("Load Game", save_files)
         if st.sidebar.button("Load Selected Save"):
-            st.session_state.warrior = load_warrior(selected_save)
-            st.rerun()
\ No newline at end of file
+            st.session_state.warrior, quests = load_save(selected_save)
+            if quests is not None:
+                # Imported here as content imports utils, which imports this module
+                from content import new_quest_log
+                st.session_state.quests = new_quest_log(quests)
+            st.rerun()
+
+def park_session(session_id, state):
+    """Write a session's game state aside while it is evicted from memory"""
+    os.makedirs(PARKED_DIR, exist_ok=True)
+    with open(os.path.join(PARKED_DIR, f"{session_id}.pkl"), "wb") as f:
+        pickle.dump(state, f)
+
+def unpark_session(session_id):
+    """Read back and remove a parked session's game state, or None"""
+    path = os.path.join(PARKED_DIR, f"{session_id}.pkl")
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    os.remove(path)
+    return state
+
+def remove_stale_parked(max_age):
+    """Delete parked state older than max_age seconds"""
+    if not os.path.exists(PARKED_DIR):
+        return
+    cutoff = time.time() - max_age
+    for name in os.listdir(PARKED_DIR):
+        path = os.path.join(PARKED_DIR, name)
+        if os.path.getmtime(path) < cutoff:
+            os.remove(path)
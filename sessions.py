@@ -0,0 +1,140 @@
+# sessions.py
+# Memory accounting and idle eviction for player sessions. Every rerun
+# touches its session here. Sessions that stay idle for IDLE_AFTER seconds
+# get their game state autosaved and parked on disk, and the in-memory copy is
+# replaced with empty defaults. The state is put back on the next rerun of
+# that session, before any page runs.
+import pickle
+import threading
+import time
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from save_system import save_warrior, park_session, unpark_session, remove_stale_parked
+
+IDLE_AFTER = 15 * 60  # seconds
+SWEEP_INTERVAL = 60  # seconds
+PARKED_TTL = 24 * 60 * 60  # parked state of sessions that never came back
+
+# Game state kept per session and the empty value it is evicted to
+GAME_STATE = {
+    "warrior": None,
+    "quests": {},
+    "combat_log": [],
+    "adventure_log": None,  # rendered pages of combat_log, see adventure_log.py
+    "current_enemy": None,
+    "auto_battle_log": [],
+    "expedition_log": []
+}
+
+class SessionRecord:
+    def __init__(self, state):
+        self.state = state
+        self.last_seen = time.time()
+        self.evicted = False
+        # Held while the state is parked or put back, so a rerun that comes
+        # in mid-eviction waits for the parked copy instead of missing it
+        self.lock = threading.Lock()
+
+_lock = threading.Lock()
+_sessions = {}
+_next_sweep = time.monotonic() + SWEEP_INTERVAL
+
+def touch_session():
+    """Mark this session active, restoring its state if it was evicted"""
+    global _next_sweep
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    # ctx.session_state is a per-run wrapper around the SessionState that
+    # lives as long as the browser session
+    state = ctx.session_state._state
+    with _lock:
+        record = _sessions.get(ctx.session_id)
+        if record is None or record.state is not state:
+            record = _sessions[ctx.session_id] = SessionRecord(state)
+        record.last_seen = time.time()
+        due = time.monotonic() >= _next_sweep
+        if due:
+            _next_sweep = time.monotonic() + SWEEP_INTERVAL
+    with record.lock:
+        if record.evicted:
+            rehydrate(ctx.session_id, state)
+            record.evicted = False
+    if due:
+        evict_idle_sessions()
+
+def rehydrate(session_id, state):
+    """Put back the game state parked for a session"""
+    parked = unpark_session(session_id)
+    if parked:
+        for key, value in parked.items():
+            state[key] = value
+
+def evict(session_id, state):
+    """Autosave and park a session's game state, leaving empty defaults"""
+    warrior = state["warrior"] if "warrior" in state else None
+    if warrior is not None:
+        save_warrior(warrior, state["quests"] if "quests" in state else None)
+    park_session(session_id, {key: state[key] for key in GAME_STATE if key in state})
+    for key, empty in GAME_STATE.items():
+        state[key] = type(empty)() if empty is not None else None
+
+def is_active(session_id):
+    """Whether Streamlit still holds the session (always true without a server, e.g. in AppTest)"""
+    return not Runtime.exists() or Runtime.instance().is_active_session(session_id)
+
+def evict_idle_sessions(idle_after=IDLE_AFTER):
+    """Evict every session idle for longer than idle_after seconds, returning how many"""
+    now = time.time()
+    idle = []
+    with _lock:
+        for session_id, record in list(_sessions.items()):
+            state = record.state
+            if not is_active(session_id):
+                # Streamlit closed the session, let its state go
+                del _sessions[session_id]
+            elif not record.evicted and now - record.last_seen > idle_after:
+                # Sessions without a warrior have nothing worth parking
+                if "warrior" in state and state["warrior"] is not None:
+                    idle.append((session_id, record))
+    evicted = 0
+    for session_id, record in idle:
+        with record.lock:
+            # The session may have rerun since it was picked
+            if record.evicted or time.time() - record.last_seen <= idle_after:
+                continue
+            evict(session_id, record.state)
+            record.evicted = True
+            evicted += 1
+    remove_stale_parked(PARKED_TTL)
+    return evicted
+
+def session_footprint(state):
+    """Pickled size in bytes of each part of a session's game state"""
+    sizes = {}
+    for key in GAME_STATE:
+        if key in state:
+            try:
+                sizes[key] = len(pickle.dumps(state[key]))
+            except Exception:
+                sizes[key] = 0  # e.g. a value from a module that was reloaded
+    return sizes
+
+def get_session_stats():
+    """Footprint, idle time and status of every live session"""
+    now = time.time()
+    with _lock:
+        records = [(session_id, record, record.state) for session_id, record in _sessions.items()]
+    rows = []
+    for session_id, record, state in records:
+        sizes = session_footprint(state)
+        warrior = state["warrior"] if "warrior" in state else None
+        rows.append({
+            "session": session_id[:8],
+            "warrior": warrior.name if warrior is not None else "",
+            "idle_s": int(now - record.last_seen),
+            "evicted": record.evicted,
+            "total_kb": sum(sizes.values()) / 1024,
+            **{f"{key}_kb": size / 1024 for key, size in sizes.items()}
+        })
+    return sorted(rows, key=lambda row: row["total_kb"], reverse=True)
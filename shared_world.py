@@ -0,0 +1,401 @@
+# shared_world.py
+# One world shared by every session of the server: shop items in limited
+# stock, world bosses with a single health pool and a feed of chat messages
+# and events. The world is an immutable World value behind a module
+# variable. Readers take the current value without locking, so hundreds of
+# sessions can poll it on every rerun. Writers hold a lock only to build the
+# next value and swap it in. Feed posts are queued and published in batches
+# by a background thread every FLUSH_INTERVAL seconds.
+#
+# Set WARRIORS_WORLD_DB to a SQLite file, e.g. saves/world.db, to share the
+# world between server processes as well. Purchases are then claimed from
+# the database straight away, so limited stock is exact across processes.
+# Boss hits and posts stay batched: the thread pushes the ones made by this
+# process in one transaction and pulls everyone else's. Between syncs each
+# process decides killing blows on its own copy, so two processes can both
+# see their warrior land the killing blow within one interval. Like
+# snapshot.py this module does not import streamlit.
+import atexit
+import functools
+import os
+import threading
+import time
+from snapshot import load_snapshot
+
+FLUSH_INTERVAL = 1.0  # seconds between feed batches and database syncs
+FEED_SIZE = 100       # newest feed entries kept in the world
+MAX_MESSAGE = 200     # characters kept of a chat message
+MAX_PENDING = 1000    # posts held in memory before new ones are dropped
+
+# Set WARRIORS_WORLD_DB to share the world between server processes
+WORLD_DB = os.environ.get("WARRIORS_WORLD_DB")
+
+@functools.lru_cache(maxsize=None)
+def config():
+    """Stock limits, restock interval and world bosses from the content snapshot"""
+    snapshot = load_snapshot()
+    return snapshot["stock_limits"], snapshot["restock_interval"], snapshot["world_bosses"]
+
+class World:
+    """One state of the shared world, never changed once published
+
+    stock maps limited shop items to the quantity left. bosses map world
+    boss names to their health, life (how often they spawned), died_at and
+    damage dealt by each warrior this life. feed holds the newest
+    (id, t, kind, author, text) entries, oldest first.
+    """
+    __slots__ = ("version", "stock", "restocked", "bosses", "feed", "due")
+
+    def __init__(self, version, stock, restocked, bosses, feed):
+        self.version = version
+        self.stock = stock
+        self.restocked = restocked
+        self.bosses = bosses
+        self.feed = feed
+        # When the shop restocks or the first slain boss returns
+        limits, interval, configs = config()
+        self.due = min([restocked + interval] + [
+            boss["died_at"] + configs[name]["respawn"]
+            for name, boss in bosses.items() if boss["died_at"] is not None
+        ])
+
+    def replace(self, **changes):
+        """A copy with some fields changed and the next version number"""
+        fields = {name: getattr(self, name) for name in ("stock", "restocked", "bosses", "feed")}
+        fields.update(changes)
+        return World(self.version + 1, **fields)
+
+_lock = threading.Lock()       # held to swap in a new world, never by readers
+_sync_lock = threading.Lock()  # held while talking to WORLD_DB, taken before _lock
+_world = None
+_changes = []  # boss hits not pushed to WORLD_DB yet
+_posts = []    # (t, kind, author, text) not published yet
+_dropped = 0
+_next_id = 1   # next feed id, in-process worlds only
+_last_id = 0   # newest feed row read from WORLD_DB
+_connection = None
+_thread = None
+
+def spawn(boss_config, life):
+    return {"health": boss_config["health"], "life": life, "died_at": None, "damage": {}}
+
+def new_world(now):
+    """A fresh world: full stock and every boss at full health"""
+    limits, interval, configs = config()
+    return World(0, dict(limits), now, {name: spawn(boss, 1) for name, boss in configs.items()}, ())
+
+def renew(world, now):
+    """The world with the shop restocked and slain bosses back, once due"""
+    if now < world.due:
+        return world
+    limits, interval, configs = config()
+    changes = {}
+    if now >= world.restocked + interval:
+        changes["stock"], changes["restocked"] = dict(limits), now
+    bosses = {
+        name: spawn(configs[name], boss["life"] + 1)
+        if boss["died_at"] is not None and now >= boss["died_at"] + configs[name]["respawn"] else boss
+        for name, boss in world.bosses.items()
+    }
+    if bosses != world.bosses:
+        changes["bosses"] = bosses
+    return world.replace(**changes)
+
+def apply_change(world, change):
+    """The world after a purchase or hit, or None when it can no longer happen"""
+    if change[0] == "buy":
+        _, item, quantity = change
+        left = world.stock.get(item, 0)
+        if left < quantity:
+            return None
+        return world.replace(stock={**world.stock, item: left - quantity})
+    _, name, life, warrior, damage, t = change
+    boss = world.bosses.get(name)
+    if boss is None or boss["life"] != life or boss["health"] <= 0:
+        return None
+    dealt = min(damage, boss["health"])
+    health = boss["health"] - dealt
+    boss = {
+        "health": health,
+        "life": life,
+        "died_at": t if health <= 0 else None,
+        "damage": {**boss["damage"], warrior: boss["damage"].get(warrior, 0) + dealt}
+    }
+    return world.replace(bosses={**world.bosses, name: boss})
+
+def current():
+    """The world as it is now, without waiting on writers"""
+    world = _world
+    if world is None:
+        world = _load()
+    if time.time() >= world.due:
+        world = _renewed()
+    return world
+
+def _load():
+    """The first world of this process, read from WORLD_DB when set"""
+    global _world
+    with _sync_lock:
+        if _world is None:
+            world = exchange([], []) if WORLD_DB else new_world(time.time())
+            with _lock:
+                _world = world
+                if WORLD_DB:
+                    _start()  # other processes' changes arrive even while this one only reads
+    return _world
+
+def _renewed():
+    global _world
+    with _lock:
+        _world = renew(_world, time.time())
+        return _world
+
+def _change(change, push=True):
+    """Apply a change now, returning the worlds before and after it, or None if it failed"""
+    global _world
+    current()
+    with _lock:
+        before = renew(_world, time.time())
+        after = apply_change(before, change)
+        if after is None:
+            return None
+        _world = after
+        if WORLD_DB and push:
+            _changes.append(change)
+            _start()
+    return before, after
+
+def stock_left(item_name):
+    """Items of a kind the shop has left, or None when its stock is unlimited"""
+    return current().stock.get(item_name)
+
+def buy_stock(item_name, quantity=1):
+    """Take items from the shared stock, False if too few are left"""
+    global _world
+    if item_name not in current().stock:
+        return True
+    if not WORLD_DB:
+        return _change(("buy", item_name, quantity)) is not None
+    with _sync_lock:
+        connection = connect()
+        with connection:
+            claimed = connection.execute(
+                "UPDATE stock SET quantity = quantity - ? WHERE item = ? AND quantity >= ?",
+                (quantity, item_name, quantity)
+            ).rowcount
+    if claimed:
+        # Other processes' sales may not have arrived here yet, so take the full
+        # quantity off without going below zero; the next sync corrects the count
+        with _lock:
+            world = renew(_world, time.time())
+            _world = world.replace(stock={**world.stock, item_name: max(0, world.stock.get(item_name, 0) - quantity)})
+    return bool(claimed)
+
+def hit_boss(name, warrior_name, damage):
+    """Deal damage to a world boss, returning the damage dealt and whether this hit slew it
+
+    Nothing is dealt to a boss that is already slain.
+    """
+    life = current().bosses[name]["life"]
+    worlds = _change(("hit", name, life, warrior_name, damage, time.time()))
+    if worlds is None:
+        return 0, False
+    before, after = worlds
+    health = after.bosses[name]["health"]
+    return before.bosses[name]["health"] - health, health <= 0
+
+def post(text, kind="event", author=None):
+    """Queue a feed entry, kind "chat" for a message from author or "event" for news"""
+    global _dropped
+    with _lock:
+        if len(_posts) >= MAX_PENDING:
+            _dropped += 1
+            return
+        _posts.append((time.time(), kind, author, text[:MAX_MESSAGE]))
+        _start()
+
+def feed_since(entry_id=0):
+    """Feed entries newer than an entry id, oldest first"""
+    feed = current().feed
+    start = len(feed)
+    while start and feed[start - 1][0] > entry_id:
+        start -= 1
+    return feed[start:]
+
+def _start():
+    """Start the background thread on first use (hold _lock)"""
+    global _thread
+    if _thread is None:
+        _thread = threading.Thread(target=_flush_loop, name="shared-world", daemon=True)
+        _thread.start()
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        flush_world()
+
+def flush_world():
+    """Publish queued posts now, syncing with WORLD_DB when set"""
+    global _world, _posts, _next_id
+    if _world is None and not _posts:
+        return  # never used by this process
+    if WORLD_DB:
+        sync()
+        return
+    current()
+    with _lock:
+        posts, _posts = _posts, []
+        if not posts:
+            return
+        entries = tuple((_next_id + index,) + entry for index, entry in enumerate(posts))
+        _next_id += len(entries)
+        _world = _world.replace(feed=(_world.feed + entries)[-FEED_SIZE:])
+
+def sync():
+    """Push changes and posts to WORLD_DB in one transaction and pull the shared world back"""
+    global _world, _changes, _posts
+    with _sync_lock:
+        with _lock:
+            changes, _changes = _changes, []
+            posts, _posts = _posts, []
+        try:
+            world = exchange(changes, posts)
+        except Exception:
+            # Database busy or gone, keep everything for the next sync
+            with _lock:
+                _changes = changes + _changes
+                _posts = posts + _posts
+            return
+        with _lock:
+            # Changes made while the database was busy, not pushed yet
+            for change in _changes:
+                world = apply_change(world, change) or world
+            _world = world
+
+def connect():
+    """Shared connection to WORLD_DB, creating and filling the tables"""
+    global _connection
+    if _connection is None:
+        import sqlite3  # Only loaded when the world is shared between processes
+        directory = os.path.dirname(WORLD_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _connection = sqlite3.connect(WORLD_DB, check_same_thread=False, timeout=FLUSH_INTERVAL)
+        _connection.execute("PRAGMA journal_mode=WAL")  # readers in other processes never wait on a sync
+        _connection.executescript("""
+            CREATE TABLE IF NOT EXISTS stock (item TEXT PRIMARY KEY, quantity INTEGER NOT NULL, restocked REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS bosses (name TEXT PRIMARY KEY, health INTEGER NOT NULL, life INTEGER NOT NULL, died_at REAL);
+            CREATE TABLE IF NOT EXISTS boss_damage (
+                name TEXT, life INTEGER, warrior TEXT, damage INTEGER NOT NULL, PRIMARY KEY (name, life, warrior)
+            );
+            CREATE TABLE IF NOT EXISTS feed (id INTEGER PRIMARY KEY, t REAL NOT NULL, kind TEXT NOT NULL, author TEXT, text TEXT NOT NULL);
+        """)
+        seed(_connection)
+    return _connection
+
+def seed(connection):
+    """Add rows for limited items and bosses the database does not have yet"""
+    limits, interval, configs = config()
+    now = time.time()
+    with connection:
+        connection.executemany(
+            "INSERT OR IGNORE INTO stock (item, quantity, restocked) VALUES (?, ?, ?)",
+            [(item, limit, now) for item, limit in limits.items()]
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO bosses (name, health, life) VALUES (?, ?, 1)",
+            [(name, boss["health"]) for name, boss in configs.items()]
+        )
+
+def exchange(changes, posts):
+    """Write changes and posts to WORLD_DB and read the world back (hold _sync_lock)"""
+    global _last_id
+    limits, interval, configs = config()
+    connection = connect()
+    now = time.time()
+    with connection:
+        # Restock and respawn once due, whichever process gets there first,
+        # before the hits so hits on a boss that just returned count
+        connection.executemany(
+            "UPDATE stock SET quantity = ?, restocked = ? WHERE item = ? AND restocked <= ?",
+            [(limit, now, item, now - interval) for item, limit in limits.items()]
+        )
+        connection.executemany(
+            "UPDATE bosses SET health = ?, life = life + 1, died_at = NULL WHERE name = ? AND died_at <= ?",
+            [(boss["health"], name, now - boss["respawn"]) for name, boss in configs.items()]
+        )
+        for _, name, life, warrior, damage, t in changes:
+            row = connection.execute(
+                "SELECT health FROM bosses WHERE name = ? AND life = ? AND health > 0", (name, life)
+            ).fetchone()
+            if row is None:
+                continue  # slain by another process first
+            dealt = min(damage, row[0])
+            connection.execute(
+                "UPDATE bosses SET health = health - ?, died_at = CASE WHEN health <= ? THEN ? END WHERE name = ?",
+                (dealt, dealt, t, name)
+            )
+            connection.execute(
+                "INSERT INTO boss_damage (name, life, warrior, damage) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (name, life, warrior) DO UPDATE SET damage = damage + excluded.damage",
+                (name, life, warrior, dealt)
+            )
+        connection.executemany("INSERT INTO feed (t, kind, author, text) VALUES (?, ?, ?, ?)", posts)
+        connection.execute(
+            "DELETE FROM boss_damage WHERE life < (SELECT life FROM bosses WHERE bosses.name = boss_damage.name)"
+        )
+        connection.execute("DELETE FROM feed WHERE id <= ?", (_last_id - 10 * FEED_SIZE,))
+
+    stock = dict(connection.execute("SELECT item, quantity FROM stock"))
+    restocked = connection.execute("SELECT MIN(restocked) FROM stock").fetchone()[0] or now
+    bosses = {
+        name: {"health": health, "life": life, "died_at": died_at, "damage": {}}
+        for name, health, life, died_at in connection.execute("SELECT name, health, life, died_at FROM bosses")
+        if name in configs
+    }
+    for name, warrior, damage in connection.execute(
+        "SELECT d.name, d.warrior, d.damage FROM boss_damage d JOIN bosses b ON d.name = b.name AND d.life = b.life"
+    ):
+        if name in bosses:
+            bosses[name]["damage"][warrior] = damage
+    entries = connection.execute(
+        "SELECT id, t, kind, author, text FROM feed WHERE id > ? ORDER BY id DESC LIMIT ?", (_last_id, FEED_SIZE)
+    ).fetchall()[::-1]
+    if entries:
+        _last_id = entries[-1][0]
+
+    world = _world
+    if world is None:
+        return World(0, stock, restocked, bosses, tuple(entries))
+    if not entries and (stock, restocked, bosses) == (world.stock, world.restocked, world.bosses):
+        return world  # nothing happened, pollers keep seeing the same version
+    return World(world.version + 1, stock, restocked, bosses, (world.feed + tuple(entries))[-FEED_SIZE:])
+
+def reload_config():
+    """Pick up reloaded content: new limited items and bosses join the world, removed ones leave it"""
+    global _world
+    config.cache_clear()
+    with _sync_lock:
+        if _connection is not None:
+            seed(_connection)
+        with _lock:
+            if _world is None:
+                return
+            limits, interval, configs = config()
+            _world = _world.replace(
+                stock={item: _world.stock.get(item, limit) for item, limit in limits.items()},
+                bosses={name: _world.bosses.get(name) or spawn(boss, 1) for name, boss in configs.items()}
+            )
+
+def get_world_stats():
+    """Version of the shared world and the writes this process still holds"""
+    world = current()
+    with _lock:
+        return {
+            "version": world.version,
+            "pending_posts": len(_posts),
+            "pending_changes": len(_changes),
+            "dropped_posts": _dropped
+        }
+
+atexit.register(flush_world)
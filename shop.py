@@ -1,5 +1,9 @@
 import streamlit as st
-from utils import Item, warrior_profile, ItemType
+from utils import warrior_profile, ItemType
+from content import get_shop_stock
+from telemetry import emit_gold
+from shared_world import stock_left, buy_stock, post
+import copy
 import random
 
 def calculate_sell_price(item):
@@ -15,8 +19,94 @@ def calculate_sell_price(item):
             return base_price
         return int(item.cost * 0.75)
 
+def get_quality(item):
+    """Quality tier of an item, read from its description"""
+    for line in item.description.splitlines():
+        if line.startswith("Quality: "):
+            return line[len("Quality: "):]
+    return "Standard"
+
+def select_for_sale(inventory, item_types=(), qualities=(), duplicates_only=False):
+    """Pick inventory stacks to sell as a {key: count} mapping
+
+    Empty item_types or qualities match everything. With duplicates_only
+    one copy of every distinct item is kept back.
+    """
+    selection = {}
+    seen = set()
+    for key, item, count in inventory.stacks():
+        if item_types and item.item_type not in item_types:
+            continue
+        if qualities and get_quality(item) not in qualities:
+            continue
+        if duplicates_only:
+            identity = (item.name, item.effect_type, item.effect_value)
+            if identity not in seen:
+                seen.add(identity)
+                count -= 1
+        if count > 0:
+            selection[key] = count
+    return selection
+
+def sell_items(warrior, selection):
+    """Sell a {key: count} selection as one transaction, returning (items sold, gold)"""
+    prices = {key: calculate_sell_price(warrior.inventory.get(key)) for key in selection}
+    sold = warrior.inventory.remove_many(selection)
+    total = sum(prices[key] * count for key, count in sold.items())
+    warrior.gold += total
+    emit_gold("sell", total, warrior)
+    return sum(sold.values()), total
+
+def buy_items(warrior, item, quantity=1):
+    """Buy several copies of a shop item at once"""
+    total_cost = item.cost * quantity
+    if warrior.gold < total_cost:
+        return False
+    warrior.gold -= total_cost
+    # Limited items are shared by every warrior on the server, claim them last and refund if they ran out
+    if not buy_stock(item.name, quantity):
+        warrior.gold += total_cost
+        return False
+    emit_gold("shop", -total_cost, warrior)
+    if item.item_type == ItemType.CONSUMABLE:
+        warrior.inventory.add(copy.copy(item), count=quantity)
+    else:
+        warrior.inventory.add_many(copy.copy(item) for _ in range(quantity))
+    if stock_left(item.name) == 0:
+        post(f"🛒 {warrior.name} bought the shop's last {item.name}.")
+    return True
+
+def display_bulk_sell():
+    """Sell everything matching a type, quality or duplicate filter"""
+    warrior = st.session_state.warrior
+    
+    with st.form(key="bulk_sell_form"):
+        st.write("Quick sell")
+        cols = st.columns(2)
+        with cols[0]:
+            item_types = st.multiselect(
+                "Item types", list(ItemType), format_func=lambda item_type: item_type.value.title()
+            )
+        with cols[1]:
+            qualities = st.multiselect(
+                "Quality", ["Poor", "Crude", "Common", "Standard", "Good", "Fine", "Masterwork"]
+            )
+        duplicates_only = st.checkbox("Only sell duplicates (keep one of each item)")
+        if st.form_submit_button("Sell matching"):
+            if not (item_types or qualities or duplicates_only):
+                # Empty filters match everything, never sell the whole inventory by accident
+                st.toast("Pick an item type, a quality or duplicates only first.", icon=":material/feedback:")
+                return
+            selection = select_for_sale(warrior.inventory, item_types, qualities, duplicates_only)
+            sold_count, total = sell_items(warrior, selection)
+            if sold_count:
+                st.toast(f"Sold {sold_count} items for {total} gold!")
+                st.rerun()
+            else:
+                st.toast("Nothing matched those filters.", icon=":material/feedback:")
+
 def display_inventory_for_sale():
-    """Display inventory with sell options"""
+    """Display inventory as one sell table with a quantity column per stack"""
     warrior = st.session_state.warrior
     
     if not warrior.inventory:
@@ -24,120 +114,63 @@ def display_inventory_for_sale():
         return
         
     st.subheader("🎒 Your Inventory")
+    display_bulk_sell()
     
-    # Group items by type but store original indices
-    consumables = []
-    equipment = []
-    
-    for idx, item in enumerate(warrior.inventory):
-        if item.item_type == ItemType.CONSUMABLE:
-            consumables.append((idx, item))  # Store original inventory index
-        else:
-            equipment.append((idx, item))    # Store original inventory index
-    
-    # Display equipment first
-    if equipment:
-        st.write("⚔️ Equipment")
-        for inv_idx, item in equipment:  # Use actual inventory index
-            sell_price = calculate_sell_price(item)
-            with st.form(key=f"sell_form_{inv_idx}"):  # Use inventory index for unique key
-                cols = st.columns([3, 2, 1])
-                with cols[0]:
-                    if hasattr(item, 'equipped') and item.equipped:
-                        st.write(f"{item.icon} {item.name} (Equipped)")
-                    else:
-                        st.write(f"{item.icon} {item.name}")
-                    if hasattr(item, 'description') and item.description:
-                        st.caption(item.description)
-                with cols[1]:
-                    st.write(f"Sell value: {sell_price} gold")
-                with cols[2]:
-                    if st.form_submit_button("Sell"):
-                        if hasattr(item, 'equipped') and item.equipped:
-                            warrior.unequip_item(item.item_type)
-                        warrior.inventory.pop(inv_idx)  # Use actual inventory index
-                        warrior.gold += sell_price
-                        st.toast(f"Sold {item.name} for {sell_price} gold!")
-                        st.rerun()
-    
-    # Then display consumables
-    if consumables:
-        st.write("🧪 Consumables")
-        for inv_idx, item in consumables:  # Use actual inventory index
-            sell_price = calculate_sell_price(item)
-            with st.form(key=f"sell_form_{inv_idx}"):  # Use inventory index for unique key
-                cols = st.columns([3, 2, 1])
-                with cols[0]:
-                    st.write(f"{item.icon} {item.name}")
-                with cols[1]:
-                    st.write(f"Sell value: {sell_price} gold")
-                with cols[2]:
-                    if st.form_submit_button("Sell"):
-                        warrior.inventory.pop(inv_idx)  # Use actual inventory index
-                        warrior.gold += sell_price
-                        st.toast(f"Sold {item.name} for {sell_price} gold!")
-                        st.rerun()
-
-def get_weapons():
-    return [
-        Item("Iron Sword", 100, "strength", 5, ":material/swords:", 
-             ItemType.WEAPON, "A reliable iron sword"),
-        Item("Battle Axe", 150, "strength", 8, ":material/swords:", 
-             ItemType.WEAPON, "A mighty battle axe"),
-        Item("War Hammer", 200, "strength", 12, ":material/swords:", 
-             ItemType.WEAPON, "A devastating war hammer"),
-        Item("Legendary Blade", 500, "strength", 20, ":material/swords:", 
-             ItemType.WEAPON, "A blade of legendary power")
-    ]
-
-def get_armor():
-    return [
-        Item("Leather Armor", 80, "armour", 8, ":material/shield:", 
-             ItemType.ARMOR, "Basic but reliable protection"),
-        Item("Chain Mail", 150, "armour", 15, ":material/shield:", 
-             ItemType.ARMOR, "Flexible chain mail protection"),
-        Item("Plate Armor", 300, "armour", 25, ":material/shield:", 
-             ItemType.ARMOR, "Heavy but effective plate armor"),
-        Item("Dragon Scale", 600, "armour", 40, ":material/shield:", 
-             ItemType.ARMOR, "Legendary armor made from dragon scales")
-    ]
-
-def get_accessories():
-    return [
-        Item("Lucky Penny", 150, "luck", 10, ":material/paid:", 
-             ItemType.ACCESSORY, "A coin that brings good fortune"),
-        Item("Adventurer's Ring", 200, "luck", 5, ":material/money_bag:", 
-             ItemType.ACCESSORY, "A ring worn by experienced adventurers"),
-        Item("Ancient Medallion", 300, "health", 25, ":material/money_bag:", 
-             ItemType.ACCESSORY, "A medallion pulsing with ancient power"),
-        Item("Warrior's Pendant", 400, "strength", 8, ":material/money_bag:", 
-             ItemType.ACCESSORY, "A pendant empowered with warrior spirit")
-    ]
-
-def get_potions():
-    return [
-        Item("Health Potion", 30, "health", 50, ":material/science:", 
-             ItemType.CONSUMABLE, "Restores 50 health"),
-        Item("Greater Health Potion", 80, "health", 100, ":material/science:", 
-             ItemType.CONSUMABLE, "Restores 100 health"),
-        Item("Strength Potion", 50, "strength", 2, ":material/science:", 
-             ItemType.CONSUMABLE, "Temporarily increases strength"),
-        Item("Greater Strength Potion", 100, "strength", 4, ":material/science:", 
-             ItemType.CONSUMABLE, "Greatly increases strength"),
-        Item("Stoneskin Potion", 35, "armour", 6, ":material/science:", 
-             ItemType.CONSUMABLE, "Temporarily increases armor"),
-        Item("Greater Stoneskin Potion", 55, "armour", 14, ":material/science:", 
-             ItemType.CONSUMABLE, "Greatly increases armor")
+    # Equipment first, then consumables, one row per stack of identical items
+    stacks = warrior.inventory.stacks()
+    # Rows carry their inventory key, so edits never depend on row order
+    keys = {str(key): key for key, item, count in stacks}
+    owned = {key: count for key, item, count in stacks}
+    rows = [
+        {
+            "Key": str(key),
+            "Item": item.name,
+            "Type": item.item_type.value.title(),
+            "Effect": f"+{item.effect_value} {item.effect_type}",
+            "Owned": count,
+            "Price": calculate_sell_price(item),
+            "Sell": 0
+        }
+        for key, item, count in stacks
     ]
+    
+    with st.form(key="sell_form"):
+        edited = st.data_editor(
+            rows,
+            key="sell_editor",
+            column_config={
+                "Key": None,
+                "Price": st.column_config.NumberColumn("Sell value", format="%d gold"),
+                "Sell": st.column_config.NumberColumn("Sell", min_value=0, max_value=max(owned.values()), step=1)
+            },
+            disabled=["Item", "Type", "Effect", "Owned", "Price"],
+            hide_index=True,
+            use_container_width=True
+        )
+        if st.form_submit_button("Sell selected"):
+            # Never more than the stack holds, the column maximum is shared by every row
+            sold_count, total = sell_items(warrior, {
+                keys[row["Key"]]: min(int(row["Sell"]), owned[keys[row["Key"]]])
+                for row in edited
+                if row["Sell"] and row["Key"] in keys
+            })
+            if sold_count:
+                # The edits belong to the rows just sold, start the next table clean
+                st.session_state.pop("sell_editor", None)
+                st.toast(f"Sold {sold_count} items for {total} gold!")
+                st.rerun()
 
 def display_items(items):
     for item in items:
         with st.form(key=f"buy_form_{item.name}"):
-            cols = st.columns([2, 1, 1])
+            cols = st.columns([2, 1, 1, 1])
             with cols[0]:
                 st.write(f"{item.icon} {item.name} ({item.cost} gold)")
                 if item.description:
                     st.caption(item.description)
+                left = stock_left(item.name)
+                if left is not None:
+                    st.caption(f"Only {left} left in stock" if left else "Sold out, back when the shop restocks")
             with cols[1]:
                 if item.item_type == ItemType.CONSUMABLE:
                     effect_text = f"+{item.effect_value} {item.effect_type}"
@@ -145,14 +178,19 @@ def display_items(items):
                     effect_text = f"Equip: +{item.effect_value} {item.effect_type}"
                 st.text(effect_text)
             with cols[2]:
-                if st.form_submit_button("Buy"):
-                    if warrior.gold >= item.cost:
-                        warrior.gold -= item.cost
-                        warrior.inventory.append(item)
-                        st.toast(f"Bought {item.name}!")
+                quantity = st.number_input(
+                    "Quantity", min_value=1, value=1, step=1,
+                    key=f"buy_quantity_{item.name}", label_visibility="collapsed"
+                )
+            with cols[3]:
+                if st.form_submit_button("Buy", disabled=left == 0):
+                    if warrior.gold < item.cost * quantity:
+                        st.toast(f"Not enough gold, {warrior.name}!", icon=":material/feedback:")
+                    elif buy_items(warrior, item, quantity):
+                        st.toast(f"Bought {quantity} × {item.name}!" if quantity > 1 else f"Bought {item.name}!")
                         st.rerun()
                     else:
-                        st.toast(f"Not enough gold, {warrior.name}!", icon=":material/feedback:")
+                        st.toast(f"Only {stock_left(item.name)} {item.name} left, {warrior.name}!", icon=":material/feedback:")
 
 if st.session_state.warrior:
     warrior = st.session_state.warrior
@@ -178,6 +216,8 @@ if st.session_state.warrior:
         </style>
         """, unsafe_allow_html=True)
 
+    stock = get_shop_stock()
+
     # Create tabs for buying and selling
     buy_tab, sell_tab = st.tabs(["💰 Buy", "💱 Sell"])
     
@@ -195,19 +235,19 @@ if st.session_state.warrior:
 
             with weapons_tab:
                 st.markdown("*The shopkeeper shows you an impressive array of weaponry...*")
-                display_items(get_weapons())
+                display_items(stock["weapons"])
 
             with armor_tab:
                 st.markdown("*Sturdy armor of various materials lines the walls...*")
-                display_items(get_armor())
+                display_items(stock["armor"])
 
             with accessories_tab:
                 st.markdown("*Magical trinkets and mysterious accessories catch your eye...*")
-                display_items(get_accessories())
+                display_items(stock["accessories"])
 
             with potions_tab:
                 st.markdown("*Colorful bottles bubble and fizz on the shelves...*")
-                display_items(get_potions())
+                display_items(stock["potions"])
 
         with right:
             st.image("images/shop_side.png", use_container_width=True)
@@ -0,0 +1,578 @@
+# simulator.py
+# Agent-based economy simulator for long-horizon progression. Thousands of
+# warriors play in lockstep as NumPy arrays, one element per agent: every
+# step is one click on an area button, resolved with the odds and formulas
+# of encounters.py and party_combat.py, and a policy decides between clicks where each warrior
+# explores and what it buys. The results are clicks to reach each level,
+# gold curves and gold flows in the economy_report format, for tuning
+# calculate_xp_needed and the reward tables before players meet them. Like
+# snapshot.py this module does not import streamlit.
+#
+#     python simulator.py --agents 5000 --clicks 20000 --workers 4
+#
+# Not simulated: temporary buffs (strength potions, blessings other than
+# healing, special attacks), item rewards from quests and the tavern.
+# Warriors always use the normal attack, as the auto-battle does.
+import argparse
+import concurrent.futures
+import json
+import numpy as np
+import pandas as pd
+from snapshot import load_snapshot
+from tables import load_tables, spawn_enemies, EFFECT_TYPES
+from party_combat import Battles, table_groups
+
+MAX_LEVEL = 30
+ENCOUNTERS = ["enemy", "chest", "blessing", "trap"]
+SOURCES = ["kill", "chest", "quest", "sell", "shop", "blacksmith"]
+SLOTS = ["weapon", "armor", "accessory"]  # loot item names, in tables.EQUIPMENT_KINDS order
+SHOP_SLOTS = ["weapons", "armor", "accessories"]
+
+# Starting health, strength, armour and luck and the stat raised on level up, as in Warrior
+BUILDS = {
+    "Barbarian": (120, 18, 10, 8, "strength"),
+    "Rogue": (100, 20, 5, 11, "luck"),
+    "Knight": (120, 10, 18, 8, "armour"),
+}
+
+DEFAULT_POLICY = {
+    # (minimum level, area id): warriors explore the last area their level allows
+    "areas": [
+        (1, "forest_easy"), (3, "forest_medium"), (5, "mountain_easy"),
+        (7, "forest_hard"), (9, "mountain_medium"), (12, "mountain_hard")
+    ],
+    "potion_below": 0.4,    # drink a health potion below this share of max health
+    "run_below": 0.2,       # run away below this share if no potion is left
+    "max_rounds": 100,      # give up and run after this many rounds
+    "potion_stock": 3,      # health potions bought in town whenever fewer are carried
+    "buy_equipment": True,  # buy shop equipment that beats what is equipped
+    "upgrade": True,        # upgrade the weapon at the blacksmith
+    "max_upgrade": 5,       # stop upgrading at this upgrade level
+    "gold_reserve": 100,    # gold kept back from equipment and upgrades
+    "quests": True          # accept every quest once its level is reached
+}
+
+class Simulation:
+    """A population of warriors of one class, played one click per step"""
+    def __init__(self, agents, build_type="Barbarian", policy=None, xp_base=100, xp_growth=1.5,
+                 xp_scale=1.0, gold_scale=1.0, seed=None):
+        self.policy = {**DEFAULT_POLICY, **(policy or {})}
+        self.rng = np.random.default_rng(seed)
+        self.tables = load_tables()
+        self.snapshot = snapshot = load_snapshot()
+        self.build_type = build_type
+        self.xp_base, self.xp_growth = xp_base, xp_growth
+
+        # Enemy rewards are scaled here so reward tables can be tuned without editing content
+        enemies = self.tables["enemies"]
+        self.enemy_xp = (enemies["xp"] * xp_scale).astype(np.int64)
+        self.enemy_gold = (enemies["gold"] * gold_scale).astype(np.int64)
+        self.areas = enemies["areas"]
+        self.required_level = {name: region["required_level"] for name, region in snapshot["regions"].items()}
+        self.encounter_weights = np.array([
+            next(e["weight"] for e in snapshot["encounter_weights"] if e["type"] == kind) for kind in ENCOUNTERS
+        ], dtype=np.float64)
+        self.encounter_weights /= self.encounter_weights.sum()
+
+        health, strength, armour, luck, self.primary = BUILDS[build_type]
+        self.agents = agents
+        self.level = np.ones(agents, np.int64)
+        self.xp = np.zeros(agents, np.int64)
+        self.gold = np.zeros(agents, np.int64)
+        self.health = np.full(agents, health, np.int64)
+        self.base = {
+            "health": np.full(agents, health, np.int64),
+            "strength": np.full(agents, strength, np.int64),
+            "armour": np.full(agents, armour, np.int64),
+            "luck": np.full(agents, luck, np.int64)
+        }
+        # Equipped items per slot: effect value and cost, plus the accessory's stat
+        self.effect = np.zeros((len(SLOTS), agents), np.int64)
+        self.cost = np.zeros((len(SLOTS), agents), np.int64)
+        self.accessory_type = np.zeros(agents, np.int8)
+        self.upgrades = np.zeros(agents, np.int64)
+        # Health potions are pooled: a count and the healing they hold together
+        self.potions = np.zeros(agents, np.int64)
+        self.potion_health = np.zeros(agents, np.int64)
+        self.alive = np.ones(agents, bool)
+
+        self.clicks = 0
+        self.level_clicks = np.full((agents, MAX_LEVEL + 1), -1, np.int64)  # click each level was reached
+        self.level_clicks[:, 1] = 0
+        self.level_gold = np.full((agents, MAX_LEVEL + 1), -1, np.int64)  # gold held on reaching it
+        self.level_gold[:, 1] = 0
+        self.deaths = np.zeros(MAX_LEVEL + 1, np.int64)
+        self.flows = np.zeros((MAX_LEVEL + 1, len(SOURCES), 2), np.int64)  # level, source, in/out
+        self.samples = []  # (click, warriors alive, gold held, levels) sums, see gold_curve()
+        self._setup_shop()
+        self._setup_quests()
+
+    def _setup_shop(self):
+        stock = self.snapshot["shop_stock"]
+        # Shop equipment per slot, best first: (effect, cost, accessory stat)
+        self.shop = []
+        for slot, shop_slot in enumerate(SHOP_SLOTS):
+            items = [(item.effect_value, item.cost, EFFECT_TYPES.index(item.effect_type)) for item in stock[shop_slot]]
+            # Accessories raise different stats, so they are compared by cost
+            self.shop.append(sorted(items, key=lambda item: item[1] if slot == 2 else item[0], reverse=True))
+        potion = min((item for item in stock["potions"] if item.effect_type == "health"), key=lambda item: item.cost)
+        self.potion_cost, self.potion_value = potion.cost, potion.effect_value
+
+    def _setup_quests(self):
+        """Quest requirements as counters per agent, matched against kills, loot and visits"""
+        names = self.tables["enemies"]["names"]
+        self.quests = []
+        for quest in self.snapshot["quests"].values():
+            requirements = quest.requirements
+            counters = []  # (event kind, matching keys, target)
+            for name, count in requirements.get("enemies", {}).items():
+                counters.append(("kill", {row for row, enemy in enumerate(names) if enemy == name}, count))
+            if "boss" in requirements:
+                counters.append(("kill", {row for row, enemy in enumerate(names) if enemy == requirements["boss"]}, 1))
+            for name, count in requirements.get("items", {}).items():
+                counters.append(("loot", {name}, count))
+            for area_id in requirements.get("areas", []):
+                counters.append(("visit", {area_id}, 1))
+            if not counters:
+                continue  # e.g. upgrade quests, which nothing here tracks
+            self.quests.append({
+                "min_level": quest.min_level,
+                "rewards": quest.rewards,
+                "counters": counters,
+                "targets": np.array([target for kind, keys, target in counters], np.int64),
+                "progress": np.zeros((self.agents, len(counters)), np.int64),
+                "active": np.zeros(self.agents, bool),
+                "done": np.zeros(self.agents, bool)
+            })
+
+    def xp_needed(self, level):
+        return (self.xp_base * self.xp_growth ** (level - 1)).astype(np.int64)
+
+    def stats(self, idx):
+        """Total strength, armour, luck and max health of some agents"""
+        accessory = self.effect[2, idx]
+        accessory_type = self.accessory_type[idx]
+        def bonus(stat):
+            return np.where(accessory_type == EFFECT_TYPES.index(stat), accessory, 0)
+        return (
+            self.base["strength"][idx] + self.effect[0, idx] + bonus("strength"),
+            self.base["armour"][idx] + self.effect[1, idx] + bonus("armour"),
+            self.base["luck"][idx] + bonus("luck"),
+            self.base["health"][idx] + bonus("health")
+        )
+
+    def add_gold(self, idx, amount, source):
+        """Change some agents' gold and book it in the flows of their level"""
+        self.gold[idx] += amount
+        column = 0 if np.all(amount >= 0) else 1
+        np.add.at(self.flows[:, SOURCES.index(source), column], self.level[idx], np.abs(amount))
+
+    def run(self, clicks, sample_every=100):
+        """Play up to clicks steps, stopping early once every agent is dead or maxed"""
+        for _ in range(clicks):
+            if self.clicks % sample_every == 0:
+                self.sample()
+            if not self.step():
+                break
+        self.sample()
+        return self.results()
+
+    def sample(self):
+        alive = self.alive
+        self.samples.append((self.clicks, int(alive.sum()), int(self.gold[alive].sum()), int(self.level[alive].sum())))
+
+    def step(self):
+        """One click for every agent still playing, False once none are"""
+        active = np.flatnonzero(self.alive & (self.level < MAX_LEVEL))
+        if not active.size:
+            return False
+        self.clicks += 1
+        self.visit_town(active)
+
+        area_index = self.choose_areas(active)
+        encounter = self.rng.choice(len(ENCOUNTERS), size=active.size, p=self.encounter_weights)
+        fight_idx, fight_rows = [], []
+        for area in np.unique(area_index):
+            area_id = self.areas[area]
+            in_area = area_index == area
+            self.quest_event("visit", active[in_area], area_id)
+            region, difficulty = area_id.split("_")
+            fighting = active[in_area & (encounter == 0)]
+            if fighting.size:
+                fight_idx.append(fighting)
+                fight_rows.append(spawn_enemies(self.tables, area_id, fighting.size, self.rng))
+            self.open_chests(active[in_area & (encounter == 1)], region, difficulty)
+            self.bless(active[in_area & (encounter == 2)], region)
+            self.trap(active[in_area & (encounter == 3)], region)
+        if fight_idx:
+            self.fight(np.concatenate(fight_idx), np.concatenate(fight_rows))
+        self.check_quests()
+        return True
+
+    def choose_areas(self, idx):
+        """Index into self.areas of the area each agent explores"""
+        level = self.level[idx]
+        choice = np.full(idx.size, self.areas.index(self.policy["areas"][0][1]))
+        for min_level, area_id in self.policy["areas"]:
+            allowed = max(min_level, self.required_level[area_id.split("_")[0]])
+            choice[level >= allowed] = self.areas.index(area_id)
+        return choice
+
+    def visit_town(self, idx):
+        """Heal, restock potions, accept quests, shop and upgrade between clicks"""
+        policy = self.policy
+        self.drink_potions(idx, self.health[idx].copy())
+
+        # Potions come first, so the gold reserve does not apply
+        missing = np.maximum(0, policy["potion_stock"] - self.potions[idx])
+        bought = np.minimum(missing, self.gold[idx] // self.potion_cost)
+        buyers = idx[bought > 0]
+        if buyers.size:
+            bought = bought[bought > 0]
+            self.add_gold(buyers, -bought * self.potion_cost, "shop")
+            self.potions[buyers] += bought
+            self.potion_health[buyers] += bought * self.potion_value
+
+        if policy["quests"]:
+            for quest in self.quests:
+                quest["active"][idx] |= self.level[idx] >= quest["min_level"]
+
+        if policy["buy_equipment"]:
+            for slot, items in enumerate(self.shop):
+                self.buy_equipment(idx, slot, items)
+        if policy["upgrade"]:
+            self.upgrade_weapons(idx)
+
+    def drink_potions(self, idx, health):
+        """Drink a potion where health is below the policy share, returning the new health"""
+        _, _, _, max_health = self.stats(idx)
+        drink = (health < self.policy["potion_below"] * max_health) & (self.potions[idx] > 0)
+        if drink.any():
+            drinkers = idx[drink]
+            value = self.potion_health[drinkers] // self.potions[drinkers]
+            health[drink] = np.minimum(max_health[drink], health[drink] + value)
+            self.potions[drinkers] -= 1
+            self.potion_health[drinkers] -= value
+            self.health[drinkers] = health[drink]
+        return health
+
+    def buy_equipment(self, idx, slot, items):
+        spare = self.gold[idx] - self.policy["gold_reserve"]
+        done = np.zeros(idx.size, bool)
+        for effect, cost, effect_type in items:
+            current = self.cost[slot, idx] if slot == 2 else self.effect[slot, idx]
+            better = cost > current if slot == 2 else effect > current
+            buy = ~done & better & (spare >= cost)
+            if buy.any():
+                buyers = idx[buy]
+                self.add_gold(buyers, np.full(buyers.size, -cost), "shop")
+                self.equip(buyers, slot, np.full(buyers.size, effect), np.full(buyers.size, cost), effect_type, force=True)
+                done |= buy
+
+    def upgrade_weapons(self, idx):
+        """One blacksmith attempt on the weapon, as upgrades.attempt_upgrade without quality"""
+        level = self.upgrades[idx]
+        cost = (self.cost[0, idx] * 0.5 * 1.5 ** level * 1.2).astype(np.int64)
+        attempt = (
+            (self.cost[0, idx] > 0) & (level < self.policy["max_upgrade"])
+            & (self.gold[idx] - self.policy["gold_reserve"] >= cost)
+        )
+        if not attempt.any():
+            return
+        idx, level, cost = idx[attempt], level[attempt], cost[attempt]
+        self.add_gold(idx, -cost, "blacksmith")
+        chance = np.clip(0.95 - 0.1 * level, 0.05, 0.95)
+        success = self.rng.random(idx.size) < chance
+        failure_roll = self.rng.random(idx.size)
+        lost = ~success & (failure_roll < 0.1) & (level > 0)
+        destroyed = ~success & ~lost & (failure_roll < 0.02)
+        self.upgrades[idx[success]] += 1
+        self.effect[0, idx[success]] += 2
+        self.upgrades[idx[lost]] -= 1
+        self.effect[0, idx[lost]] -= 2
+        for array in (self.upgrades, self.effect[0], self.cost[0]):
+            array[idx[destroyed]] = 0
+
+    def equip(self, idx, slot, effect, cost, effect_type=None, force=False):
+        """Equip items that beat the equipped ones and sell the rest at the unequipped price"""
+        if force:
+            better = np.ones(idx.size, bool)
+        elif slot == 2:
+            better = cost > self.cost[slot, idx]
+        else:
+            better = effect > self.effect[slot, idx]
+        swap = idx[better]
+        # The replaced item, or the new one when it is worse, goes to the shop
+        sold = np.where(better, self.cost[slot, idx], cost)
+        sellers = sold > 0
+        if sellers.any():
+            self.add_gold(idx[sellers], (sold[sellers] * 0.75).astype(np.int64), "sell")
+        self.effect[slot, swap] = effect[better]
+        self.cost[slot, swap] = cost[better]
+        if slot == 0:
+            self.upgrades[swap] = 0
+        if slot == 2:
+            self.accessory_type[swap] = effect_type if np.isscalar(effect_type) else effect_type[better]
+
+    def open_chests(self, idx, region, difficulty):
+        """handle_chest for some agents in one area"""
+        if not idx.size:
+            return
+        multiplier = self.snapshot["difficulty_multiplier"][difficulty]
+        table = self.snapshot["loot_tables"][region]
+        weights = np.array([loot["weight"] for loot in table], dtype=np.float64)
+        rolls = self.rng.choice(len(table), size=idx.size, p=weights / weights.sum())
+        for entry, loot in enumerate(table):
+            found = idx[rolls == entry]
+            if not found.size:
+                continue
+            if loot["item"] == "gold":
+                gold = (self.rng.integers(loot["min"], loot["max"] + 1, size=found.size) * multiplier).astype(np.int64)
+                self.add_gold(found, gold, "chest")
+            elif loot["item"] in SLOTS:
+                self.find_equipment(found, SLOTS.index(loot["item"]), region, difficulty, multiplier)
+            else:
+                self.quest_event("loot", found, loot["name"])
+                if loot["effect_type"] == "health":
+                    self.potions[found] += 1
+                    self.potion_health[found] += int(loot["effect_value"] * multiplier)
+                else:
+                    # Buff potions are not simulated, they are sold
+                    self.add_gold(found, np.full(found.size, int(loot["cost"] * 0.5)), "sell")
+
+    def find_equipment(self, idx, slot, region, difficulty, multiplier):
+        """Roll equipment like get_weapon and apply_quality_variance, then equip or sell it"""
+        equipment = self.tables["equipment"]
+        kind = equipment["kind"] == slot
+        in_region = kind & (equipment["region"] == equipment["regions"].index(region))
+        rows = np.flatnonzero(in_region & (equipment["difficulty"] == ["easy", "medium", "hard"].index(difficulty)))
+        if not rows.size:
+            rows = np.flatnonzero(in_region)
+        rows = rows[self.rng.integers(0, rows.size, size=idx.size)]
+        variance = equipment["variance"][rows]
+        roll = self.rng.integers(-variance, variance + 1)
+        effect = (np.maximum(1, equipment["base_effect"][rows] + roll) * multiplier).astype(np.int64)
+        cost = (equipment["cost"][rows] * (1 + roll / np.maximum(variance, 1) / 2) * multiplier).astype(np.int64)
+        self.equip(idx, slot, effect, cost, equipment["effect"][rows])
+
+    def bless(self, idx, region):
+        """Healing blessings, other blessings are temporary buffs and not simulated"""
+        if not idx.size:
+            return
+        blessings = self.snapshot["blessings"][region]
+        chosen = self.rng.integers(0, len(blessings), size=idx.size)
+        for number, blessing in enumerate(blessings):
+            if blessing["type"] == "heal":
+                healed = idx[chosen == number]
+                _, _, _, max_health = self.stats(healed)
+                self.health[healed] = np.minimum(max_health, self.health[healed] + blessing["value"])
+
+    def trap(self, idx, region):
+        if not idx.size:
+            return
+        damage = np.array([trap["damage"] for trap in self.snapshot["traps"][region]])
+        self.health[idx] -= damage[self.rng.integers(0, damage.size, size=idx.size)]
+        self.die(idx[self.health[idx] <= 0])
+
+    def die(self, idx):
+        self.alive[idx] = False
+        np.add.at(self.deaths, self.level[idx], 1)
+
+    def fight(self, idx, rows):
+        """Fight one enemy or group per agent to the end, all fights advancing a round at a time"""
+        policy = self.policy
+        strength, armour, luck, max_health = self.stats(idx)
+        party = {"health": self.health[idx], "strength": strength, "armour": armour, "luck": luck}
+        battles = Battles({stat: values[:, None] for stat, values in party.items()}, table_groups(self.tables, rows), self.rng)
+        health = battles.party["health"][:, 0]  # a view, rounds update it in place
+
+        for _ in range(policy["max_rounds"]):
+            fighting = np.flatnonzero(battles.active)
+            if not fighting.size:
+                break
+            health[fighting] = self.drink_potions(idx[fighting], health[fighting])
+            ran = health[fighting] < policy["run_below"] * max_health[fighting]
+            battles.active[fighting[ran]] = False
+            battles.round()
+        outcome = np.where(battles.won, 1, np.where(battles.lost, 2, 3))  # 3 ran away
+
+        self.health[idx] = health
+        self.die(idx[outcome == 2])
+        won = outcome == 1
+        winners, rows = idx[won], rows[won]
+        bonus = np.where(self.rng.random(winners.size) < luck[won] / 150, 1.5, 1.0)
+        self.add_gold(winners, (self.enemy_gold[rows] * bonus).astype(np.int64), "kill")
+        self.xp[winners] += (self.enemy_xp[rows] * bonus).astype(np.int64)
+        self.quest_event("kill", winners, rows)
+        self.level_up(winners)
+
+    def level_up(self, idx):
+        """level_up_warrior for the agents with enough experience, one level at most"""
+        idx = idx[self.xp[idx] >= self.xp_needed(self.level[idx])]
+        if not idx.size:
+            return
+        self.level[idx] += 1
+        self.xp[idx] = 0
+        level = self.level[idx]
+        self.base["health"][idx] += 10 + (level - 1) * 2
+        self.base[self.primary][idx] += 3 + (level - 1) // 3
+        self.health[idx] = self.stats(idx)[3]
+        self.level_clicks[idx, level] = self.clicks
+        self.level_gold[idx, level] = self.gold[idx]
+
+    def quest_event(self, kind, idx, keys):
+        """Count a kill (enemy rows), loot (a name) or visit (an area id) for active quests"""
+        if not idx.size:
+            return
+        for quest in self.quests:
+            for column, (counter_kind, matches, target) in enumerate(quest["counters"]):
+                if counter_kind != kind:
+                    continue
+                if kind == "kill":
+                    hit = np.isin(keys, list(matches))
+                elif keys in matches:
+                    hit = np.ones(idx.size, bool)
+                else:
+                    continue
+                counted = idx[hit & quest["active"][idx] & ~quest["done"][idx]]
+                quest["progress"][counted, column] += 1
+
+    def check_quests(self):
+        """Reward quests whose requirements are all met, like claim_rewards"""
+        for quest in self.quests:
+            complete = quest["active"] & ~quest["done"] & self.alive & (quest["progress"] >= quest["targets"]).all(axis=1)
+            finished = np.flatnonzero(complete)
+            if not finished.size:
+                continue
+            quest["done"][finished] = True
+            rewards = quest["rewards"]
+            if rewards.get("gold"):
+                self.add_gold(finished, np.full(finished.size, rewards["gold"]), "quest")
+            if rewards.get("xp"):
+                self.xp[finished] += rewards["xp"]
+                self.level_up(finished)
+
+    def results(self):
+        return {
+            "build_type": self.build_type,
+            "clicks": self.clicks,
+            "level_clicks": self.level_clicks,
+            "level_gold": self.level_gold,
+            "deaths": self.deaths,
+            "flows": self.flows,
+            "samples": np.array(self.samples, np.int64)
+        }
+
+def _simulate_part(agents, clicks, build_type, policy, tuning, seed):
+    return Simulation(agents, build_type, policy, seed=seed, **tuning).run(clicks)
+
+def simulate(agents=1000, clicks=10000, build_type="Barbarian", policy=None, workers=1, seed=None, **tuning):
+    """Run a simulation, split over worker processes, and merge the results
+
+    tuning is passed to Simulation: xp_base and xp_growth for
+    calculate_xp_needed, xp_scale and gold_scale for enemy rewards.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [agents // workers + (part < agents % workers) for part in range(workers)]
+    if workers == 1:
+        parts = [_simulate_part(agents, clicks, build_type, policy, tuning, seeds[0])]
+    else:
+        # Every worker maps the same exported tables, see tables.py
+        load_tables()
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(
+                _simulate_part, shares, [clicks] * workers, [build_type] * workers,
+                [policy] * workers, [tuning] * workers, seeds
+            ))
+    # Samples line up by click until a part stops early, shorter parts hold their last sample
+    length = max(len(part["samples"]) for part in parts)
+    samples = sum(
+        np.vstack([part["samples"], np.repeat(part["samples"][-1:], length - len(part["samples"]), axis=0)])
+        for part in parts
+    )
+    samples[:, 0] = next(part["samples"][:, 0] for part in parts if len(part["samples"]) == length)
+    return {
+        "build_type": build_type,
+        "clicks": max(part["clicks"] for part in parts),
+        "level_clicks": np.vstack([part["level_clicks"] for part in parts]),
+        "level_gold": np.vstack([part["level_gold"] for part in parts]),
+        "deaths": sum(part["deaths"] for part in parts),
+        "flows": sum(part["flows"] for part in parts),
+        "samples": samples
+    }
+
+def time_to_level(results):
+    """Clicks to reach each level: share of agents that got there, percentiles and gold held"""
+    level_clicks = results["level_clicks"]
+    rows = []
+    for level in range(1, MAX_LEVEL + 1):
+        reached = level_clicks[:, level] >= 0
+        if not reached.any():
+            break
+        clicks = level_clicks[reached, level]
+        rows.append({
+            "level": level,
+            "reached": reached.mean(),
+            "p10": np.percentile(clicks, 10),
+            "p50": np.percentile(clicks, 50),
+            "p90": np.percentile(clicks, 90),
+            "gold": results["level_gold"][reached, level].mean(),
+            "deaths": results["deaths"][level]
+        })
+    return pd.DataFrame(rows).set_index("level")
+
+def gold_curve(results):
+    """Mean gold and level of the living agents over time, indexed by click"""
+    clicks, alive, gold, levels = results["samples"].T
+    alive_share = alive / len(results["level_clicks"])
+    alive = np.maximum(alive, 1)
+    return pd.DataFrame({"alive": alive_share, "gold": gold / alive, "level": levels / alive}, index=pd.Index(clicks, name="click"))
+
+def gold_events(results):
+    """Gold flows as level, source and amount rows for economy_report.gold_flows"""
+    flows = results["flows"]
+    level, source, direction = np.nonzero(flows)
+    amount = flows[level, source, direction] * np.where(direction == 0, 1, -1)
+    return pd.DataFrame({"level": level, "source": np.array(SOURCES)[source], "amount": amount})
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent-based economy simulator")
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--clicks", type=int, default=10000, help="area clicks per agent")
+    parser.add_argument("--build", choices=list(BUILDS), default="Barbarian")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--policy", type=json.loads, help='JSON overrides, e.g. \'{"upgrade": false}\'')
+    parser.add_argument("--xp-base", type=float, default=100, help="XP for level 2")
+    parser.add_argument("--xp-growth", type=float, default=1.5, help="XP growth per level")
+    parser.add_argument("--xp-scale", type=float, default=1.0, help="multiplier on enemy XP")
+    parser.add_argument("--gold-scale", type=float, default=1.0, help="multiplier on enemy gold")
+    parser.add_argument("--json", help="also write the tables to this JSON file")
+    args = parser.parse_args()
+
+    results = simulate(
+        args.agents, args.clicks, args.build, args.policy, args.workers, args.seed,
+        xp_base=args.xp_base, xp_growth=args.xp_growth, xp_scale=args.xp_scale, gold_scale=args.gold_scale
+    )
+    from economy_report import gold_flows  # Only needed for the report
+    levels = time_to_level(results)
+    flows = gold_flows(gold_events(results))
+    curve = gold_curve(results)
+    pd.set_option("display.width", 200)
+    print(f"{args.agents} {args.build} agents, {results['clicks']} clicks\n")
+    print("Clicks to reach each level")
+    print(levels.round(2).to_string(), "\n")
+    print("Gold per level and source, all agents")
+    print(flows.to_string(), "\n")
+    print("Mean gold and level of living agents")
+    print(curve.iloc[::max(1, len(curve) // 20)].round(1).to_string())
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "time_to_level": levels.reset_index().to_dict("records"),
+                "gold_flows": flows.reset_index().to_dict("records"),
+                "gold_curve": curve.reset_index().to_dict("records")
+            }, f, default=float)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# snapshot.py
+# All game content is validated once and stored as a pickle snapshot keyed
+# by a hash of the content sources. New processes load the snapshot
+# instead of importing, building and validating every table again. This
+# module does not import streamlit so simulation workers stay light.
+#
+# Snapshots are built in a fresh interpreter (python -m snapshot): a server
+# process that imported the content modules before they were edited would
+# otherwise pickle its stale tables under the new hash.
+import glob
+import hashlib
+import os
+import pickle
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.path.join(ROOT, "cache")
+CONTENT_SOURCES = [
+    "enemy_configs.py",
+    "encounter_configs.py",
+    "item_configs.py",
+    "quest_config.py",
+    "region_configs.py",
+    "utils/classes.py"
+]
+STATS = {"strength", "luck", "armour", "health"}
+
+def content_hash():
+    """Short hash of every content source file"""
+    digest = hashlib.sha256()
+    for source in CONTENT_SOURCES:
+        digest.update(source.encode())
+        with open(os.path.join(ROOT, source), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def build_snapshot():
+    """Import every content table, index it and validate it"""
+    import encounter_configs
+    import enemy_configs
+    import item_configs
+    import quest_config
+    import region_configs
+
+    shop_stock = {
+        "weapons": item_configs.get_weapons(),
+        "armor": item_configs.get_armor(),
+        "accessories": item_configs.get_accessories(),
+        "potions": item_configs.get_potions()
+    }
+    tavern_items = item_configs.get_tavern_items()
+    quests = quest_config.FOREST_QUESTS + quest_config.MOUNTAIN_QUESTS
+
+    snapshot = {
+        "hash": content_hash(),
+        "enemies": enemy_configs.ENEMIES,
+        "encounter_weights": encounter_configs.ENCOUNTER_WEIGHTS,
+        "difficulty_multiplier": encounter_configs.DIFFICULTY_MULTIPLIER,
+        "weapons": encounter_configs.WEAPONS,
+        "armors": encounter_configs.ARMORS,
+        "accessories": encounter_configs.ACCESSORIES,
+        "loot_tables": encounter_configs.LOOT_TABLES,
+        "blessings": encounter_configs.BLESSINGS,
+        "traps": encounter_configs.TRAPS,
+        "shop_stock": shop_stock,
+        "tavern_items": tavern_items,
+        "regions": {
+            config["name"]: config
+            for config in (region_configs.FOREST_CONFIG, region_configs.MOUNTAIN_CONFIG)
+        },
+        "quests": {quest.id: quest for quest in quests},
+        "stock_limits": item_configs.STOCK_LIMITS,
+        "restock_interval": item_configs.RESTOCK_INTERVAL,
+        "world_bosses": enemy_configs.WORLD_BOSSES,
+        # Indexes
+        "enemy_index": {
+            enemy["name"]: (area_id, position)
+            for area_id, enemies in enemy_configs.ENEMIES.items()
+            for position, enemy in enumerate(enemies)
+        },
+        "item_index": {
+            item.catalog_id: item
+            for items in list(shop_stock.values()) + [tavern_items]
+            for item in items
+        },
+        "loot_item_names": {
+            loot["name"]
+            for table in encounter_configs.LOOT_TABLES.values()
+            for loot in table if "name" in loot
+        }
+    }
+    validate_content(snapshot)
+    return snapshot
+
+def validate_content(snapshot):
+    """Raise ValueError listing every problem found in the content tables"""
+    problems = []
+
+    def check(condition, message):
+        if not condition:
+            problems.append(message)
+
+    for area_id, enemies in snapshot["enemies"].items():
+        check(enemies, f"{area_id} has no enemies")
+        for enemy in enemies:
+            for stat in ("health", "strength", "armour", "xp", "gold", "weight"):
+                check(isinstance(enemy.get(stat), int) and enemy[stat] >= 0, f"{enemy.get('name')} has a bad {stat}")
+            check(enemy.get("health", 0) > 0 and enemy.get("weight", 0) > 0, f"{enemy.get('name')} can never be fought")
+            group = enemy.get("group")
+            if group:
+                check(group.get("member"), f"{enemy.get('name')} group has no member name")
+                for stat in ("count", "health", "strength"):
+                    check(isinstance(group.get(stat), int) and group[stat] > 0, f"{enemy.get('name')} group has a bad {stat}")
+
+    for name, boss in snapshot["world_bosses"].items():
+        for stat in ("health", "strength", "armour", "xp", "gold", "xp_per_hit", "gold_per_hit", "min_level", "respawn"):
+            check(isinstance(boss.get(stat), int) and boss[stat] >= 0, f"world boss {name} has a bad {stat}")
+        check(boss.get("health", 0) > 0, f"world boss {name} has no health")
+
+    for encounter in snapshot["encounter_weights"]:
+        check(encounter["weight"] > 0, f"encounter {encounter['type']} has no weight")
+
+    for kind in ("weapons", "armors", "accessories"):
+        for area, templates in snapshot[kind].items():
+            for template in templates:
+                check(template["variance"] > 0, f"{template['name']} needs a positive variance")
+                check(template["difficulty"] in snapshot["difficulty_multiplier"], f"{template['name']} has unknown difficulty")
+                check(template.get("effect_type", "strength") in STATS, f"{template['name']} has unknown effect type")
+
+    for area, table in snapshot["loot_tables"].items():
+        for loot in table:
+            check(loot["weight"] > 0, f"{area} loot {loot['item']} has no weight")
+            if "effect_type" in loot:
+                check(loot["effect_type"] in STATS, f"{loot['name']} has unknown effect type")
+
+    for area, blessings in snapshot["blessings"].items():
+        for blessing in blessings:
+            if blessing["type"] != "heal":
+                check(blessing["type"] in STATS, f"{blessing['name']} has unknown type")
+                check(blessing["duration"] and blessing["duration"] > 0, f"{blessing['name']} needs a duration")
+
+    for area, traps in snapshot["traps"].items():
+        for trap in traps:
+            check(trap["damage"] > 0, f"{area} trap '{trap['text']}' does no damage")
+
+    shop_names = {item.name for items in snapshot["shop_stock"].values() for item in items}
+    for name, limit in snapshot["stock_limits"].items():
+        check(name in shop_names, f"stock limit for {name}, which the shop does not sell")
+        check(isinstance(limit, int) and limit > 0, f"{name} has a bad stock limit")
+    check(snapshot["restock_interval"] > 0, "the shop never restocks")
+
+    for item in snapshot["item_index"].values():
+        check(item.effect_type in STATS | {"xp"}, f"{item.name} has unknown effect type")
+
+    for name, config in snapshot["regions"].items():
+        for area, difficulty in config["areas"]:
+            check(f"{name}_{difficulty}" in snapshot["enemies"], f"{area} has no enemy table")
+            check(difficulty in config["area_messages"], f"{area} has no area message")
+
+    item_names = snapshot["loot_item_names"] | {item.name for item in snapshot["item_index"].values()}
+    for quest in snapshot["quests"].values():
+        requirements = quest.requirements
+        for enemy in requirements.get("enemies", {}):
+            check(enemy in snapshot["enemy_index"], f"quest {quest.id} targets unknown enemy {enemy}")
+        if "boss" in requirements:
+            check(requirements["boss"] in snapshot["enemy_index"], f"quest {quest.id} targets unknown boss")
+        for item in requirements.get("items", {}):
+            check(item in item_names, f"quest {quest.id} needs {item}, which never drops")
+        for area_id in requirements.get("areas", []):
+            check(area_id in snapshot["enemies"], f"quest {quest.id} lists unknown area {area_id}")
+
+    if problems:
+        raise ValueError("Invalid game content:\n" + "\n".join(problems))
+
+def load_snapshot(directory=SNAPSHOT_DIR):
+    """Load the snapshot for the current content, building it if missing or unreadable"""
+    path = os.path.join(directory, f"content-{content_hash()}.pkl")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+        pass  # missing, truncated or corrupt, build it
+
+    result = subprocess.run(
+        [sys.executable, "-m", "snapshot", os.path.abspath(directory)], cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode:
+        raise ValueError(result.stderr.strip())
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+def write_snapshot(directory=SNAPSHOT_DIR):
+    """Build the snapshot from the content modules of this process and store it"""
+    path = os.path.join(directory, f"content-{content_hash()}.pkl")
+    snapshot = build_snapshot()
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=5)
+    os.replace(temp_path, path)
+
+    # Snapshots for older content are never read again
+    for stale in glob.glob(os.path.join(directory, "content-*.pkl")):
+        if stale != path:
+            os.remove(stale)
+    return snapshot
+
+if __name__ == "__main__":
+    try:
+        write_snapshot(*sys.argv[1:])
+    except ValueError as error:
+        sys.exit(str(error))
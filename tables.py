@@ -0,0 +1,130 @@
+# tables.py
+# Enemy and equipment tables as struct-of-arrays NumPy columns for the
+# balance and simulation tools. The columns are exported once per content
+# hash next to the content snapshot and every worker process maps them
+# read-only, so a process pool shares one copy through the page cache.
+import functools
+import glob
+import json
+import os
+import shutil
+import numpy as np
+from snapshot import SNAPSHOT_DIR, content_hash, load_snapshot
+
+ENEMY_COLUMNS = ["health", "strength", "armour", "xp", "gold", "weight"]
+GROUP_COLUMNS = ["group_size", "member_health", "member_strength"]
+EQUIPMENT_COLUMNS = ["cost", "base_effect", "variance"]
+EQUIPMENT_KINDS = ["weapons", "armors", "accessories"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+EFFECT_TYPES = ["strength", "luck", "armour", "health"]
+KIND_EFFECTS = {"weapons": "strength", "armors": "armour"}  # accessories name their own
+
+def tables_dir(directory=SNAPSHOT_DIR):
+    return os.path.join(directory, f"tables-{content_hash()}")
+
+def export_tables(directory=SNAPSHOT_DIR):
+    """Write the current content as .npy columns plus a JSON index, returning the folder"""
+    target = tables_dir(directory)
+    if os.path.isdir(target):
+        return target
+
+    snapshot = load_snapshot(directory)
+    temp_dir = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(temp_dir, exist_ok=True)
+
+    # Enemies: rows grouped by area, with area_start[i]:area_start[i + 1] per area
+    areas = list(snapshot["enemies"])
+    enemies = [enemy for area_id in areas for enemy in snapshot["enemies"][area_id]]
+    area_start = np.cumsum([0] + [len(snapshot["enemies"][area_id]) for area_id in areas])
+    np.save(os.path.join(temp_dir, "enemy_area_start.npy"), area_start.astype(np.int32))
+    np.save(
+        os.path.join(temp_dir, "enemy_area.npy"),
+        np.repeat(np.arange(len(areas), dtype=np.int16), np.diff(area_start))
+    )
+    for column in ENEMY_COLUMNS:
+        np.save(os.path.join(temp_dir, f"enemy_{column}.npy"), np.array([enemy[column] for enemy in enemies], dtype=np.int32))
+    # Groups such as a wolf pack are fought member by member, single enemies are a group of one
+    groups = [enemy.get("group") or {"count": 1, "health": enemy["health"], "strength": enemy["strength"]} for enemy in enemies]
+    for column, stat in zip(GROUP_COLUMNS, ("count", "health", "strength")):
+        np.save(os.path.join(temp_dir, f"enemy_{column}.npy"), np.array([group[stat] for group in groups], dtype=np.int32))
+
+    # Equipment templates from chest loot
+    templates = []
+    for kind_code, kind in enumerate(EQUIPMENT_KINDS):
+        for region, region_templates in snapshot[kind].items():
+            for template in region_templates:
+                templates.append((kind_code, region, template))
+    regions = sorted({region for kind_code, region, template in templates})
+    np.save(os.path.join(temp_dir, "equipment_kind.npy"), np.array([kind for kind, region, template in templates], dtype=np.int8))
+    np.save(os.path.join(temp_dir, "equipment_region.npy"), np.array([regions.index(region) for kind, region, template in templates], dtype=np.int8))
+    np.save(
+        os.path.join(temp_dir, "equipment_difficulty.npy"),
+        np.array([DIFFICULTIES.index(template["difficulty"]) for kind, region, template in templates], dtype=np.int8)
+    )
+    np.save(
+        os.path.join(temp_dir, "equipment_effect.npy"),
+        np.array([
+            EFFECT_TYPES.index(template.get("effect_type") or KIND_EFFECTS[EQUIPMENT_KINDS[kind]])
+            for kind, region, template in templates
+        ], dtype=np.int8)
+    )
+    for column in EQUIPMENT_COLUMNS:
+        np.save(
+            os.path.join(temp_dir, f"equipment_{column}.npy"),
+            np.array([template[column] for kind, region, template in templates], dtype=np.int32)
+        )
+
+    with open(os.path.join(temp_dir, "index.json"), "w") as f:
+        json.dump({
+            "areas": areas,
+            "enemy_names": [enemy["name"] for enemy in enemies],
+            "regions": regions,
+            "equipment_names": [template["name"] for kind, region, template in templates]
+        }, f)
+
+    try:
+        os.rename(temp_dir, target)
+    except OSError:
+        # Another worker exported the same content first
+        shutil.rmtree(temp_dir)
+
+    # Tables for older content are never mapped again
+    for stale in glob.glob(os.path.join(directory, "tables-*")):
+        if stale != target and not stale.endswith(".tmp"):
+            shutil.rmtree(stale, ignore_errors=True)
+    return target
+
+@functools.lru_cache(maxsize=None)
+def load_tables(directory=SNAPSHOT_DIR):
+    """Memory-map the exported columns read-only, exporting them first if needed
+
+    Returns {"enemies": {...}, "equipment": {...}} where each value maps a
+    column name to an array and the index names to lists.
+    """
+    folder = export_tables(directory)
+    with open(os.path.join(folder, "index.json")) as f:
+        index = json.load(f)
+
+    def column(name):
+        return np.load(os.path.join(folder, f"{name}.npy"), mmap_mode="r")
+
+    enemies = {name: column(f"enemy_{name}") for name in ENEMY_COLUMNS + GROUP_COLUMNS + ["area", "area_start"]}
+    enemies["areas"] = index["areas"]
+    enemies["names"] = index["enemy_names"]
+    equipment = {name: column(f"equipment_{name}") for name in EQUIPMENT_COLUMNS + ["kind", "region", "difficulty", "effect"]}
+    equipment["regions"] = index["regions"]
+    equipment["names"] = index["equipment_names"]
+    return {"enemies": enemies, "equipment": equipment}
+
+def area_rows(tables, area_id):
+    """Slice of enemy rows that spawn in an area, e.g. "forest_easy" """
+    enemies = tables["enemies"]
+    area = enemies["areas"].index(area_id)
+    return slice(int(enemies["area_start"][area]), int(enemies["area_start"][area + 1]))
+
+def spawn_enemies(tables, area_id, count, rng=None):
+    """Row indices of count enemies drawn with the same weights as Enemy()"""
+    rng = rng or np.random.default_rng()
+    rows = area_rows(tables, area_id)
+    weights = np.asarray(tables["enemies"]["weight"][rows], dtype=np.float64)
+    return rows.start + rng.choice(len(weights), size=count, p=weights / weights.sum())
@@ -1,20 +1,17 @@
 import streamlit as st
-from utils import Item, warrior_profile
+from utils import warrior_profile
+from content import get_tavern_menu
+import copy
 import random
+from telemetry import emit, emit_gold
 
-def get_tavern_items():
-    return [
-        Item("Honey beer", 5, "health", -5, ":material/sports_bar:"),
-        Item("Lamb shank", 15, "health", 10, ":material/stockpot:"),
-        Item("Sunday roast", 30, "health", 25, ":material/stockpot:"),
-    ]
-
-tavern_items = get_tavern_items()
+tavern_items = get_tavern_menu()
 
 # Coin flip game logic
 def coin_flip_game(bet_amount, bet_choice):
     # Simulate coin flip (heads or tails)
     coin = random.choice(["heads", "tails"])
+    emit("coin_flip", bet=bet_amount, choice=bet_choice, coin=coin, won=bet_choice == coin)
     
     # Compare bet_choice with the result of the coin flip
     if bet_choice == coin:
@@ -49,7 +46,8 @@ if st.session_state.warrior:
                 if st.button("Buy", key=f"buy_{item.name}"):
                     if warrior.gold >= item.cost:
                         warrior.gold -= item.cost
-                        warrior.inventory.append(item)
+                        emit_gold("tavern", -item.cost, warrior)
+                        warrior.inventory.append(copy.copy(item))
                         st.toast(f"Bought {item.name}!")
                         st.session_state.combat_log.append(f"Bought {item.name}!")
                         st.rerun()
@@ -96,9 +94,11 @@ if st.session_state.warrior:
                         
                         if win:
                             warrior.gold += bet_amount
+                            emit_gold("bet", bet_amount, warrior)
                             st.success(f"You won! The coin landed on {coin_result}. You now have {warrior.gold} gold.")
                         else:
                             warrior.gold -= bet_amount
+                            emit_gold("bet", -bet_amount, warrior)
                             st.error(f"You lost! The coin landed on {coin_result}. You now have {warrior.gold} gold.")
                         
                         st.session_state.warrior = warrior
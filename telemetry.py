@@ -0,0 +1,99 @@
+# telemetry.py
+# Gameplay event stream for offline analysis. emit() only appends the event
+# to an in-memory batch, a background thread writes batches as NDJSON
+# (one JSON object per line) to telemetry/events-<start>-<pid>-<n>.ndjson
+# and starts a new file every ROTATE_BYTES. The script thread never waits
+# on disk: when the writer falls behind, new events are dropped and
+# counted instead. Like snapshot.py this module does not import streamlit.
+#
+#     pandas.read_json("telemetry/events-....ndjson", lines=True)
+import atexit
+import json
+import os
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TELEMETRY_DIR = os.path.join(ROOT, "telemetry")
+FLUSH_INTERVAL = 1.0  # seconds between batch writes
+ROTATE_BYTES = 32 * 1024 * 1024
+MAX_PENDING = 100_000  # events held in memory before new ones are dropped
+
+# Set WARRIORS_TELEMETRY=0 to turn the stream off, e.g. for benchmarks
+enabled = os.environ.get("WARRIORS_TELEMETRY", "1") != "0"
+
+_lock = threading.Lock()
+_write_lock = threading.Lock()  # held while writing, never by emit()
+_pending = []
+_dropped = 0
+_thread = None
+_file = None
+_file_index = 0
+_started = time.strftime("%Y%m%d-%H%M%S")
+
+def emit(event, **fields):
+    """Queue one gameplay event, e.g. emit("loot", item="gold", gold=25)"""
+    global _dropped, _thread
+    if not enabled:
+        return
+    with _lock:
+        if len(_pending) >= MAX_PENDING:
+            _dropped += 1
+            return
+        _pending.append((time.time(), event, fields))
+        if _thread is None:
+            _thread = threading.Thread(target=_write_loop, name="telemetry", daemon=True)
+            _thread.start()
+
+def emit_gold(source, amount, warrior):
+    """Gold gained (positive) or spent (negative) by a warrior, e.g. source="shop" """
+    emit("gold", source=source, amount=amount, level=warrior.level, warrior=warrior.name)
+
+def _write_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        flush_events()
+
+def flush_events():
+    """Write every queued event now"""
+    global _pending
+    with _lock:
+        batch, _pending = _pending, []
+    if not batch:
+        return
+    lines = "".join(
+        json.dumps({"t": round(t, 3), "event": event, **fields}, separators=(",", ":")) + "\n"
+        for t, event, fields in batch
+    )
+    with _write_lock:
+        output = _output()
+        output.write(lines)
+        output.flush()
+
+def _output():
+    """Current events file, rotated once it reaches ROTATE_BYTES (hold _write_lock)"""
+    global _file, _file_index
+    if _file is not None and _file.tell() >= ROTATE_BYTES:
+        _file.close()
+        _file = None
+        _file_index += 1
+    if _file is None:
+        os.makedirs(TELEMETRY_DIR, exist_ok=True)
+        _file = open(os.path.join(TELEMETRY_DIR, f"events-{_started}-{os.getpid()}-{_file_index}.ndjson"), "a")
+    return _file
+
+def event_files():
+    """Every events file written so far, oldest first"""
+    if not os.path.exists(TELEMETRY_DIR):
+        return []
+    return sorted(
+        (os.path.join(TELEMETRY_DIR, name) for name in os.listdir(TELEMETRY_DIR) if name.endswith(".ndjson")),
+        key=os.path.getmtime
+    )
+
+def get_telemetry_stats():
+    """Queued and dropped event counts of this process"""
+    with _lock:
+        return {"pending": len(_pending), "dropped": _dropped}
+
+atexit.register(flush_events)
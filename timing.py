@@ -0,0 +1,139 @@
+# timing.py
+# Lightweight per-rerun timing. Sections are timed with timed(), either as a
+# decorator or a context manager, and recorded into in-process histograms
+# shared by every session on this server. A background thread dumps the
+# histograms as JSON and Prometheus text once a minute, so the rerun being
+# timed never waits on disk, and the admin page dumps them on demand.
+import contextlib
+import json
+import os
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+METRICS_DIR = os.path.join(ROOT, "metrics")
+DUMP_INTERVAL = 60  # seconds
+
+# Upper bucket bounds in seconds, Prometheus style (the last bucket is +Inf)
+BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5]
+
+_lock = threading.Lock()
+_histograms = {}
+_thread = None
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        index = 0
+        while index < len(BUCKETS) and seconds > BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max
+
+def record(section, seconds):
+    """Add one duration to a section's histogram"""
+    global _thread
+    with _lock:
+        histogram = _histograms.get(section)
+        if histogram is None:
+            histogram = _histograms[section] = Histogram()
+        histogram.observe(seconds)
+        if _thread is None:
+            _thread = threading.Thread(target=_dump_loop, name="timing", daemon=True)
+            _thread.start()
+
+def _dump_loop():
+    while True:
+        time.sleep(DUMP_INTERVAL)
+        try:
+            dump_metrics()
+        except OSError:
+            pass  # disk full or directory gone, try again next time
+
+@contextlib.contextmanager
+def timed(section):
+    """Time a block or function under a section name
+
+    with timed("save_warrior"): ...
+    @timed("Region.render")
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        # st.rerun() and st.stop() end a section early, it still counts
+        record(section, time.perf_counter() - start)
+
+def get_metrics():
+    """Summary of every section, slowest total time first"""
+    with _lock:
+        rows = [
+            {
+                "section": section,
+                "count": histogram.count,
+                "total_ms": histogram.total * 1000,
+                "mean_ms": histogram.total / histogram.count * 1000,
+                "p50_ms": histogram.quantile(0.5) * 1000,
+                "p95_ms": histogram.quantile(0.95) * 1000,
+                "max_ms": histogram.max * 1000,
+                "buckets": list(histogram.counts)
+            }
+            for section, histogram in _histograms.items()
+        ]
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+def prometheus_text():
+    """Histograms in the Prometheus text exposition format"""
+    lines = [
+        "# HELP warriors_section_seconds Time spent in an instrumented section of a rerun",
+        "# TYPE warriors_section_seconds histogram"
+    ]
+    with _lock:
+        for section, histogram in sorted(_histograms.items()):
+            label = section.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ["+Inf"], histogram.counts):
+                cumulative += count
+                lines.append(f'warriors_section_seconds_bucket{{section="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'warriors_section_seconds_sum{{section="{label}"}} {histogram.total}')
+            lines.append(f'warriors_section_seconds_count{{section="{label}"}} {histogram.count}')
+    return "\n".join(lines) + "\n"
+
+def dump_metrics(directory=None):
+    """Write timings.json and timings.prom to METRICS_DIR or another directory, returning it"""
+    directory = directory or METRICS_DIR
+    os.makedirs(directory, exist_ok=True)
+    for name, text in (
+        ("timings.json", json.dumps({"pid": os.getpid(), "time": time.time(), "sections": get_metrics()}, indent=2)),
+        ("timings.prom", prometheus_text())
+    ):
+        path = os.path.join(directory, name)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    return directory
+
+def reset_metrics():
+    """Forget every recorded duration"""
+    with _lock:
+        _histograms.clear()
@@ -0,0 +1,44 @@
+# town_square.py
+# Chat and news shared by every warrior on the server, see shared_world.py.
+import streamlit as st
+import time
+from utils import warrior_profile
+from shared_world import feed_since, post
+
+REFRESH_SECONDS = 2  # how often an open page polls the feed
+SHOWN_ENTRIES = 50
+
+def format_entry(entry):
+    """One feed entry as a markdown line, e.g. "`14:02` **Moose**: hello" """
+    entry_id, t, kind, author, text = entry
+    stamp = time.strftime("%H:%M", time.localtime(t))
+    if kind == "chat":
+        return f"`{stamp}` **{author}**: {text}"
+    return f"`{stamp}` *{text}*"
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def display_feed():
+    """The newest feed entries first, as one markdown element"""
+    entries = feed_since()[-SHOWN_ENTRIES:]
+    if not entries:
+        st.write("*The square is quiet...*")
+        return
+    st.markdown("\n\n".join(format_entry(entry) for entry in reversed(entries)))
+
+warrior = st.session_state.get("warrior")
+if warrior:
+    with st.sidebar:
+        warrior_profile()
+
+st.subheader(":material/forum: Town square")
+st.markdown("*Warriors swap tales around the well while the town crier calls out the latest news.*")
+
+message = st.chat_input(
+    f"Say something, {warrior.name}..." if warrior else "Create a warrior to join the conversation",
+    disabled=not warrior
+)
+if message and message.strip():
+    post(message.strip(), kind="chat", author=warrior.name)
+    st.toast("Your words carry across the square.")
+
+display_feed()
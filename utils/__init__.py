@@ -1,4 +1,5 @@
 from .classes import Item
+from .classes import Inventory
 from .classes import Enemy
 from .classes import Warrior
 from .classes import Buff
@@ -1,6 +1,8 @@
 import random
 import streamlit as st
 from enum import Enum
+from counters import Counts
+from telemetry import emit
 
 class ItemType(Enum):
     CONSUMABLE = "consumable"
@@ -19,6 +21,138 @@ class Item:
         self.description = description
         self.equipped = False
 
+    @property
+    def catalog_id(self):
+        """Identifier shared by interchangeable copies of the same item"""
+        return f"{self.name}|{self.effect_type}|{self.effect_value}|{self.cost}"
+
+class Inventory:
+    """Consumables stacked by catalog id with counts, equipment keyed by item id"""
+    def __init__(self, items=()):
+        self._stacks = {}     # catalog id -> [item, count]
+        self._equipment = {}  # item id -> item
+        self._size = 0
+        self._next_id = 0
+        self.dirty = True     # changed since the last save, see autosave.py
+        self.add_many(items)
+
+    def key(self, item):
+        """Lookup key for an item: item id for equipment, catalog id for consumables"""
+        if item.item_type == ItemType.CONSUMABLE:
+            return item.catalog_id
+        return getattr(item, 'item_id', None)
+
+    def add(self, item, count=1):
+        """Add an item, stacking it onto identical consumables"""
+        self.dirty = True
+        if item.item_type == ItemType.CONSUMABLE:
+            stack = self._stacks.setdefault(item.catalog_id, [item, 0])
+            stack[1] += count
+            self._size += count
+            return
+        
+        # Give equipment an id unique within this inventory
+        item_id = getattr(item, 'item_id', None)
+        if item_id is None or self._equipment.get(item_id, item) is not item:
+            item_id = self._next_id
+            item.item_id = item_id
+        self._next_id = max(self._next_id, item_id + 1)
+        if item_id not in self._equipment:
+            self._equipment[item_id] = item
+            self._size += 1
+
+    append = add  # list-style alias used across the pages
+
+    def add_many(self, items):
+        """Add several items in one call"""
+        for item in items:
+            self.add(item)
+
+    def get(self, key):
+        """Return the item stored under a key, or None"""
+        if key in self._equipment:
+            return self._equipment[key]
+        stack = self._stacks.get(key)
+        return stack[0] if stack else None
+
+    def count(self, item):
+        """Number of copies of an item held"""
+        if item.item_type == ItemType.CONSUMABLE:
+            stack = self._stacks.get(item.catalog_id)
+            return stack[1] if stack else 0
+        return 1 if item in self else 0
+
+    def take(self, key, count=1):
+        """Remove up to count copies stored under a key and return how many were removed"""
+        self.dirty = True
+        if key in self._equipment:
+            del self._equipment[key]
+            self._size -= 1
+            return 1
+        stack = self._stacks.get(key)
+        if not stack:
+            return 0
+        taken = min(count, stack[1])
+        stack[1] -= taken
+        self._size -= taken
+        if stack[1] == 0:
+            del self._stacks[key]
+        return taken
+
+    def remove(self, item):
+        """Remove one copy of an item"""
+        if item not in self:
+            raise ValueError(f"{item.name} is not in the inventory")
+        self.take(self.key(item))
+
+    def remove_many(self, counts):
+        """Remove items given as a {key: count} mapping, returning {key: removed}"""
+        return {key: self.take(key, count) for key, count in counts.items()}
+
+    def stacks(self):
+        """(key, item, count) rows, equipment first then consumables"""
+        rows = [(item_id, item, 1) for item_id, item in self._equipment.items()]
+        rows.extend((key, item, count) for key, (item, count) in self._stacks.items())
+        return rows
+
+    def entries(self):
+        """Every stack and piece of equipment as {entry key: (item, count)}, for journal saves"""
+        entries = {f"e{item_id}": (item, 1) for item_id, item in self._equipment.items()}
+        entries.update((f"s{key}", (item, count)) for key, (item, count) in self._stacks.items())
+        return entries
+
+    def set_entry(self, entry_key, value):
+        """Replace one entry from entries() with an (item, count) pair, or drop it for None"""
+        if entry_key[0] == "e":
+            item_id = int(entry_key[1:])
+            self._size -= item_id in self._equipment
+            self._equipment.pop(item_id, None)
+            if value:
+                self._equipment[item_id] = value[0]
+                self._size += 1
+                self._next_id = max(self._next_id, item_id + 1)
+        else:
+            key = entry_key[1:]
+            stack = self._stacks.pop(key, None)
+            self._size -= stack[1] if stack else 0
+            if value:
+                self._stacks[key] = list(value)
+                self._size += value[1]
+
+    def __contains__(self, item):
+        if item.item_type == ItemType.CONSUMABLE:
+            return item.catalog_id in self._stacks
+        return self._equipment.get(getattr(item, 'item_id', None)) is item
+
+    def __iter__(self):
+        yield from self._equipment.values()
+        for item, count in self._stacks.values():
+            for _ in range(count):
+                yield item
+
+    def __len__(self):
+        return self._size
+
 class EquipmentSlots:
     def __init__(self):
         self.weapon = None
@@ -41,77 +175,8 @@ class EquipmentSlots:
 
 class Enemy:
     def __init__(self, area):
-        enemies = {
-        "forest_easy": [
-            {"name": "Forest Imp", "health": 35, "strength": 6, "armour": 1, "xp": 20, "gold": 35, "image": "imp.png", "weight": 25},  # Weakest, most common
-            {"name": "Goblin Scout", "health": 45, "strength": 7, "armour": 2, "xp": 25, "gold": 30, "image": "goblin.png", "weight": 20},
-            {"name": "Wolf", "health": 50, "strength": 8, "armour": 3, "xp": 30, "gold": 15, "image": "wolf.png", "weight": 15},
-            {"name": "Giant Spider", "health": 40, "strength": 12, "armour": 4, "xp": 35, "gold": 18, "image": "spider.png", "weight": 15},
-            {"name": "Hostile Hunter", "health": 55, "strength": 9, "armour": 4, "xp": 32, "gold": 28, "image": "hunter.png", "weight": 10},
-            {"name": "Bandit", "health": 60, "strength": 10, "armour": 5, "xp": 40, "gold": 25, "image": "bandit.png", "weight": 8},
-            {"name": "Wild Boar", "health": 55, "strength": 9, "armour": 6, "xp": 35, "gold": 20, "image": "boar.png", "weight": 5},
-            {"name": "Rabid Bear", "health": 65, "strength": 11, "armour": 8, "xp": 45, "gold": 22, "image": "bear.png", "weight": 2}  # Strongest, rarest
-        ],
-        "forest_medium": [
-            {"name": "Harpy Warrior", "health": 65, "strength": 18, "armour": 6, "xp": 52, "gold": 60, "image": "harpy.png", "weight": 20},
-            {"name": "Forest Witch", "health": 60, "strength": 20, "armour": 5, "xp": 65, "gold": 70, "image": "witch.png", "weight": 15},
-            {"name": "Werewolf", "health": 75, "strength": 16, "armour": 8, "xp": 60, "gold": 55, "image": "werewolf.png", "weight": 15},
-            {"name": "Dark Dwarf", "health": 70, "strength": 15, "armour": 15, "xp": 45, "gold": 50, "image": "dark_dwarf.png", "weight": 12},
-            {"name": "Bandit Chief", "health": 70, "strength": 17, "armour": 14, "xp": 56, "gold": 65, "image": "bandit_chief.png", "weight": 10},
-            {"name": "Dire Wolf Pack", "health": 85, "strength": 15, "armour": 7, "xp": 57, "gold": 52, "image": "dire_wolf.png", "weight": 10},
-            {"name": "Troll", "health": 80, "strength": 12, "armour": 12, "xp": 50, "gold": 40, "image": "troll.png", "weight": 8},
-            {"name": "Forest Ogre", "health": 90, "strength": 14, "armour": 10, "xp": 55, "gold": 45, "image": "ogre.png", "weight": 5},
-            {"name": "Shambling Mound", "health": 95, "strength": 14, "armour": 18, "xp": 54, "gold": 45, "image": "mound.png", "weight": 3},
-            {"name": "Corrupted Ent", "health": 100, "strength": 13, "armour": 20, "xp": 58, "gold": 48, "image": "ent.png", "weight": 2}
-        ],
-        "forest_hard": [
-            {"name": "Dark Elf Champion", "health": 85, "strength": 28, "armour": 16, "xp": 100, "gold": 150, "image": "dark_elf.png", "weight": 25},
-            {"name": "Demon Hunter", "health": 90, "strength": 25, "armour": 18, "xp": 90, "gold": 120, "image": "demon_hunter.png", "weight": 20},
-            {"name": "Corrupted Unicorn", "health": 110, "strength": 24, "armour": 15, "xp": 88, "gold": 130, "image": "unicorn.png", "weight": 15},
-            {"name": "Giant", "health": 120, "strength": 18, "armour": 20, "xp": 70, "gold": 80, "image": "giant.png", "weight": 12},
-            {"name": "Forest Hydra", "health": 130, "strength": 22, "armour": 22, "xp": 95, "gold": 110, "image": "hydra.png", "weight": 10},
-            {"name": "Elder Wyrm", "health": 140, "strength": 21, "armour": 28, "xp": 92, "gold": 140, "image": "wyrm.png", "weight": 8},
-            {"name": "Shadow Giant", "health": 160, "strength": 19, "armour": 24, "xp": 87, "gold": 95, "image": "shadow_giant.png", "weight": 5},
-            {"name": "Ancient Treant", "health": 150, "strength": 16, "armour": 30, "xp": 85, "gold": 90, "image": "treant.png", "weight": 3},
-            {"name": "Dragon", "health": 100, "strength": 20, "armour": 25, "xp": 80, "gold": 100, "image": "dragon.png", "weight": 2}
-        ],
-        "mountain_easy": [
-            {"name": "Frost Imp", "health": 65, "strength": 10, "armour": 2, "xp": 40, "gold": 45, "image": "mountains/imp.png", "weight": 25},
-            {"name": "Snow Wolf", "health": 75, "strength": 14, "armour": 4, "xp": 45, "gold": 35, "image": "mountains/wolf.png", "weight": 20},
-            {"name": "Ice Goblin", "health": 85, "strength": 11, "armour": 6, "xp": 48, "gold": 42, "image": "mountains/goblin.png", "weight": 15},
-            {"name": "Mountain Bandit", "health": 88, "strength": 14, "armour": 7, "xp": 54, "gold": 48, "image": "mountains/bandit.png", "weight": 15},
-            {"name": "Crystal Spider", "health": 70, "strength": 13, "armour": 8, "xp": 55, "gold": 38, "image": "mountains/spider.png", "weight": 10},
-            {"name": "Mountain Goat", "health": 80, "strength": 12, "armour": 5, "xp": 50, "gold": 30, "image": "mountains/goat.png", "weight": 8},
-            {"name": "Cave Dweller", "health": 95, "strength": 13, "armour": 10, "xp": 52, "gold": 36, "image": "mountains/dweller.png", "weight": 5},
-            {"name": "Rock Elemental", "health": 90, "strength": 15, "armour": 15, "xp": 60, "gold": 40, "image": "mountains/rock_elemental.png", "weight": 2}
-        ],
-        "mountain_medium": [
-            {"name": "Storm Harpy", "health": 95, "strength": 24, "armour": 8, "xp": 78, "gold": 75, "image": "harpy.png", "weight": 20},
-            {"name": "Ice Witch", "health": 90, "strength": 26, "armour": 10, "xp": 88, "gold": 85, "image": "witch.png", "weight": 15},
-            {"name": "Ice Troll", "health": 100, "strength": 20, "armour": 15, "xp": 75, "gold": 70, "image": "troll.png", "weight": 15},
-            {"name": "Avalanche Spirit", "health": 110, "strength": 23, "armour": 14, "xp": 84, "gold": 78, "image": "spirit.png", "weight": 12},
-            {"name": "Frost Giant", "health": 120, "strength": 18, "armour": 18, "xp": 80, "gold": 60, "image": "giant.png", "weight": 10},
-            {"name": "Mountain Ogre", "health": 150, "strength": 21, "armour": 16, "xp": 76, "gold": 72, "image": "ogre.png", "weight": 10},
-            {"name": "Yeti", "health": 130, "strength": 22, "armour": 12, "xp": 85, "gold": 65, "image": "yeti.png", "weight": 8},
-            {"name": "Frost Wyrm", "health": 140, "strength": 19, "armour": 20, "xp": 82, "gold": 68, "image": "wyrm.png", "weight": 5},
-            {"name": "Ice Drake", "health": 125, "strength": 25, "armour": 22, "xp": 90, "gold": 80, "image": "drake.png", "weight": 3},
-            {"name": "Crystal Golem", "health": 160, "strength": 20, "armour": 25, "xp": 86, "gold": 66, "image": "golem.png", "weight": 2}
-        ],
-        "mountain_hard": [
-            {"name": "Glacier Queen", "health": 170, "strength": 30, "armour": 25, "xp": 140, "gold": 180, "image": "queen.png", "weight": 20},
-            {"name": "Eternal Ice Elemental", "health": 185, "strength": 31, "armour": 28, "xp": 138, "gold": 170, "image": "ice_elemental.png", "weight": 15},
-            {"name": "Blizzard Demon", "health": 195, "strength": 32, "armour": 26, "xp": 150, "gold": 200, "image": "demon.png", "weight": 15},
-            {"name": "Elder Frost Wyrm", "health": 190, "strength": 29, "armour": 38, "xp": 135, "gold": 175, "image": "elder_wyrm.png", "weight": 12},
-            {"name": "Mountain Titan", "health": 180, "strength": 28, "armour": 30, "xp": 130, "gold": 160, "image": "titan.png", "weight": 10},
-            {"name": "Storm Giant King", "health": 220, "strength": 26, "armour": 32, "xp": 125, "gold": 165, "image": "giant_king.png", "weight": 8},
-            {"name": "Mountain Overlord", "health": 210, "strength": 27, "armour": 34, "xp": 145, "gold": 190, "image": "overlord.png", "weight": 8},
-            {"name": "Ancient Frost Giant", "health": 240, "strength": 28, "armour": 36, "xp": 142, "gold": 185, "image": "ancient_giant.png", "weight": 5},
-            {"name": "Crystal Behemoth", "health": 230, "strength": 24, "armour": 40, "xp": 128, "gold": 155, "image": "behemoth.png", "weight": 4},
-            {"name": "Ancient Dragon", "health": 200, "strength": 25, "armour": 35, "xp": 120, "gold": 150, "image": "ancient_dragon.png", "weight": 2},
-            {"name": "Mountain Dragon Lord", "health": 250, "strength": 35, "armour": 45, "xp": 160, "gold": 250, "image": "dragon_lord.png", "weight": 1}  # Ultimate boss, very rare
-        ]
-        }
-        area_enemies = enemies[area]
+        from content import get_enemy_tables  # The same snapshot tables the simulators read
+        area_enemies = get_enemy_tables()[area]
         # Calculate total weight
         total_weight = sum(enemy["weight"] for enemy in area_enemies)
         
@@ -135,6 +200,16 @@ class Enemy:
         self.xp = selected_enemy["xp"]
         self.gold = selected_enemy["gold"]
         self.image = selected_enemy["image"]
+        # Groups are fought member by member, see party_combat.py
+        group = selected_enemy.get("group")
+        if group:
+            self.member_name = group["member"]
+            self.member_strength = group["strength"]
+            self.members = [group["health"]] * group["count"]
+            self.health = sum(self.members)
+        else:
+            self.members = None
+        emit("enemy_spawned", area=area, enemy=self.name)
 
 class Buff:
     def __init__(self, name, stat, value, duration, icon):
@@ -153,8 +228,11 @@ class Warrior:
         self.level = 1
         self.experience = 0
         self.gold = 0
-        self.inventory = []
+        self.inventory = Inventory()
         self.experience_to_level = 100
+        self.kill_counts = Counts("kills")  # per enemy, see counters.py
+        self.loot_counts = Counts("loot")   # per chest loot entry
+        self.cause_of_death = None
         
         # Initialize equipment slots
         self.equipment = EquipmentSlots()
@@ -190,16 +268,45 @@ class Warrior:
         self.base_luck = self.luck
         self.base_armour = self.armour
         self.base_max_health = self.max_health
+
+    def __setattr__(self, name, value):
+        # Any change to a warrior needs saving, see autosave.py
+        self.__dict__[name] = value
+        self.__dict__["dirty"] = True
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Saves from before stacked inventories hold a plain list
+        if isinstance(self.inventory, list):
+            self.inventory = Inventory(self.inventory)
+        # Saves from before kill counts and the hall of fame
+        if "kill_counts" not in self.__dict__:
+            self.__dict__.update(kill_counts=Counts("kills"), loot_counts=Counts("loot"), cause_of_death=None)
+        self.mark_saved()
+
+    @property
+    def kills(self):
+        """Enemies killed in total"""
+        return self.kill_counts.total()
+
+    def needs_save(self):
+        """Whether the warrior or its inventory changed since the last save"""
+        return self.__dict__.get("dirty", True) or getattr(self.inventory, "dirty", True)
+
+    def mark_saved(self):
+        self.__dict__["dirty"] = False
+        self.inventory.dirty = False
     
-    def use_item(self, item_index):
-        """Use or equip an item from inventory"""
-        if 0 <= item_index < len(self.inventory):
-            item = self.inventory[item_index]
+    def use_item(self, item_key, notify=True):
+        """Use or equip an item from inventory, toasting the result if notify"""
+        item = self.inventory.get(item_key)
+        if item is not None:
             
             # Handle equipment items
             if hasattr(item, 'item_type') and item.item_type != ItemType.CONSUMABLE:
                 result = self.equip_item(item)
-                st.toast(f"Equipped {item.name}!")
+                if notify:
+                    st.toast(f"Equipped {item.name}!")
                 return result
             
             # Handle consumable items
@@ -239,11 +346,12 @@ class Warrior:
                 healing_message = f"Used {item.name}"
             
             # Only remove consumable items
-            self.inventory.pop(item_index)
-            st.toast(healing_message)
+            self.inventory.remove(item)
+            if notify:
+                st.toast(healing_message)
             return healing_message
         
-        return "Invalid item index!"
+        return "Invalid item!"
     
     def equip_item(self, item):
         """Equip an item in the appropriate slot"""
@@ -297,32 +405,37 @@ class Warrior:
     def update_stats(self):
         """Update total stats based on base stats, equipment, and buffs"""
         # Reset to base stats
-        self.strength = self.base_strength
-        self.luck = self.base_luck
-        self.armour = self.base_armour
-        self.max_health = self.base_max_health
+        strength = self.base_strength
+        luck = self.base_luck
+        armour = self.base_armour
+        max_health = self.base_max_health
         
         # Apply equipment bonuses
         if hasattr(self, 'equipment'):
             equipment_bonuses = self.equipment.get_total_bonuses()
-            self.strength += equipment_bonuses["strength"]
-            self.luck += equipment_bonuses["luck"]
-            self.armour += equipment_bonuses["armour"]
-            self.max_health += equipment_bonuses["health"]
+            strength += equipment_bonuses["strength"]
+            luck += equipment_bonuses["luck"]
+            armour += equipment_bonuses["armour"]
+            max_health += equipment_bonuses["health"]
         
         # Apply buffs
         for buff in self.active_buffs:
             if buff.stat == "strength":
-                self.strength += buff.value
+                strength += buff.value
             elif buff.stat == "luck":
-                self.luck += buff.value
+                luck += buff.value
             elif buff.stat == "armour":
-                self.armour += buff.value
+                armour += buff.value
             elif buff.stat == "health":
-                self.max_health += buff.value
+                max_health += buff.value
+        
+        # Totals are derived from saved state, so they are written without
+        # marking the warrior dirty
+        self.__dict__.update(strength=strength, luck=luck, armour=armour, max_health=max_health)
         
         # Ensure health doesn't exceed new max
-        self.health = min(self.health, self.max_health)
+        if self.health > max_health:
+            self.health = max_health
     
     def calculate_xp_needed(self):
         """Calculate XP needed for next level using exponential scaling"""
@@ -1,7 +1,9 @@
 import streamlit as st
 from utils import Enemy, ItemType
 from save_system import add_save_load_ui
-from quest_config import QuestStatus, QuestType
+from timing import timed
+
+INVENTORY_PAGE_SIZE = 8
 
 def celebrate():
     if st.button("Party time!"):
@@ -23,6 +25,26 @@ def handle_area_selection(area):
     st.session_state.current_enemy = Enemy(area)
     st.session_state.combat_log = []
 
+def paginate(rows, key, page_size=INVENTORY_PAGE_SIZE):
+    """Return the current page of rows and render prev/next controls if needed"""
+    page_count = max(1, -(-len(rows) // page_size))
+    page = min(st.session_state.get(key, 0), page_count - 1)
+    st.session_state[key] = page
+
+    if page_count > 1:
+        prev_col, label_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            st.button(":material/chevron_left:", key=f"{key}_prev", disabled=page == 0,
+                      on_click=lambda: st.session_state.update({key: page - 1}))
+        with label_col:
+            st.caption(f"Page {page + 1}/{page_count}")
+        with next_col:
+            st.button(":material/chevron_right:", key=f"{key}_next", disabled=page == page_count - 1,
+                      on_click=lambda: st.session_state.update({key: page + 1}))
+
+    return rows[page * page_size:(page + 1) * page_size]
+
+@timed("warrior_profile")
 def warrior_profile():
     warrior = st.session_state.warrior
     st.header(f"Warrior: {warrior.name}")
@@ -85,20 +107,21 @@ def warrior_profile():
     
     # Inventory Section
     st.subheader("🎒 Inventory")
-    for idx, item in enumerate(warrior.inventory):
+    for key, item, count in paginate(warrior.inventory.stacks(), "inventory_page"):
+        quantity = f" ×{count}" if count > 1 else ""
         cols = st.columns([3, 2])
         with cols[0]:
             if item.item_type != ItemType.CONSUMABLE:
-                st.write(f"{item.icon} {item.name} (+{item.effect_value} {item.effect_type})")
+                st.write(f"{item.icon} {item.name} (+{item.effect_value} {item.effect_type}){quantity}")
             else:
-                st.write(f"{item.icon} {item.name}")
+                st.write(f"{item.icon} {item.name}{quantity}")
         with cols[1]:
             if item.item_type == ItemType.CONSUMABLE:
                 button_text = "Use"
             else:
                 button_text = "Equip"
-            if st.button(button_text, key=f"use_{idx}"):
-                result = warrior.use_item(idx)
+            if st.button(button_text, key=f"use_{key}"):
+                result = warrior.use_item(key)
                 st.toast(result)
                 st.rerun()
     
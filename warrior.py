@@ -1,17 +1,14 @@
 import streamlit as st
 from utils import Warrior, init_session, warrior_profile
 from save_system import add_save_load_ui
-from quest_config import FOREST_QUESTS, MOUNTAIN_QUESTS, Quest, QuestType
-import copy
+from content import new_quest_log
 
 def create_warrior(name, build_type):
     st.session_state.warrior = Warrior(name, build_type)
-    # Reset and initialize quests with deep copies
-    st.session_state.quests = {}
-    # Add all available quests as deep copies
-    all_quests = FOREST_QUESTS + MOUNTAIN_QUESTS
-    for quest in all_quests:
-        st.session_state.quests[quest.id] = copy.deepcopy(quest)
+    # Reset quests with a fresh log over the shared catalog. Its quests are shallow
+    # copies with their own status and progress; requirements and rewards are
+    # the catalog's own objects and must never be changed
+    st.session_state.quests = new_quest_log()
 
 init_session()
 
@@ -36,5 +33,16 @@ else:
     st.markdown("*The cool morning breeze hits your face, you slowly open your eyes to find yourself standing in the centre of a small vilage.*")
     st.image("images/town.png", use_container_width=True)
 
+    with st.expander(f":material/military_tech: Trophies ({warrior.kills} kills)"):
+        kills_col, loot_col = st.columns(2)
+        with kills_col:
+            st.markdown("**Enemies slain**")
+            for name, count in sorted(warrior.kill_counts.items(), key=lambda row: -row[1]):
+                st.write(f"{name}: {count}")
+        with loot_col:
+            st.markdown("**Chest finds**")
+            for name, count in sorted(warrior.loot_counts.items(), key=lambda row: -row[1]):
+                st.write(f"{name.title()}: {count}")
+
     with st.sidebar:
         warrior_profile()
\ No newline at end of file
@@ -0,0 +1,99 @@
+# world_boss.py
+# World bosses share one health pool between every warrior on the server,
+# see shared_world.py. Each click on Attack is one exchange of blows.
+import streamlit as st
+import random
+import time
+from utils import warrior_profile, init_session
+from content import get_world_bosses
+from encounters import calculate_damage, calculate_critical_chance, dodge_attack, level_up_warrior
+from telemetry import emit_gold
+from shared_world import current, hit_boss, post
+from adventure_log import display_adventure_log
+
+REFRESH_SECONDS = 2  # how often an open page polls the shared health
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def display_boss_status(name, config):
+    """Shared health and top damage dealers, refreshed without rerunning the page"""
+    boss = current().bosses[name]
+    if boss["health"] > 0:
+        st.progress(boss["health"] / config["health"], text=f"{boss['health']} / {config['health']} HP")
+    else:
+        back_in = max(0, int(boss["died_at"] + config["respawn"] - time.time()))
+        st.progress(0.0, text=f"Slain! The {name} returns in {back_in // 60}m {back_in % 60}s")
+    top = sorted(boss["damage"].items(), key=lambda entry: -entry[1])[:5]
+    if top:
+        st.caption("Most damage this time: " + ", ".join(f"{warrior} ({damage})" for warrior, damage in top))
+
+def attack(name, config):
+    """One exchange of blows: the warrior hits the shared health, the boss hits back"""
+    warrior = st.session_state.warrior
+    log = st.session_state.combat_log
+
+    damage, blocked, original = calculate_damage(warrior.strength, config["armour"])
+    if random.random() < calculate_critical_chance(warrior.luck):
+        damage *= 2
+    dealt, slain = hit_boss(name, warrior.name, damage)
+    if not dealt:
+        st.toast(f"The {name} has already fallen.", icon=":material/feedback:")
+        return
+    log.append(f"🗡️ You strike the {name} for {dealt} damage!")
+
+    xp, gold = config["xp_per_hit"], config["gold_per_hit"]
+    if slain:
+        xp += config["xp"]
+        gold += config["gold"]
+        log.append(f"🏆 Your blow fells the {name}!")
+        post(f"⚔️ {warrior.name} dealt the killing blow to the {name}!")
+    warrior.experience += xp
+    warrior.gold += gold
+    emit_gold("boss", gold, warrior)
+    log.append(f"💰 Gained {gold} gold and {xp} experience!")
+    if warrior.experience >= warrior.calculate_xp_needed():
+        level_up_warrior()
+
+    if not slain:
+        if dodge_attack(warrior.luck, config["strength"]):
+            log.append(f"💨 {warrior.name} dodges the attack!")
+        else:
+            hit, blocked, original = calculate_damage(config["strength"], warrior.armour)
+            warrior.health -= hit
+            log.append(f"💥 The {name} hits you for {hit} damage!")
+            if warrior.health <= 0:
+                warrior.status = "Dead"
+                warrior.cause_of_death = f"Slain by the {name}"
+
+def main():
+    init_session()
+    warrior = st.session_state.warrior
+    if not warrior:
+        st.error("You need to create a warrior first in order to face a world boss.")
+        st.warning("Go back to the character creation page and create your warrior.")
+        return
+
+    with st.sidebar:
+        warrior_profile()
+
+    st.markdown("*Warriors from every corner of the land gather to bring down a foe none could face alone.*")
+    for name, config in get_world_bosses().items():
+        st.subheader(name)
+        info_col, image_col = st.columns([3, 2])
+        with info_col:
+            st.write(f"Strength: {config['strength']} · Armour: {config['armour']}")
+            st.caption(
+                f"Every hit pays {config['gold_per_hit']} gold and {config['xp_per_hit']} XP, "
+                f"the killing blow another {config['gold']} gold and {config['xp']} XP."
+            )
+            display_boss_status(name, config)
+            if warrior.level < config["min_level"]:
+                st.warning(f"Reach level {config['min_level']} before facing the {name}.")
+            elif st.button("Attack", key=f"attack_{name}", disabled=current().bosses[name]["health"] <= 0):
+                attack(name, config)
+                st.rerun()
+        with image_col:
+            st.image(f"images/monsters/{config['image']}", use_container_width=True)
+
+    display_adventure_log()
+
+main()